@@ -0,0 +1,45 @@
+"""add unlogged pcs_points_results_staging table for COPY bulk loads
+
+Revision ID: 3c1f0e2a9b7d
+Revises:
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3c1f0e2a9b7d"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pcs_points_results_staging",
+        sa.Column("batch_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("race_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("classification_type", sa.String(), nullable=False),
+        sa.Column("stage_number", sa.Integer(), nullable=True),
+        sa.Column("rider_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("team_name", sa.String(), nullable=True),
+        sa.Column("points", sa.Integer(), nullable=True),
+        prefixes=["UNLOGGED"],
+    )
+    op.create_index(
+        "ix_pcs_points_results_staging_batch_id",
+        "pcs_points_results_staging",
+        ["batch_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_pcs_points_results_staging_batch_id",
+        table_name="pcs_points_results_staging",
+    )
+    op.drop_table("pcs_points_results_staging")
@@ -0,0 +1,135 @@
+"""partition pcs_points_results by race year
+
+Revision ID: 4f9a1c7e2d60
+Revises: e2c6a8f1d3b5
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4f9a1c7e2d60"
+down_revision = "e2c6a8f1d3b5"
+branch_labels = None
+depends_on = None
+
+_OLD_TABLE = "pcs_points_results_unpartitioned"
+
+# One partition per season that already has races; the race repositories
+# create the partitions of later seasons when they first save one.
+_CREATE_SEASON_PARTITIONS = """
+DO $$
+DECLARE
+    season integer;
+BEGIN
+    FOR season IN SELECT DISTINCT year FROM races LOOP
+        EXECUTE format(
+            'CREATE TABLE pcs_points_results_y%s PARTITION OF pcs_points_results '
+            'FOR VALUES FROM (%s) TO (%s)',
+            season, season, season + 1
+        );
+    END LOOP;
+END $$
+"""
+
+
+def _columns(partitioned: bool):
+    return [
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        *([sa.Column("year", sa.Integer(), nullable=False)] if partitioned else []),
+        sa.Column("classification_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("rider_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("team_name", sa.String(), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["classification_id"], ["classifications.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["rider_id"], ["riders.id"]),
+    ]
+
+
+def _rename_old_table() -> None:
+    # The old constraints' indexes would clash with the new table's names.
+    op.rename_table("pcs_points_results", _OLD_TABLE)
+    op.execute(
+        f"ALTER TABLE {_OLD_TABLE} RENAME CONSTRAINT pcs_points_results_pkey "
+        f"TO {_OLD_TABLE}_pkey"
+    )
+    op.execute(
+        f"ALTER TABLE {_OLD_TABLE} RENAME CONSTRAINT "
+        f"uq_result_per_rider_per_classification TO uq_{_OLD_TABLE}"
+    )
+
+
+def upgrade() -> None:
+    _rename_old_table()
+    op.create_table(
+        "pcs_points_results",
+        *_columns(partitioned=True),
+        sa.PrimaryKeyConstraint("id", "year"),
+        sa.UniqueConstraint(
+            "classification_id",
+            "rider_id",
+            "year",
+            name="uq_result_per_rider_per_classification",
+        ),
+        postgresql_partition_by="RANGE (year)",
+    )
+    op.create_index(
+        "ix_pcs_points_results_rider_year",
+        "pcs_points_results",
+        ["rider_id", "year"],
+        postgresql_include=["points", "classification_id"],
+    )
+    op.execute(_CREATE_SEASON_PARTITIONS)
+    op.execute(f"""
+        INSERT INTO pcs_points_results
+            (id, year, classification_id, rider_id, team_name, points,
+             created_at, updated_at)
+        SELECT r.id, ra.year, r.classification_id, r.rider_id, r.team_name,
+               r.points, r.created_at, r.updated_at
+        FROM {_OLD_TABLE} r
+        JOIN classifications c ON c.id = r.classification_id
+        JOIN races ra ON ra.id = c.race_id
+        """)
+    op.drop_table(_OLD_TABLE)
+    op.execute("ANALYZE pcs_points_results")
+
+
+def downgrade() -> None:
+    _rename_old_table()
+    op.create_table(
+        "pcs_points_results",
+        *_columns(partitioned=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "classification_id",
+            "rider_id",
+            name="uq_result_per_rider_per_classification",
+        ),
+    )
+    op.execute(f"""
+        INSERT INTO pcs_points_results
+            (id, classification_id, rider_id, team_name, points,
+             created_at, updated_at)
+        SELECT id, classification_id, rider_id, team_name, points,
+               created_at, updated_at
+        FROM {_OLD_TABLE}
+        """)
+    # Dropping the partitioned table drops its partitions too.
+    op.drop_table(_OLD_TABLE)
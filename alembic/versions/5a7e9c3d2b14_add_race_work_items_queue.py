@@ -0,0 +1,65 @@
+"""add race_work_items work queue table
+
+Revision ID: 5a7e9c3d2b14
+Revises: 8d4b2f6c1e90
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5a7e9c3d2b14"
+down_revision = "8d4b2f6c1e90"
+branch_labels = None
+depends_on = None
+
+work_item_status_enum = postgresql.ENUM(
+    "QUEUED", "LEASED", "DONE", "FAILED", name="work_item_status_enum"
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "race_work_items",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("race_pcs_id", sa.String(), nullable=False),
+        sa.Column(
+            "race_type",
+            postgresql.ENUM(name="race_type_enum", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("status", work_item_status_enum, nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("leased_by", sa.String(), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("race_pcs_id"),
+    )
+    op.create_index(
+        "ix_race_work_items_status_lease",
+        "race_work_items",
+        ["status", "lease_expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_race_work_items_status_lease", table_name="race_work_items")
+    op.drop_table("race_work_items")
+    work_item_status_enum.drop(op.get_bind(), checkfirst=False)
@@ -0,0 +1,78 @@
+"""add scrape_jobs and scrape_job_races journal tables
+
+Revision ID: 8d4b2f6c1e90
+Revises: 3c1f0e2a9b7d
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8d4b2f6c1e90"
+down_revision = "3c1f0e2a9b7d"
+branch_labels = None
+depends_on = None
+
+scrape_job_status_enum = postgresql.ENUM(
+    "RUNNING", "FINISHED", name="scrape_job_status_enum"
+)
+scrape_item_status_enum = postgresql.ENUM(
+    "PENDING", "DONE", "FAILED", name="scrape_item_status_enum"
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scrape_jobs",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("status", scrape_job_status_enum, nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_scrape_jobs_year", "scrape_jobs", ["year"])
+    op.create_table(
+        "scrape_job_races",
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("race_pcs_id", sa.String(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column(
+            "race_type",
+            postgresql.ENUM(name="race_type_enum", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("status", scrape_item_status_enum, nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["job_id"], ["scrape_jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id", "race_pcs_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scrape_job_races")
+    op.drop_index("ix_scrape_jobs_year", table_name="scrape_jobs")
+    op.drop_table("scrape_jobs")
+    scrape_item_status_enum.drop(op.get_bind(), checkfirst=False)
+    scrape_job_status_enum.drop(op.get_bind(), checkfirst=False)
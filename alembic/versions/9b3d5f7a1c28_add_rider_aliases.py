@@ -0,0 +1,45 @@
+"""add rider_aliases table
+
+Revision ID: 9b3d5f7a1c28
+Revises: 4f9a1c7e2d60
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b3d5f7a1c28"
+down_revision = "4f9a1c7e2d60"
+branch_labels = None
+depends_on = None
+
+alias_source_enum = postgresql.ENUM("AUTO", "MANUAL", name="alias_source_enum")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rider_aliases",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("team", sa.String(), server_default="", nullable=False),
+        sa.Column("rider_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("source", alias_source_enum, nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["rider_id"], ["riders.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("name", "team"),
+    )
+    op.create_index("ix_rider_aliases_rider_id", "rider_aliases", ["rider_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rider_aliases_rider_id", table_name="rider_aliases")
+    op.drop_table("rider_aliases")
+    alias_source_enum.drop(op.get_bind(), checkfirst=False)
@@ -0,0 +1,29 @@
+"""add content_hash to classifications
+
+Revision ID: b7e1d4a9c2f3
+Revises: 5a7e9c3d2b14
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7e1d4a9c2f3"
+down_revision = "5a7e9c3d2b14"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nullable: classifications written before this column get a hash the
+    # next time they are saved.
+    op.add_column(
+        "classifications", sa.Column("content_hash", sa.String(64), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("classifications", "content_hash")
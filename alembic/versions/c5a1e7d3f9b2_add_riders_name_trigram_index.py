@@ -0,0 +1,60 @@
+"""add pg_trgm index on normalised rider names
+
+Revision ID: c5a1e7d3f9b2
+Revises: 9b3d5f7a1c28
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+import unicodedata
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision = "c5a1e7d3f9b2"
+down_revision = "9b3d5f7a1c28"
+branch_labels = None
+depends_on = None
+
+
+def _normalize(name: str) -> str:
+    # Frozen copy of rider_alias.normalize_alias, which the repository uses.
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.lower().split())
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column("riders", sa.Column("name_normalized", sa.String(), nullable=True))
+
+    if context.is_offline_mode():
+        # No rows to read while generating SQL; keep the accents.
+        op.execute("UPDATE riders SET name_normalized = lower(name)")
+    else:
+        bind = op.get_bind()
+        riders = bind.execute(sa.text("SELECT id, name FROM riders")).fetchall()
+        if riders:
+            bind.execute(
+                sa.text(
+                    "UPDATE riders SET name_normalized = :normalized WHERE id = :id"
+                ),
+                [{"id": r.id, "normalized": _normalize(r.name)} for r in riders],
+            )
+
+    op.alter_column("riders", "name_normalized", nullable=False)
+    op.create_index(
+        "ix_riders_name_normalized_trgm",
+        "riders",
+        ["name_normalized"],
+        postgresql_using="gin",
+        postgresql_ops={"name_normalized": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_riders_name_normalized_trgm", table_name="riders")
+    op.drop_column("riders", "name_normalized")
+    # pg_trgm is left installed: other objects may have come to use it.
@@ -0,0 +1,53 @@
+"""add rider_season_points rollup table
+
+Revision ID: e2c6a8f1d3b5
+Revises: b7e1d4a9c2f3
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e2c6a8f1d3b5"
+down_revision = "b7e1d4a9c2f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rider_season_points",
+        sa.Column("rider_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column(
+            "race_type",
+            postgresql.ENUM(name="race_type_enum", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("total_points", sa.Integer(), nullable=False),
+        sa.Column("result_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["rider_id"], ["riders.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("rider_id", "year", "race_type"),
+    )
+    # Backfill from the results already stored; from here on the race
+    # repositories keep the rollup up to date.
+    op.execute("""
+        INSERT INTO rider_season_points
+            (rider_id, year, race_type, total_points, result_count)
+        SELECT r.rider_id, ra.year, ra.type, SUM(r.points), COUNT(*)
+        FROM pcs_points_results r
+        JOIN classifications c ON c.id = r.classification_id
+        JOIN races ra ON ra.id = c.race_id
+        GROUP BY r.rider_id, ra.year, ra.type
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table("rider_season_points")
@@ -0,0 +1,122 @@
+"""
+INSERT vs. COPY results loading against a real PostgreSQL database.
+
+Saves the same synthetic stage races with ``PostgresRaceRepository`` and
+``PostgresCopyRaceRepository`` and reports result rows written per second.
+Needs ``DATABASE_URL`` pointing at a database initialised with ``db-init``;
+the benchmark races are deleted afterwards.
+
+Usage: python benchmarks/bench_results_loader.py [--races 20] [--stages 21]
+       [--riders 180]
+"""
+
+import argparse
+import logging
+import time
+from typing import List
+
+from sqlalchemy import delete, text
+
+from procycling_scraper.scraping.domain.entities.classification import (
+    Classification,
+    ClassificationType,
+)
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+from procycling_scraper.scraping.domain.value_objects.result_line import ResultLine
+from procycling_scraper.scraping.infrastructure.database.partitions import (
+    results_partition_name,
+)
+from procycling_scraper.scraping.infrastructure.database.schema import (
+    engine,
+    races_table,
+    rider_season_points_table,
+)
+from procycling_scraper.scraping.infrastructure.repositories.postgres_copy_race_repository import (
+    PostgresCopyRaceRepository,
+)
+from procycling_scraper.scraping.infrastructure.repositories.postgres_race_repository import (
+    PostgresRaceRepository,
+)
+from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
+    PostgresRiderRepository,
+)
+
+YEAR = 1900
+
+
+def build_races(prefix: str, races: int, stages: int, riders: List[Rider]):
+    built = []
+    for r in range(races):
+        race = Race(
+            pcs_id=f"race/bench-{prefix}-{r}/{YEAR}",
+            name=f"Bench {prefix} {r}",
+            year=YEAR,
+            race_type=RaceType.STAGE_RACE,
+        )
+        for stage in range(1, stages + 1):
+            race.add_classification(
+                Classification(
+                    ClassificationType.STAGE,
+                    [
+                        ResultLine(rider.pcs_id, "Bench Team", len(riders) - i)
+                        for i, rider in enumerate(riders)
+                    ],
+                    stage,
+                )
+            )
+        race.add_classification(
+            Classification(
+                ClassificationType.GENERAL,
+                [ResultLine(rider.pcs_id, "Bench Team", 1) for rider in riders],
+            )
+        )
+        built.append(race)
+    return built
+
+
+def run(repo, races: List[Race], rider_id_map) -> float:
+    started = time.perf_counter()
+    for race in races:
+        repo.save(race, rider_id_map)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--races", type=int, default=20)
+    parser.add_argument("--stages", type=int, default=21)
+    parser.add_argument("--riders", type=int, default=180)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    riders = [
+        Rider(pcs_id=f"rider/bench-{i}", name=f"Bench Rider {i}")
+        for i in range(args.riders)
+    ]
+    rider_id_map = PostgresRiderRepository(engine).save_many(riders)
+    rows = args.races * (args.stages + 1) * args.riders
+
+    loaders = [
+        ("insert", PostgresRaceRepository(engine)),
+        ("copy", PostgresCopyRaceRepository(engine)),
+    ]
+    try:
+        for name, repo in loaders:
+            races = build_races(name, args.races, args.stages, riders)
+            elapsed = run(repo, races, rider_id_map)
+            print(f"{name + ':':<8s}{elapsed:7.2f}s {rows / elapsed:10.0f} rows/s")
+    finally:
+        # Classifications and results go with their races (ON DELETE CASCADE).
+        with engine.connect() as conn:
+            conn.execute(delete(races_table).where(races_table.c.year == YEAR))
+            conn.execute(
+                delete(rider_season_points_table).where(
+                    rider_season_points_table.c.year == YEAR
+                )
+            )
+            conn.execute(text(f"DROP TABLE IF EXISTS {results_partition_name(YEAR)}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+BeautifulSoup tree parsing vs. the lxml results table extractor.
+
+Builds a stage page the size of a real PCS one (a visible results tab
+followed by hidden GC, points, KOM, youth and teams tabs, a long race nav
+and footer) and times both ways of pulling the point-scoring rows out of it.
+
+Usage: python benchmarks/bench_results_table_parsing.py [--riders 176]
+       [--repeat 50]
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from bs4 import BeautifulSoup, Tag
+
+from procycling_scraper.scraping.infrastructure.scrapers.results_table_extractor import (
+    ResultRow,
+    extract_result_rows,
+)
+
+HEADERS = ["Rnk", "GC", "Timelag", "BIB", "H2H", "Specialty", "Rider", "Age", "Team"]
+HEADERS += ["UCI", "Pnt", "", "Time"]
+TABS = ["Stage", "GC", "Points", "KOM", "Youth", "Teams"]
+
+
+def build_page(riders: int) -> str:
+    tabs = "".join(
+        _tab(riders, hidden=n > 0, points_offset=n) for n in range(len(TABS))
+    )
+    nav = "".join(
+        f'<li><a href="race/tour-de-france/2024/stage-{n}">Stage {n}</a></li>'
+        for n in range(1, 22)
+    )
+    footer = "".join(
+        f'<li><a href="race/other-race-{n}/2024">Other race {n}</a></li>'
+        for n in range(400)
+    )
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+  <title>Tour de France 2024 Stage 1 results</title>
+  <script>window.dataLayer = [{{"page": "race"}}];</script>
+  <style>.resTab .hide {{ display: none; }}</style>
+</head>
+<body>
+  <div class="page-title"><h1>2024 Tour de France</h1></div>
+  <ul class="racenav">{nav}</ul>
+  <ul class="restabs">{''.join(f"<li><a>{t}</a></li>" for t in TABS)}</ul>
+  {tabs}
+  <footer><ul>{footer}</ul></footer>
+</body>
+</html>"""
+
+
+def _tab(riders: int, hidden: bool, points_offset: int) -> str:
+    head = "".join(f"<th>{h}</th>" for h in HEADERS)
+    rows = "".join(_row(n, points_offset) for n in range(1, riders + 1))
+    css = "resTab hide" if hidden else "resTab"
+    return (
+        f'<div class="{css}"><table class="results basic moblist10">'
+        f"<thead><tr>{head}</tr></thead><tbody>{rows}</tbody></table></div>"
+    )
+
+
+def _row(n: int, points_offset: int) -> str:
+    points = max(0, 200 - 4 * n + points_offset)
+    return (
+        f"<tr><td>{n}</td><td>{n}</td><td>+{n}s</td><td>{n + 10}</td>"
+        f'<td><span class="h2h"></span></td><td class="sp">Sprint</td>'
+        f'<td><span class="flag be"></span> <a href="rider/rider-{n}">'
+        f"RIDER {n} Name</a></td><td>{20 + n % 15}</td>"
+        f'<td><a href="team/team-{n % 22}-2024">Team {n % 22}</a></td>'
+        f'<td>{n % 60}</td><td>{points or ""}</td><td><span>0:00</span></td>'
+        f'<td class="time">4:12:0{n % 10}<span class="hide">,,</span></td></tr>'
+    )
+
+
+def soup_rows(html: str) -> List[ResultRow]:
+    """The previous parsing path: a full soup, then a CSS select."""
+    table = BeautifulSoup(html, "lxml").select_one(
+        "div.resTab:not(.hide) table.results"
+    )
+    assert isinstance(table, Tag)
+    headers = [th.text.strip() for th in table.find("thead").find_all("th")]
+    rider, team, points = (headers.index(h) for h in ("Rider", "Team", "Pnt"))
+    rows = []
+    for tr in table.find("tbody").find_all("tr"):
+        cells = tr.find_all("td")
+        text = cells[points].text.strip()
+        value = int(text.split()[0]) if text else 0
+        link = cells[rider].find("a")
+        if value > 0 and link is not None:
+            rows.append(
+                ResultRow(
+                    link["href"], link.text.strip(), cells[team].text.strip(), value
+                )
+            )
+    return rows
+
+
+def timed(parse: Callable[[str], List[ResultRow]], html: str, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse(html)
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--riders", type=int, default=176)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    html = build_page(args.riders)
+    expected = soup_rows(html)
+    assert extract_result_rows(html) == expected, "extractor diverged from soup"
+
+    soup_time = timed(soup_rows, html, args.repeat)
+    lxml_time = timed(extract_result_rows, html, args.repeat)
+    print(f"page: {len(html) / 1024:.0f} KiB, scoring rows: {len(expected)}")
+    print(f"{'beautifulsoup:':<17s}{soup_time * 1000:7.2f} ms/page")
+    print(f"{'lxml extractor:':<17s}{lxml_time * 1000:7.2f} ms/page")
+    print(f"{'speedup:':<17s}{soup_time / lxml_time:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Indexed vs. full-scan rider matching.
+
+Matches a fantasy roster against a synthetic riders table, once with a full
+``thefuzz.process.extractOne`` scan per name (the matcher before the index)
+and once with ``RiderMatchingService.find_scored_matches``, checks that both
+give the same scores and reports the time of each, and for how many names
+the two picked different riders tied on the top score. Then matches the
+roster with the team of every name, the service knowing the recent
+teams of the active riders, and reports how many matches differ from the
+full scan.
+
+Usage: python benchmarks/bench_rider_matching.py [--riders 15000]
+       [--roster 180] [--teams 50] [--seed 7]
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Optional, Set
+from uuid import UUID, uuid4
+
+from thefuzz import process
+
+from procycling_scraper.analysis.domain.rider_matching_service import (
+    RiderMatchingService,
+)
+from procycling_scraper.analysis.domain.rider_name_matcher import ScoredMatch
+from procycling_scraper.scraping.domain.entities.rider import Rider
+
+FIRST_NAMES = (
+    "Tadej Jonas Remco Primož Wout Mathieu Julian Egan Adam Simon Tom Mads "
+    "João Juan Ayuso Carlos Enric Marc Pello Mikel Richard Nairo Sepp Ben "
+    "Thibaut David Romain Arnaud Benoît Filippo Giulio Vincenzo Alberto "
+    "Alejandro Iván Óscar Jasper Dylan Biniam Søren Magnus Kasper Tobias "
+    "Aleksandr Jai Michael Luke Caleb Ethan Neilson Lenny Stefan Marc"
+).split()
+LAST_NAMES = (
+    "Pogačar Vingegaard Evenepoel Roglič Van Aert Van der Poel Alaphilippe "
+    "Bernal Yates Pidcock Pedersen Almeida Ayuso Rodríguez Mas Landa Carapaz "
+    "Quintana Kuss Healy Pinot Gaudu Bardet Démare Ganna Ciccone Nibali "
+    "Contador Valverde Sosa Philipsen Groenewegen Girmay Kragh Andersen Cort "
+    "Asgreen Foss Vlasov Hindley Matthews Plapp Hayter Küng Martínez López "
+    "García Fernández González Sánchez Pérez Gómez Díaz Moreno Jiménez"
+).split()
+SPONSORS = (
+    "Astana Bahrain Cofidis Decathlon Groupama Ineos Intermarché Israel "
+    "Jayco Lidl Lotto Movistar Picnic Soudal Tudor Uno-X Visma Arkéa Alpecin "
+    "Bora Caja Burgos Kern Polti Kometa Q36.5 TotalEnergies Euskaltel Flanders "
+    "Bingoal Corratec Novo Nordisk Human Powered Solution Tech Baloise Trek"
+).split()
+RIDERS_PER_TEAM = 30
+
+
+def build_riders(count: int, rng: random.Random) -> List[Rider]:
+    riders = []
+    for i in range(count):
+        first = rng.choice(FIRST_NAMES)
+        last = " ".join(rng.sample(LAST_NAMES, rng.choice((1, 1, 2))))
+        # PCS lists riders as "LAST First"; the suffix keeps names unique.
+        name = f"{last.upper()} {first}{'' if i < len(FIRST_NAMES) else i}"
+        riders.append(Rider(pcs_id=f"rider/{i}", name=name, id=uuid4()))
+    return riders
+
+
+def build_teams(
+    riders: List[Rider], count: int, rng: random.Random
+) -> Dict[UUID, Set[str]]:
+    """Recent teams of the riders still racing, RIDERS_PER_TEAM per team."""
+    names = set()
+    while len(names) < count:
+        names.add(" ".join(rng.sample(SPONSORS, 2)) + " Team")
+    active = rng.sample(riders, count * RIDERS_PER_TEAM)
+    return {
+        rider.id: {team}
+        for team, start in zip(sorted(names), range(0, len(active), RIDERS_PER_TEAM))
+        for rider in active[start : start + RIDERS_PER_TEAM]
+    }
+
+
+def fantasy_name(rider: Rider, rng: random.Random) -> str:
+    """The name as a fantasy game might spell it."""
+    words = rider.name.split()
+    last = [w for w in words if w.isupper()]
+    first = [w for w in words if not w.isupper()]
+    name = " ".join(first + [w.title() for w in last])
+    if rng.random() < 0.3:
+        position = rng.randrange(1, len(name) - 1)
+        name = name[:position] + name[position + 1 :]
+    return name
+
+
+def full_scan(riders: List[Rider], names: List[str], cutoff: int):
+    choices = {r.name.lower(): r for r in riders}
+    matches: List[Optional[ScoredMatch]] = []
+    for name in names:
+        result = process.extractOne(name.lower(), choices.keys())
+        matches.append(
+            (choices[result[0]], result[1]) if result and result[1] >= cutoff else None
+        )
+    return matches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--riders", type=int, default=15000)
+    parser.add_argument("--roster", type=int, default=180)
+    parser.add_argument("--teams", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    riders = build_riders(args.riders, rng)
+    rider_teams = build_teams(riders, args.teams, rng)
+    by_id = {rider.id: rider for rider in riders}
+    # Fantasy games price the riders racing now.
+    picked = rng.sample(sorted(rider_teams, key=str), args.roster)
+    roster = [fantasy_name(by_id[rider_id], rng) for rider_id in picked]
+    teams = [next(iter(rider_teams[rider_id])).upper() for rider_id in picked]
+    roster += ["Unknown Neopro", "Somebody Else"]
+    teams += ["Unknown Team", teams[0]]
+
+    started = time.perf_counter()
+    expected_scored = full_scan(riders, roster, cutoff=85)
+    scan_s = time.perf_counter() - started
+    expected = [m[0] if m else None for m in expected_scored]
+
+    started = time.perf_counter()
+    service = RiderMatchingService(riders, score_cutoff=85)
+    build_s = time.perf_counter() - started
+    started = time.perf_counter()
+    scored = service.find_scored_matches(roster)
+    match_s = time.perf_counter() - started
+    matches = [m[0] if m else None for m in scored]
+
+    team_service = RiderMatchingService(
+        riders, score_cutoff=85, rider_teams=rider_teams
+    )
+    started = time.perf_counter()
+    team_matches = team_service.find_best_matches(roster, teams)
+    team_s = time.perf_counter() - started
+
+    score_differences = sum(
+        1
+        for a, b in zip(expected_scored, scored)
+        if (a[1] if a else None) != (b[1] if b else None)
+    )
+    differences = sum(1 for a, b in zip(expected, matches) if a is not b)
+    team_differences = sum(1 for a, b in zip(expected, team_matches) if a is not b)
+    # Where the team changed the answer, the rider the roster was built from.
+    team_right = sum(
+        1
+        for rider_id, a, b in zip(picked, expected, team_matches)
+        if a is not b and b is not None and b.id == rider_id
+    )
+    matched = sum(1 for m in matches if m is not None)
+    print(f"riders: {args.riders}  roster: {len(roster)}  matched: {matched}")
+    print(f"full scan:     {scan_s:7.3f}s")
+    print(f"index build:   {build_s:7.3f}s (once per rider list)")
+    print(f"indexed match: {match_s:7.3f}s  ({scan_s / match_s:.0f}x faster)")
+    print(f"different scores:  {score_differences}")
+    print(f"different riders:  {differences} (tied on the top score)")
+    print(f"team match:    {team_s:7.3f}s  ({scan_s / team_s:.0f}x faster)")
+    print(
+        f"different matches: {team_differences} "
+        f"({team_right} of them the rider the roster name was made from)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Serial vs. concurrent ``ScrapeYearUseCase`` against a local fake PCS site.
+
+Usage: python benchmarks/bench_scrape_year_concurrency.py [--concurrency 8]
+       [--page-concurrency 4] [--parse-workers 4] [--pipeline]
+
+With ``--pipeline`` the concurrent run uses the staged pipeline with
+``--concurrency`` fetchers instead of one thread per race.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+
+from in_memory_repositories import InMemoryRaceRepository, InMemoryRiderRepository
+from pcs_fake_site import FakePcsSite, summarise
+
+from procycling_scraper.scraping.application.race_pipeline import PipelineConfig
+from procycling_scraper.scraping.application.scrape_year_use_case import (
+    ScrapeYearUseCase,
+)
+from procycling_scraper.scraping.infrastructure.http.http_client import HttpClient
+from procycling_scraper.scraping.infrastructure.scrapers.procyclingstats_race_data_scraper import (
+    ProCyclingStatsRaceDataScraper,
+)
+from procycling_scraper.scraping.infrastructure.scrapers.procyclingstats_race_list_scraper import (
+    ProCyclingStatsRaceListScraper,
+)
+
+
+def run(
+    site: FakePcsSite,
+    concurrency: int,
+    page_concurrency: int,
+    parse_executor: Optional[Executor] = None,
+    pipeline: Optional[PipelineConfig] = None,
+):
+    race_repo, rider_repo = InMemoryRaceRepository(), InMemoryRiderRepository()
+    http_client = HttpClient(pool_size=concurrency * page_concurrency)
+    use_case = ScrapeYearUseCase(
+        race_list_scraper=ProCyclingStatsRaceListScraper(
+            base_url=site.base_url, http_client=http_client
+        ),
+        race_data_scraper=ProCyclingStatsRaceDataScraper(
+            base_url=site.base_url,
+            max_parallel_pages=page_concurrency,
+            http_client=http_client,
+            parse_executor=parse_executor,
+        ),
+        race_repository=race_repo,
+        rider_repository=rider_repo,
+        concurrency=concurrency,
+        pipeline=pipeline,
+    )
+    started = time.perf_counter()
+    use_case.execute(site.year)
+    return time.perf_counter() - started, summarise(race_repo, rider_repo)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--page-concurrency", type=int, default=1)
+    parser.add_argument("--parse-workers", type=int, default=0)
+    parser.add_argument("--pipeline", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with FakePcsSite(latency=args.latency) as site:
+        serial_time, serial_state = run(site, 1, 1)
+        parse_pool = (
+            ProcessPoolExecutor(
+                max_workers=args.parse_workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+            if args.parse_workers
+            else None
+        )
+        try:
+            concurrent_time, concurrent_state = run(
+                site,
+                args.concurrency,
+                args.page_concurrency,
+                parse_pool,
+                PipelineConfig(fetchers=args.concurrency) if args.pipeline else None,
+            )
+        finally:
+            if parse_pool:
+                parse_pool.shutdown()
+
+    assert serial_state == concurrent_state, "concurrent run diverged from serial"
+    print(f"races: {len(serial_state['races'])}, riders: {len(serial_state['riders'])}")
+    print(f"{'serial:':<17s}{serial_time:6.2f}s")
+    label = f"concurrency={args.concurrency}/{args.page_concurrency}"
+    if args.parse_workers:
+        label += f" parse={args.parse_workers}"
+    if args.pipeline:
+        label += " pipeline"
+    print(f"{label + ':':<17s}{concurrent_time:6.2f}s")
+    print(f"{'speedup:':<17s}{serial_time / concurrent_time:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Scalar vs. batch value scores of a roster.
+
+Scores a roster from synthetic results, once with
+``ValueScoreCalculator.calculate`` per rider and once with a single
+``ValueScoreCalculator.calculate_roster`` call over columnar arrays, checks
+that both give exactly the same totals, value scores and raw points, and
+reports the best time of each over a few repeats. The batch time is shown
+with and without turning the result objects into arrays.
+
+Usage: python benchmarks/bench_value_score.py [--results 10000]
+       [--riders 200] [--repeat 5] [--seed 7]
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+from uuid import UUID
+
+import numpy as np
+
+from procycling_scraper.analysis.application.dto.analysis_dtos import RiderResultDTO
+from procycling_scraper.analysis.domain.value_score_calculator import (
+    RACE_TYPE_CODES,
+    ValueScoreCalculator,
+)
+from procycling_scraper.scraping.domain.entities.race import RaceType
+
+CURRENT_YEAR = 2025
+
+
+def best_of(repeat: int, run: Callable[[], object]) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--results", type=int, default=10000)
+    parser.add_argument("--riders", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    prices = [rng.randrange(40, 300) for _ in range(args.riders)]
+    rider_ids = [UUID(int=rng.getrandbits(128)) for _ in range(args.riders)]
+    positions = {rider_id: r for r, rider_id in enumerate(rider_ids)}
+    results = [
+        RiderResultDTO(
+            rider_id=rider_ids[rng.randrange(args.riders)],
+            points=rng.randrange(1, 400),
+            year=CURRENT_YEAR - rng.randrange(0, 6),
+            race_type=rng.choice(list(RaceType)),
+        )
+        for _ in range(args.results)
+    ]
+    by_rider: Dict[int, List[RiderResultDTO]] = {r: [] for r in range(args.riders)}
+    for result in results:
+        by_rider[positions[result.rider_id]].append(result)
+    calc = ValueScoreCalculator()
+
+    def scalar():
+        return [
+            calc.calculate(by_rider[r], prices[r], RaceType.ONE_DAY, CURRENT_YEAR)
+            for r in range(args.riders)
+        ]
+
+    def columns():
+        return (
+            np.array([positions[r.rider_id] for r in results]),
+            np.array([r.points for r in results]),
+            np.array([r.year for r in results]),
+            np.array([RACE_TYPE_CODES[r.race_type] for r in results]),
+            np.array(prices),
+        )
+
+    arrays = columns()
+
+    def batch():
+        return calc.calculate_roster(*arrays, RaceType.ONE_DAY, CURRENT_YEAR)
+
+    expected = scalar()
+    scores = batch()
+    differences = sum(
+        1
+        for r, (total, value) in enumerate(expected)
+        if scores.total_weighted_points[r] != total
+        or scores.value_scores[r] != value
+        or scores.one_day_points[r]
+        != sum(x.points for x in by_rider[r] if x.race_type == RaceType.ONE_DAY)
+    )
+
+    scalar_s = best_of(args.repeat, scalar)
+    batch_s = best_of(args.repeat, batch)
+    columns_s = best_of(args.repeat, columns)
+    print(f"results: {args.results}  riders: {args.riders}")
+    print(f"scalar:            {scalar_s * 1000:8.2f}ms")
+    print(
+        f"batch:             {batch_s * 1000:8.2f}ms  "
+        f"({scalar_s / batch_s:.0f}x faster)"
+    )
+    print(
+        f"batch + columns:   {(batch_s + columns_s) * 1000:8.2f}ms  "
+        f"({scalar_s / (batch_s + columns_s):.1f}x faster)"
+    )
+    print(f"riders with different scores: {differences}")
+
+
+if __name__ == "__main__":
+    main()
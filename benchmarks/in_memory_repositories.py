@@ -0,0 +1,42 @@
+"""Thread-safe in-memory repositories so benchmarks measure scraping, not SQL."""
+
+import sys
+import threading
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, Optional
+from uuid import UUID
+
+from procycling_scraper.scraping.domain.entities.race import Race
+from procycling_scraper.scraping.domain.repositories.race_repository import (
+    RaceRepository,
+)
+
+# The rider repository is the one the tests use.
+sys.path.append(str(Path(__file__).resolve().parents[1] / "tests"))
+from in_memory_rider_repository import InMemoryRiderRepository  # noqa: E402
+
+__all__ = ["InMemoryRaceRepository", "InMemoryRiderRepository"]
+
+
+class InMemoryRaceRepository(RaceRepository):
+    def __init__(self):
+        self.races: Dict[str, Race] = {}
+        self._lock = threading.Lock()
+
+    def save(self, race: Race, rider_id_map: Optional[Dict[str, UUID]] = None) -> None:
+        # Merges into the stored race like the Postgres repositories, so that
+        # races saved one classification at a time (pipeline mode) add up.
+        with self._lock:
+            stored = self.races.get(race.pcs_id)
+            if stored is None:
+                self.races[race.pcs_id] = replace(
+                    race, classifications=list(race.classifications)
+                )
+                return
+            for classification in race.classifications:
+                stored.add_classification(classification)
+
+    def find_by_pcs_id(self, pcs_id: str) -> Optional[Race]:
+        with self._lock:
+            return self.races.get(pcs_id)
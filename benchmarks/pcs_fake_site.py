@@ -0,0 +1,171 @@
+"""
+A small, deterministic imitation of procyclingstats.com served over local HTTP.
+
+It renders just enough markup for the race list and race data scrapers: the
+season race tables, one-day result pages, stage race GC pages with the
+classification select menu and the individual stage/points/KOM tables. Every
+response is delayed by ``latency`` seconds to mimic the real site.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.infrastructure.scrapers.procyclingstats_race_list_scraper import (
+    ProCyclingStatsRaceListScraper,
+)
+
+CIRCUIT_IDS = ProCyclingStatsRaceListScraper.CIRCUIT_IDS
+
+
+class FakePcsSite:
+    def __init__(
+        self,
+        year: int = 2024,
+        one_day_races: int = 20,
+        stage_races: int = 6,
+        stages: int = 8,
+        riders_per_table: int = 25,
+        latency: float = 0.05,
+    ):
+        self.year = year
+        self.stages = stages
+        self.riders_per_table = riders_per_table
+        self.latency = latency
+        self.races: List[Tuple[str, RaceType]] = [
+            (f"one-day-{i}", RaceType.ONE_DAY) for i in range(one_day_races)
+        ] + [(f"stage-race-{i}", RaceType.STAGE_RACE) for i in range(stage_races)]
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None, "site is not running"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "FakePcsSite":
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, body = site.render(self.path)
+                encoded = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def render(self, raw_path: str) -> Tuple[int, str]:
+        with self._lock:
+            self.request_count += 1
+        time.sleep(self.latency)
+        url = urlparse(raw_path)
+        if url.path == "/races.php":
+            circuit = parse_qs(url.query).get("circuit", [""])[0]
+            return 200, self._race_list_page(circuit)
+        parts = url.path.strip("/").split("/")
+        if len(parts) != 4 or parts[0] != "race":
+            return 404, ""
+        _, slug, _, page = parts
+        if page == "result":
+            return 200, self._page(f"{self.year} {slug}", self._table(slug, page))
+        if page == "gc":
+            return 200, self._page(
+                f"{self.year} {slug}", self._select_nav(slug) + self._table(slug, page)
+            )
+        return 200, self._page(None, self._table(slug, page))
+
+    def _race_list_page(self, circuit: str) -> str:
+        rows = []
+        for index, (slug, race_type) in enumerate(self.races):
+            if CIRCUIT_IDS[index % len(CIRCUIT_IDS)] != circuit:
+                continue
+            suffix, race_class = (
+                ("gc", "2.UWT")
+                if race_type == RaceType.STAGE_RACE
+                else ("result", "1.UWT")
+            )
+            rows.append(
+                f'<tr><td><a href="race/{slug}/{self.year}/{suffix}">{slug}</a></td>'
+                f"<td>{race_class}</td></tr>"
+            )
+        return self._page(
+            None,
+            '<table class="basic"><thead><tr><th>Race</th><th>Class</th></tr></thead>'
+            f"<tbody>{''.join(rows)}</tbody></table>",
+        )
+
+    def _select_nav(self, slug: str) -> str:
+        base = f"race/{slug}/{self.year}"
+        options = [
+            f'<option value="{base}/stage-{n}">Stage {n}</option>'
+            for n in range(1, self.stages + 1)
+        ]
+        options += [
+            f'<option value="{base}/points">Points classification</option>',
+            f'<option value="{base}/kom">Mountains classification</option>',
+            f'<option value="{base}/gc">Final GC</option>',
+        ]
+        return (
+            '<div class="selectNav"><a>PREV</a><a>NEXT</a>'
+            f"<select>{''.join(options)}</select></div>"
+        )
+
+    def _table(self, slug: str, page: str) -> str:
+        seed = sum(map(ord, slug + page))
+        rows = []
+        for position in range(self.riders_per_table):
+            rider = (seed + position * 7) % 400
+            points = max(self.riders_per_table - position, 0) * 3
+            rows.append(
+                f"<tr><td>{position + 1}</td>"
+                f'<td><a href="rider/rider-{rider}">Rider {rider}</a></td>'
+                f"<td>Team {rider % 18}</td><td>{points}</td></tr>"
+            )
+        return (
+            '<div class="resTab"><table class="results"><thead><tr>'
+            "<th>Rnk</th><th>Rider</th><th>Team</th><th>Pnt</th>"
+            f"</tr></thead><tbody>{''.join(rows)}</tbody></table></div>"
+        )
+
+    @staticmethod
+    def _page(title: Optional[str], content: str) -> str:
+        heading = f"<h1>{title}</h1>" if title else ""
+        return f"<html><body>{heading}{content}</body></html>"
+
+
+def summarise(race_repository, rider_repository) -> Dict[str, object]:
+    """Reduces the in-memory repositories to a comparable snapshot."""
+    races = {
+        pcs_id: sorted(
+            (
+                c.classification_type.value,
+                c.stage_number or 0,
+                tuple(
+                    sorted((r.rider_pcs_id, r.team_name, r.points) for r in c.results)
+                ),
+            )
+            for c in race.classifications
+        )
+        for pcs_id, race in race_repository.races.items()
+    }
+    return {"races": races, "riders": sorted(rider_repository.riders)}
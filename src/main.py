@@ -1,19 +1,66 @@
 import logging
-from contextlib import redirect_stdout
-from typing import Optional
+import multiprocessing
+import os
+import signal
+import socket
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stdout
+from dataclasses import asdict
+from enum import Enum
+from typing import Callable, ContextManager, List, Optional
 
 import typer
 
+from alembic import command
+from alembic.config import Config
+from procycling_scraper.analysis.domain.rider_alias import (
+    AliasSource,
+    RiderAlias,
+    normalize_alias,
+)
+from procycling_scraper.scraping.application.race_pipeline import PipelineConfig
+from procycling_scraper.scraping.application.race_worker_use_case import (
+    RaceWorkerUseCase,
+)
+from procycling_scraper.scraping.application.scrape_progress import ScrapeProgress
+from procycling_scraper.scraping.application.scrape_race_use_case import (
+    ScrapeRaceUseCase,
+)
 from procycling_scraper.scraping.application.scrape_year_use_case import (
     ScrapeYearUseCase,
 )
 from procycling_scraper.scraping.infrastructure.database.schema import engine, metadata
+from procycling_scraper.scraping.infrastructure.http.http_client import HttpClient
+from procycling_scraper.scraping.infrastructure.http.page_archive import (
+    ArchiveReplaySession,
+    PageArchive,
+    PageArchiveWriter,
+)
+from procycling_scraper.scraping.infrastructure.http.page_cache import PageCache
+from procycling_scraper.scraping.infrastructure.http.rate_limiter import (
+    AdaptiveRateLimiter,
+)
+from procycling_scraper.scraping.infrastructure.repositories.postgres_copy_race_repository import (
+    PostgresCopyRaceRepository,
+)
 from procycling_scraper.scraping.infrastructure.repositories.postgres_race_repository import (
     PostgresRaceRepository,
 )
+from procycling_scraper.scraping.infrastructure.repositories.postgres_race_work_queue import (
+    PostgresRaceWorkQueue,
+)
+from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_alias_repository import (
+    PostgresRiderAliasRepository,
+)
 from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
     PostgresRiderRepository,
 )
+from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_season_points import (
+    PostgresRiderSeasonPoints,
+)
+from procycling_scraper.scraping.infrastructure.repositories.postgres_scrape_job_repository import (
+    PostgresScrapeJobRepository,
+)
 from procycling_scraper.scraping.infrastructure.scrapers.procyclingstats_race_data_scraper import (
     ProCyclingStatsRaceDataScraper,
 )
@@ -28,6 +75,97 @@ setup_logging()
 
 logger = logging.getLogger(__name__)
 
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(__file__)), "alembic.ini")
+
+
+class ResultsLoader(str, Enum):
+    insert = "insert"
+    copy = "copy"
+
+
+# Options shared by the scraping commands, defined once so that their
+# defaults and help stay the same everywhere.
+CONCURRENCY_OPTION = typer.Option(
+    1,
+    "--concurrency",
+    "-c",
+    min=1,
+    help="Number of races to scrape and persist concurrently.",
+)
+PAGE_CONCURRENCY_OPTION = typer.Option(
+    1,
+    "--page-concurrency",
+    min=1,
+    help="Number of classification pages fetched in parallel per race.",
+)
+PARSE_WORKERS_OPTION = typer.Option(
+    None,
+    "--parse-workers",
+    min=0,
+    help="Processes that parse fetched pages (default: one per CPU core; "
+    "0 parses them in the fetching threads).",
+)
+CACHE_DIR_OPTION = typer.Option(
+    ".pcs_cache",
+    "--cache-dir",
+    envvar="PCS_CACHE_DIR",
+    help="Directory of the on-disk page cache.",
+)
+NO_CACHE_OPTION = typer.Option(
+    False, "--no-cache", help="Fetch every page from the network."
+)
+MAX_RATE_OPTION = typer.Option(
+    8.0,
+    "--max-rate",
+    min=0.2,
+    envvar="PCS_MAX_RATE",
+    help="Ceiling of the adaptive request rate per host (requests/second).",
+)
+RATE_STATE_DIR_OPTION = typer.Option(
+    None,
+    "--rate-state-dir",
+    envvar="PCS_RATE_STATE_DIR",
+    help="Directory through which processes on this machine share the rate limit.",
+)
+RECORD_DIR_OPTION = typer.Option(
+    None,
+    "--record-dir",
+    envvar="PCS_RECORD_DIR",
+    help="Also record every fetched page into WARC archives in this directory, "
+    "for `reparse`.",
+)
+CACHE_MAX_MB_OPTION = typer.Option(
+    2048, "--cache-max-mb", min=1, help="Size limit of the page cache in MiB."
+)
+INCREMENTAL_OPTION = typer.Option(
+    False,
+    "--incremental",
+    help="Skip finished races already in the database and fetch only new stages.",
+)
+LOADER_OPTION = typer.Option(
+    ResultsLoader.insert,
+    "--loader",
+    help="How results are written: per-classification INSERTs or COPY bulk load.",
+)
+PIPELINE_OPTION = typer.Option(
+    False,
+    "--pipeline",
+    help="Fetch, parse and persist in separate stages connected by bounded "
+    "queues, writing each classification as it is parsed.",
+)
+FETCHERS_OPTION = typer.Option(
+    4, "--fetchers", min=1, help="Pipeline threads fetching pages."
+)
+PARSERS_OPTION = typer.Option(
+    2, "--parsers", min=1, help="Pipeline threads parsing pages."
+)
+PERSISTERS_OPTION = typer.Option(
+    2, "--persisters", min=1, help="Pipeline threads writing to the database."
+)
+QUEUE_SIZE_OPTION = typer.Option(
+    64, "--queue-size", min=1, help="Capacity of each queue between stages."
+)
+
 
 @app.command()
 def scrape_year(
@@ -35,41 +173,539 @@ def scrape_year(
     output_file: Optional[str] = typer.Option(
         None, "--output-file", "-o", help="Redirect output to a file."
     ),
+    concurrency: int = CONCURRENCY_OPTION,
+    page_concurrency: int = PAGE_CONCURRENCY_OPTION,
+    parse_workers: Optional[int] = PARSE_WORKERS_OPTION,
+    cache_dir: str = CACHE_DIR_OPTION,
+    no_cache: bool = NO_CACHE_OPTION,
+    max_rate: float = MAX_RATE_OPTION,
+    rate_state_dir: Optional[str] = RATE_STATE_DIR_OPTION,
+    record_dir: Optional[str] = RECORD_DIR_OPTION,
+    cache_max_mb: int = CACHE_MAX_MB_OPTION,
+    incremental: bool = INCREMENTAL_OPTION,
+    loader: ResultsLoader = LOADER_OPTION,
+    pipeline: bool = PIPELINE_OPTION,
+    fetchers: int = FETCHERS_OPTION,
+    parsers: int = PARSERS_OPTION,
+    persisters: int = PERSISTERS_OPTION,
+    queue_size: int = QUEUE_SIZE_OPTION,
 ):
     """
     Scrapes all race data for a specific YEAR and saves it to the database.
+
+    Progress is journaled per race: if a previous run for YEAR was interrupted,
+    it is resumed with the races it had not reached yet.
     """
     typer.echo(f"Initializing scraping process for the year {year}...")
 
-    if output_file:
-        typer.echo(f"Output will be redirected to: {output_file}")
-        with open(output_file, "w", encoding="utf-8") as f:
-            with redirect_stdout(f):
-                _run_use_case(year)
-    else:
-        _run_use_case(year)
+    cache = (
+        None if no_cache else PageCache(cache_dir, max_bytes=cache_max_mb * 1024 * 1024)
+    )
+    rate_limiter = _build_rate_limiter(max_rate, rate_state_dir)
+    archive = _build_archive(record_dir)
+    race_repository = _build_race_repository(loader)
+    run_args = (year, concurrency, page_concurrency, cache, incremental)
+    pipeline_config = (
+        PipelineConfig(fetchers, parsers, persisters, queue_size) if pipeline else None
+    )
+
+    with _build_parse_pool(parse_workers) as parse_pool:
+        deps = (race_repository, rate_limiter, parse_pool, pipeline_config, archive)
+        if output_file:
+            typer.echo(f"Output will be redirected to: {output_file}")
+            with open(output_file, "w", encoding="utf-8") as f:
+                with redirect_stdout(f):
+                    _run_use_case(*run_args, *deps)
+        else:
+            _run_use_case(*run_args, *deps)
+    _log_rate_limiter_metrics(rate_limiter)
+    _log_write_stats(race_repository)
 
     typer.echo(f"Process for year {year} finished.")
 
 
-def _run_use_case(year: int):
+@app.command()
+def scrape_range(
+    start: int = typer.Argument(..., help="The first year to scrape."),
+    end: int = typer.Argument(..., help="The last year to scrape (inclusive)."),
+    concurrency: int = CONCURRENCY_OPTION,
+    page_concurrency: int = PAGE_CONCURRENCY_OPTION,
+    parse_workers: Optional[int] = PARSE_WORKERS_OPTION,
+    cache_dir: str = CACHE_DIR_OPTION,
+    no_cache: bool = NO_CACHE_OPTION,
+    max_rate: float = MAX_RATE_OPTION,
+    rate_state_dir: Optional[str] = RATE_STATE_DIR_OPTION,
+    record_dir: Optional[str] = RECORD_DIR_OPTION,
+    cache_max_mb: int = CACHE_MAX_MB_OPTION,
+    incremental: bool = INCREMENTAL_OPTION,
+    loader: ResultsLoader = LOADER_OPTION,
+    pipeline: bool = PIPELINE_OPTION,
+    fetchers: int = FETCHERS_OPTION,
+    parsers: int = PARSERS_OPTION,
+    persisters: int = PERSISTERS_OPTION,
+    queue_size: int = QUEUE_SIZE_OPTION,
+):
+    """
+    Scrapes every season from START to END (inclusive) as a single run.
+
+    The race lists of all seasons are fetched concurrently and their races
+    share one worker pool, HTTP client, rate limit and database pool. Each
+    season is journaled like `scrape-year`, so an interrupted range resumes
+    where it stopped. Progress and an ETA are reported as races complete.
+    """
+    if end < start:
+        raise typer.BadParameter("END must not be before START.")
+    years = list(range(start, end + 1))
+    typer.echo(f"Initializing scraping process for the years {start}-{end}...")
+
+    cache = (
+        None if no_cache else PageCache(cache_dir, max_bytes=cache_max_mb * 1024 * 1024)
+    )
+    rate_limiter = _build_rate_limiter(max_rate, rate_state_dir)
+    race_repository = _build_race_repository(loader)
+    with _build_parse_pool(parse_workers) as parse_pool:
+        use_case = _build_use_case(
+            concurrency,
+            page_concurrency,
+            cache,
+            incremental,
+            race_repository,
+            rate_limiter,
+            parse_pool,
+            (
+                PipelineConfig(fetchers, parsers, persisters, queue_size)
+                if pipeline
+                else None
+            ),
+            _build_archive(record_dir),
+            on_progress=_echo_progress,
+        )
+        use_case.execute_range(years)
+    _log_rate_limiter_metrics(rate_limiter)
+    _log_write_stats(race_repository)
+
+    typer.echo(f"Process for the years {start}-{end} finished.")
+
+
+@app.command()
+def retry_failed(
+    year: int = typer.Argument(..., help="The year whose failed races to retry."),
+    concurrency: int = CONCURRENCY_OPTION,
+    page_concurrency: int = PAGE_CONCURRENCY_OPTION,
+    parse_workers: Optional[int] = PARSE_WORKERS_OPTION,
+    cache_dir: str = CACHE_DIR_OPTION,
+    no_cache: bool = NO_CACHE_OPTION,
+    max_rate: float = MAX_RATE_OPTION,
+    rate_state_dir: Optional[str] = RATE_STATE_DIR_OPTION,
+    record_dir: Optional[str] = RECORD_DIR_OPTION,
+    cache_max_mb: int = CACHE_MAX_MB_OPTION,
+    loader: ResultsLoader = LOADER_OPTION,
+):
+    """
+    Reprocesses only the races that failed in the latest scrape of YEAR.
+    """
+    typer.echo(f"Retrying failed races for the year {year}...")
+    cache = (
+        None if no_cache else PageCache(cache_dir, max_bytes=cache_max_mb * 1024 * 1024)
+    )
+    rate_limiter = _build_rate_limiter(max_rate, rate_state_dir)
+    race_repository = _build_race_repository(loader)
+    with _build_parse_pool(parse_workers) as parse_pool:
+        use_case = _build_use_case(
+            concurrency,
+            page_concurrency,
+            cache,
+            race_repository=race_repository,
+            rate_limiter=rate_limiter,
+            parse_executor=parse_pool,
+            archive=_build_archive(record_dir),
+        )
+        use_case.retry_failed(year)
+    _log_rate_limiter_metrics(rate_limiter)
+    _log_write_stats(race_repository)
+    typer.echo(f"Retry for year {year} finished.")
+
+
+@app.command()
+def enqueue(
+    years: List[int] = typer.Argument(..., help="The years whose races to queue."),
+    cache_dir: str = CACHE_DIR_OPTION,
+    no_cache: bool = NO_CACHE_OPTION,
+    max_rate: float = MAX_RATE_OPTION,
+    rate_state_dir: Optional[str] = RATE_STATE_DIR_OPTION,
+    record_dir: Optional[str] = RECORD_DIR_OPTION,
+    cache_max_mb: int = CACHE_MAX_MB_OPTION,
+):
+    """
+    Queues the races of one or more YEARS for `worker` processes.
+    """
+    cache = (
+        None if no_cache else PageCache(cache_dir, max_bytes=cache_max_mb * 1024 * 1024)
+    )
+    rate_limiter = _build_rate_limiter(max_rate, rate_state_dir)
+    race_list_scraper = ProCyclingStatsRaceListScraper(
+        http_client=HttpClient(
+            cache=cache, rate_limiter=rate_limiter, archive=_build_archive(record_dir)
+        )
+    )
+    work_queue = PostgresRaceWorkQueue(engine=engine)
+    for year in years:
+        queued = work_queue.enqueue(year, race_list_scraper.scrape(year))
+        typer.echo(f"Queued {queued} races for the year {year}.")
+
+
+@app.command()
+def worker(
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Number of races this worker processes concurrently.",
+    ),
+    page_concurrency: int = PAGE_CONCURRENCY_OPTION,
+    parse_workers: Optional[int] = PARSE_WORKERS_OPTION,
+    cache_dir: str = CACHE_DIR_OPTION,
+    no_cache: bool = NO_CACHE_OPTION,
+    max_rate: float = MAX_RATE_OPTION,
+    rate_state_dir: Optional[str] = RATE_STATE_DIR_OPTION,
+    record_dir: Optional[str] = RECORD_DIR_OPTION,
+    cache_max_mb: int = CACHE_MAX_MB_OPTION,
+    incremental: bool = INCREMENTAL_OPTION,
+    loader: ResultsLoader = LOADER_OPTION,
+    worker_id: Optional[str] = typer.Option(
+        None,
+        "--worker-id",
+        help="Name recorded on the leases of this worker [default: <host>-<pid>].",
+    ),
+    lease_seconds: float = typer.Option(
+        300.0,
+        "--lease-seconds",
+        min=1,
+        help="Seconds after which a race of a silent worker is reclaimed.",
+    ),
+    heartbeat_seconds: float = typer.Option(
+        60.0,
+        "--heartbeat-seconds",
+        min=0.1,
+        help="How often the lease of a race in progress is renewed.",
+    ),
+    max_attempts: int = typer.Option(
+        3, "--max-attempts", min=1, help="Attempts before a race is marked failed."
+    ),
+    drain: bool = typer.Option(
+        False, "--drain", help="Exit once the queue is empty instead of polling."
+    ),
+):
     """
-    Sets up the application's dependencies (Composition Root) and runs the use case.
+    Claims queued races and scrapes them until stopped (SIGINT/SIGTERM).
     """
-    race_list_scraper = ProCyclingStatsRaceListScraper()
-    race_data_scraper = ProCyclingStatsRaceDataScraper()
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    cache = (
+        None if no_cache else PageCache(cache_dir, max_bytes=cache_max_mb * 1024 * 1024)
+    )
+    rate_limiter = _build_rate_limiter(max_rate, rate_state_dir)
+    race_repository = _build_race_repository(loader)
+    with _build_parse_pool(parse_workers) as parse_pool:
+        http_client = HttpClient(
+            pool_size=concurrency * page_concurrency,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            archive=_build_archive(record_dir),
+        )
+        scrape_race = ScrapeRaceUseCase(
+            race_data_scraper=ProCyclingStatsRaceDataScraper(
+                max_parallel_pages=page_concurrency,
+                http_client=http_client,
+                parse_executor=parse_pool,
+            ),
+            race_repository=race_repository,
+            rider_repository=PostgresRiderRepository(engine=engine),
+            incremental=incremental,
+        )
+        use_case = RaceWorkerUseCase(
+            work_queue=PostgresRaceWorkQueue(engine=engine),
+            scrape_race=scrape_race,
+            worker_id=worker_id,
+            concurrency=concurrency,
+            lease_seconds=lease_seconds,
+            heartbeat_interval=heartbeat_seconds,
+            max_attempts=max_attempts,
+        )
+
+        def _stop(signum, frame):
+            typer.echo("Stopping after the races in progress...")
+            use_case.stop()
+
+        signal.signal(signal.SIGINT, _stop)
+        signal.signal(signal.SIGTERM, _stop)
+
+        processed = use_case.run(drain=drain)
+    _log_rate_limiter_metrics(rate_limiter)
+    _log_write_stats(race_repository)
+    typer.echo(f"Worker {worker_id} processed {processed} races.")
 
-    rider_repo = PostgresRiderRepository(engine=engine)
-    race_repo = PostgresRaceRepository(engine=engine)
 
-    use_case = ScrapeYearUseCase(
+@app.command()
+def reparse(
+    years: List[int] = typer.Argument(..., help="The years whose races to re-parse."),
+    archive_dir: str = typer.Option(
+        ...,
+        "--archive-dir",
+        envvar="PCS_RECORD_DIR",
+        help="Directory of the archives recorded with --record-dir.",
+    ),
+    concurrency: int = typer.Option(
+        4,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Number of races to re-parse and persist concurrently.",
+    ),
+    parse_workers: Optional[int] = typer.Option(
+        None,
+        "--parse-workers",
+        min=0,
+        help="Processes that parse archived pages (default: one per CPU core; "
+        "0 parses them in the race threads).",
+    ),
+    loader: ResultsLoader = LOADER_OPTION,
+):
+    """
+    Re-parses the races of YEARS from recorded archives, without network access.
+
+    Stored results of every re-parsed classification are replaced, so that a
+    fixed or extended parser can backfill the database. Pages missing from the
+    archive are treated as not found.
+    """
+    archive = PageArchive(archive_dir)
+    typer.echo(f"Replaying {len(archive)} archived pages from {archive_dir}...")
+    http_client = HttpClient(
+        pool_size=concurrency, session=ArchiveReplaySession(archive), max_retries=0
+    )
+    race_repository = _build_race_repository(loader, replace_results=True)
+    with _build_parse_pool(parse_workers) as parse_pool:
+        use_case = ScrapeYearUseCase(
+            race_list_scraper=ProCyclingStatsRaceListScraper(http_client=http_client),
+            race_data_scraper=ProCyclingStatsRaceDataScraper(
+                http_client=http_client, parse_executor=parse_pool
+            ),
+            race_repository=race_repository,
+            rider_repository=PostgresRiderRepository(engine=engine),
+            concurrency=concurrency,
+        )
+        for year in years:
+            use_case.execute(year)
+            typer.echo(f"Re-parse for year {year} finished.")
+    _log_write_stats(race_repository)
+
+
+def _run_use_case(
+    year: int,
+    concurrency: int = 1,
+    page_concurrency: int = 1,
+    cache: Optional[PageCache] = None,
+    incremental: bool = False,
+    race_repository: Optional[PostgresRaceRepository] = None,
+    rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    parse_executor: Optional[Executor] = None,
+    pipeline: Optional[PipelineConfig] = None,
+    archive: Optional[PageArchiveWriter] = None,
+):
+    use_case = _build_use_case(
+        concurrency,
+        page_concurrency,
+        cache,
+        incremental,
+        race_repository,
+        rate_limiter,
+        parse_executor,
+        pipeline,
+        archive,
+    )
+    use_case.execute(year)
+
+
+def _build_use_case(
+    concurrency: int = 1,
+    page_concurrency: int = 1,
+    cache: Optional[PageCache] = None,
+    incremental: bool = False,
+    race_repository: Optional[PostgresRaceRepository] = None,
+    rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    parse_executor: Optional[Executor] = None,
+    pipeline: Optional[PipelineConfig] = None,
+    archive: Optional[PageArchiveWriter] = None,
+    on_progress: Optional[Callable[[ScrapeProgress], None]] = None,
+) -> ScrapeYearUseCase:
+    """
+    Sets up the application's dependencies (Composition Root) for the use case.
+    """
+    pool_size = max(
+        concurrency * page_concurrency, pipeline.fetchers if pipeline else 1
+    )
+    http_client = HttpClient(
+        pool_size=pool_size,
+        cache=cache,
+        rate_limiter=rate_limiter,
+        archive=archive,
+    )
+    race_list_scraper = ProCyclingStatsRaceListScraper(
+        http_client=http_client, max_parallel_pages=pool_size
+    )
+    race_data_scraper = ProCyclingStatsRaceDataScraper(
+        max_parallel_pages=page_concurrency,
+        http_client=http_client,
+        parse_executor=parse_executor,
+    )
+
+    return ScrapeYearUseCase(
         race_list_scraper=race_list_scraper,
         race_data_scraper=race_data_scraper,
-        race_repository=race_repo,
-        rider_repository=rider_repo,
+        race_repository=race_repository or _build_race_repository(ResultsLoader.insert),
+        rider_repository=PostgresRiderRepository(engine=engine),
+        concurrency=concurrency,
+        incremental=incremental,
+        job_repository=PostgresScrapeJobRepository(engine=engine),
+        pipeline=pipeline,
+        on_progress=on_progress,
     )
 
-    use_case.execute(year)
+
+def _build_rate_limiter(
+    max_rate: float, state_dir: Optional[str]
+) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(
+        initial_rate=min(2.0, max_rate), max_rate=max_rate, state_dir=state_dir
+    )
+
+
+def _build_parse_pool(
+    parse_workers: Optional[int],
+) -> ContextManager[Optional[Executor]]:
+    """
+    The process pool that parses fetched pages, one process per core unless
+    ``parse_workers`` says otherwise; a null context when it is 0.
+    """
+    if parse_workers == 0:
+        return nullcontext()
+    # Pages are submitted from the scraping threads; forking a process that
+    # runs threads is unsafe, so workers start from a clean fork server. They
+    # ignore Ctrl-C so that the races in progress can finish parsing.
+    return ProcessPoolExecutor(
+        max_workers=parse_workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=signal.signal,
+        initargs=(signal.SIGINT, signal.SIG_IGN),
+    )
+
+
+def _echo_progress(progress: ScrapeProgress) -> None:
+    eta = _format_duration(progress.eta_s) if progress.eta_s is not None else "?"
+    typer.echo(
+        f"[{progress.done}/{progress.total} {progress.percent:5.1f}%] "
+        f"{progress.failed} failed, elapsed {_format_duration(progress.elapsed_s)}, "
+        f"ETA {eta}"
+    )
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def _log_write_stats(race_repository: PostgresRaceRepository) -> None:
+    logger.info(
+        "classification_write_stats", extra=asdict(race_repository.write_stats())
+    )
+
+
+def _build_archive(record_dir: Optional[str]) -> Optional[PageArchiveWriter]:
+    return PageArchiveWriter(record_dir) if record_dir else None
+
+
+def _log_rate_limiter_metrics(rate_limiter: AdaptiveRateLimiter) -> None:
+    for snapshot in rate_limiter.metrics().values():
+        logger.info("rate_limiter_stats", extra=asdict(snapshot))
+
+
+def _build_race_repository(
+    loader: ResultsLoader, replace_results: bool = False
+) -> PostgresRaceRepository:
+    if loader == ResultsLoader.copy:
+        return PostgresCopyRaceRepository(
+            engine=engine, replace_results=replace_results
+        )
+    return PostgresRaceRepository(engine=engine, replace_results=replace_results)
+
+
+@app.command()
+def rebuild_rollup():
+    """
+    Recomputes the rider_season_points rollup from the stored results.
+
+    Scraping keeps the rollup up to date; rebuild it after results were
+    changed by other means, e.g. deleting races by hand.
+    """
+    rows = PostgresRiderSeasonPoints(engine).rebuild()
+    typer.echo(f"Rebuilt rider_season_points: {rows} rows.")
+
+
+@app.command()
+def set_alias(
+    name: str = typer.Argument(..., help="The name as the fantasy game spells it."),
+    rider_pcs_id: str = typer.Argument(
+        ..., help="The rider it refers to, e.g. rider/tadej-pogacar."
+    ),
+    team: Optional[str] = typer.Option(
+        None,
+        "--team",
+        help="Only apply the alias to cyclists of this team. Without it, the "
+        "alias applies to any team.",
+    ),
+):
+    """
+    Maps a fantasy rider name to a rider, correcting a bad automatic match.
+
+    Aliases are looked up by name and team, and an alias for the cyclist's
+    team wins over one for any team. Confident fuzzy matches are learned as
+    aliases for the team they were sent with. An alias for any team
+    deletes the learned aliases of the name for every team; one for a team
+    replaces the alias of that team only. Manual aliases are never
+    overwritten by learned ones.
+    """
+    rider = PostgresRiderRepository(engine).find_by_pcs_id(rider_pcs_id)
+    if rider is None or rider.id is None:
+        typer.echo(f"Unknown rider: {rider_pcs_id}", err=True)
+        raise typer.Exit(code=1)
+    alias = RiderAlias(
+        normalize_alias(name), normalize_alias(team or ""), rider.id, AliasSource.MANUAL
+    )
+    PostgresRiderAliasRepository(engine).save(alias)
+    typer.echo(f"Alias '{alias.name}' now points to {rider.pcs_id} ({rider.name}).")
+
+
+@app.command()
+def remove_alias(
+    name: str = typer.Argument(..., help="The aliased name."),
+    team: Optional[str] = typer.Option(
+        None,
+        "--team",
+        help="Remove the alias of this team. Without it, removes the alias for "
+        "any team and the learned aliases of the name for every team.",
+    ),
+):
+    """
+    Removes a rider name alias, so the name is fuzzy-matched again.
+
+    Manual aliases set for other teams are kept.
+    """
+    key = (normalize_alias(name), normalize_alias(team or ""))
+    if not PostgresRiderAliasRepository(engine).delete(key):
+        typer.echo(f"No alias '{key[0]}' found.", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"Alias '{key[0]}' removed.")
 
 
 @app.command()
@@ -82,6 +718,10 @@ def db_init():
 
     typer.echo("Creating all tables...")
     metadata.create_all(engine)
+
+    # The tables now match the latest migration; record that so that
+    # `alembic upgrade head` only applies migrations added from here on.
+    command.stamp(Config(ALEMBIC_INI), "head")
     typer.echo("Database initialized successfully.")
 
 
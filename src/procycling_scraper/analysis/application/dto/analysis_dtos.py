@@ -1,16 +1,32 @@
 from dataclasses import dataclass
 from typing import List
+from uuid import UUID
 
 from procycling_scraper.analysis.application.dto.cyclist_dto import CyclistDTO
+from procycling_scraper.scraping.domain.entities.race import RaceType
 from procycling_scraper.scraping.domain.entities.rider import Rider
 
 
 @dataclass(frozen=True)
 class RiderResultDTO:
-    rider_id: str
+    rider_id: UUID
     points: int
     year: int
-    race_type: str
+    race_type: RaceType
+
+
+@dataclass(frozen=True)
+class RiderScoreDTO:
+    """
+    Raw points breakdown and weighted total of one rider. The total is the
+    one ``ValueScoreCalculator`` gives over all of their results, up to
+    floating-point rounding.
+    """
+
+    rider_id: UUID
+    one_day_points: int
+    stage_race_points: int
+    total_weighted_points: float
 
 
 @dataclass(frozen=True)
@@ -1,16 +1,32 @@
 import logging
-from typing import Any, Dict, List, Union
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
 from procycling_scraper.analysis.application.dto.analysis_dtos import MatchedRiderDTO
-from procycling_scraper.analysis.application.dto.cyclist_dto import AnalysisRequestDTO
+from procycling_scraper.analysis.application.dto.cyclist_dto import (
+    AnalysisRequestDTO,
+    CyclistDTO,
+)
+from procycling_scraper.analysis.application.rider_index import RiderIndex
+from procycling_scraper.analysis.domain.repositories.rider_alias_repository import (
+    RiderAliasRepository,
+)
+from procycling_scraper.analysis.domain.rider_alias import (
+    AliasKey,
+    AliasSource,
+    RiderAlias,
+    normalize_alias,
+)
 from procycling_scraper.analysis.domain.rider_matching_service import (
     RiderMatchingService,
 )
+from procycling_scraper.analysis.domain.rider_name_matcher import RiderNameMatcher
 from procycling_scraper.analysis.domain.value_score_calculator import (
     ValueScoreCalculator,
 )
 from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
 from procycling_scraper.scraping.domain.repositories.rider_repository import (
     RiderRepository,
 )
@@ -22,35 +38,50 @@ logger = logging.getLogger(__name__)
 
 
 class ProcessCyclistsUseCase:
-    def __init__(self, rider_repository: RiderRepository):
+    def __init__(
+        self,
+        rider_repository: RiderRepository,
+        rider_index: Optional[RiderIndex] = None,
+        alias_repository: Optional[RiderAliasRepository] = None,
+        alias_min_score: int = 95,
+        rider_matcher: Optional[RiderNameMatcher] = None,
+    ):
+        """
+        With an ``alias_repository``, names with a stored alias skip fuzzy
+        matching, and fuzzy matches scoring at least ``alias_min_score`` are
+        stored as aliases, scoped to the cyclist's team, for the next
+        requests.
+
+        Names are fuzzy matched by ``rider_matcher`` if given, else by the
+        ``rider_index`` service, else by a service built for the request.
+        """
         self._rider_repository = rider_repository
+        self._rider_index = rider_index
+        self._rider_matcher = rider_matcher
+        self._alias_repository = alias_repository
+        self._alias_min_score = alias_min_score
         self._score_calculator = ValueScoreCalculator()
 
     def execute(self, request_data: AnalysisRequestDTO) -> ApiResponsePayload:
-        all_riders_from_db = self._rider_repository.find_all()
-        matching_service = RiderMatchingService(all_riders_from_db)
-
         target_race_type = (
             RaceType.ONE_DAY
             if request_data.race_type.value == "one-day"
             else RaceType.STAGE_RACE
         )
 
-        matched_riders: List[MatchedRiderDTO] = []
-        for cyclist_dto in request_data.cyclists:
-            best_match = matching_service.find_best_match(cyclist_dto.name)
-            if best_match and best_match.id:
-                matched_riders.append(
-                    MatchedRiderDTO(api_data=cyclist_dto, db_rider=best_match)
-                )
+        matched_riders = self._match_cyclists(request_data.cyclists)
 
         rider_ids_to_fetch: List[UUID] = [
             rider.db_rider.id
             for rider in matched_riders
             if rider.db_rider.id is not None
         ]
-        all_results_map = self._rider_repository.find_all_results_by_rider_ids(
-            rider_ids_to_fetch
+        # Sums and weights are computed by the database, one row per rider.
+        scores = self._rider_repository.find_scores_by_rider_ids(
+            rider_ids_to_fetch,
+            target_race_type,
+            datetime.now().year,
+            self._score_calculator.weights,
         )
 
         analyzed_cyclists: List[AnalyzedCyclistPayload] = []
@@ -58,20 +89,13 @@ class ProcessCyclistsUseCase:
             db_rider = rider_data.db_rider
             api_data = rider_data.api_data
 
-            if db_rider.id:
-                rider_results = all_results_map.get(db_rider.id, [])
-
-                one_day_points = sum(
-                    r.points for r in rider_results if r.race_type == RaceType.ONE_DAY
-                )
-                stage_race_points = sum(
-                    r.points
-                    for r in rider_results
-                    if r.race_type == RaceType.STAGE_RACE
-                )
-
-                total_points, value_score = self._score_calculator.calculate(
-                    rider_results, api_data.price, target_race_type
+            if db_rider.id and db_rider.id in scores:
+                score = scores[db_rider.id]
+                one_day_points = score.one_day_points
+                stage_race_points = score.stage_race_points
+                total_points = score.total_weighted_points
+                value_score = self._score_calculator.value_score(
+                    total_points, api_data.price
                 )
 
                 logger.info(
@@ -106,3 +130,66 @@ class ProcessCyclistsUseCase:
         analyzed_cyclists.sort(key=lambda x: x["value_score"], reverse=True)
 
         return {"status": "success", "analyzed_cyclists": analyzed_cyclists}
+
+    def _match_cyclists(self, cyclists: List[CyclistDTO]) -> List[MatchedRiderDTO]:
+        names = [normalize_alias(c.name) for c in cyclists]
+        aliased: Dict[AliasKey, Rider] = {}
+        if self._alias_repository is not None:
+            aliased = self._alias_repository.find_riders(names)
+
+        matches: List[Optional[Rider]] = []
+        unresolved: List[int] = []
+        for position, (cyclist, name) in enumerate(zip(cyclists, names)):
+            # An alias scoped to the cyclist's team wins over an unscoped one.
+            rider = aliased.get((name, normalize_alias(cyclist.team))) or aliased.get(
+                (name, "")
+            )
+            matches.append(rider)
+            if rider is None:
+                unresolved.append(position)
+
+        learned: List[RiderAlias] = []
+        if unresolved:
+            scored_matches = self._matching_service().find_scored_matches(
+                [cyclists[position].name for position in unresolved],
+                teams=[cyclists[position].team for position in unresolved],
+            )
+            for position, scored in zip(unresolved, scored_matches):
+                if scored is None:
+                    continue
+                rider, score = scored
+                matches[position] = rider
+                if score >= self._alias_min_score and rider.id is not None:
+                    # Scoped to the team: the name may be a namesake's on
+                    # another team.
+                    learned.append(
+                        RiderAlias(
+                            names[position],
+                            normalize_alias(cyclists[position].team),
+                            rider.id,
+                            AliasSource.AUTO,
+                        )
+                    )
+        if learned and self._alias_repository is not None:
+            self._alias_repository.save_learned(learned)
+
+        logger.info(
+            "rider_names_resolved",
+            extra={
+                "alias_hits": len(cyclists) - len(unresolved),
+                "fuzzy_matched": len(unresolved),
+                "aliases_learned": len(learned),
+            },
+        )
+        return [
+            MatchedRiderDTO(api_data=cyclist, db_rider=rider)
+            for cyclist, rider in zip(cyclists, matches)
+            if rider is not None and rider.id
+        ]
+
+    def _matching_service(self) -> RiderNameMatcher:
+        if self._rider_matcher is not None:
+            return self._rider_matcher
+        if self._rider_index is not None:
+            return self._rider_index.matching_service()
+        return RiderMatchingService(self._rider_repository.find_all())
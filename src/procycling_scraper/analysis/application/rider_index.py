@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+from procycling_scraper.analysis.domain.rider_matching_service import (
+    RiderMatchingService,
+)
+from procycling_scraper.scraping.domain.repositories.rider_repository import (
+    RiderRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RiderIndexStatus:
+    """
+    State of a ``RiderIndex``, as reported by the API readiness endpoint.
+
+    Attributes:
+        warm (bool): Whether a matching index has been built.
+        riders (int): Riders in the index.
+        version (Optional[str]): Riders table version the index was built
+            from.
+        age_s (Optional[float]): Seconds since the index was built.
+    """
+
+    warm: bool
+    riders: int
+    version: Optional[str]
+    age_s: Optional[float]
+
+
+class RiderIndex:
+    """
+    Process-wide ``RiderMatchingService`` shared by every request.
+
+    The index is built once, with ``warm`` at startup or on first use, and
+    rebuilt only when ``RiderRepository.riders_version`` changes, that is
+    when a scrape has added riders. The version is checked at most every
+    ``check_interval`` seconds, so most requests match names without
+    touching the database at all.
+
+    The service is given the teams of every rider over the last
+    ``recent_team_seasons`` seasons, to match names within their team
+    first; None matches against every rider. Teams are refreshed with the
+    riders only, so a rider's new team may be missing until then, in which
+    case the name falls back to the whole index.
+    """
+
+    def __init__(
+        self,
+        rider_repository: RiderRepository,
+        check_interval: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        recent_team_seasons: Optional[int] = 2,
+    ):
+        self._rider_repository = rider_repository
+        self._check_interval = check_interval
+        self._recent_team_seasons = recent_team_seasons
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._service: Optional[RiderMatchingService] = None
+        self._riders = 0
+        self._version: Optional[str] = None
+        self._built_at: Optional[float] = None
+        self._checked_at: Optional[float] = None
+
+    def warm(self) -> None:
+        """Builds the index now, unless it is current."""
+        with self._lock:
+            self._refresh(self._rider_repository.riders_version())
+
+    def matching_service(self) -> RiderMatchingService:
+        service = self._service
+        checked_at = self._checked_at
+        if (
+            service is not None
+            and checked_at is not None
+            and self._clock() - checked_at < self._check_interval
+        ):
+            return service
+        with self._lock:
+            # Another request may have refreshed the index meanwhile.
+            if (
+                self._service is None
+                or self._checked_at is None
+                or self._clock() - self._checked_at >= self._check_interval
+            ):
+                self._refresh(self._rider_repository.riders_version())
+            assert self._service is not None
+            return self._service
+
+    def status(self) -> RiderIndexStatus:
+        built_at = self._built_at
+        return RiderIndexStatus(
+            warm=self._service is not None,
+            riders=self._riders,
+            version=self._version,
+            age_s=None if built_at is None else self._clock() - built_at,
+        )
+
+    def _refresh(self, version: str) -> None:
+        self._checked_at = self._clock()
+        if self._service is not None and version == self._version:
+            return
+        riders = self._rider_repository.find_all()
+        rider_teams = None
+        if self._recent_team_seasons is not None:
+            rider_teams = self._rider_repository.find_recent_teams(
+                datetime.now().year - self._recent_team_seasons + 1
+            )
+        self._service = RiderMatchingService(riders, rider_teams=rider_teams)
+        self._riders = len(riders)
+        self._version = version
+        self._built_at = self._clock()
+        logger.info(
+            "rider_index_built", extra={"riders": len(riders), "version": version}
+        )
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List
+
+from procycling_scraper.analysis.domain.rider_alias import AliasKey, RiderAlias
+from procycling_scraper.scraping.domain.entities.rider import Rider
+
+
+class RiderAliasRepository(ABC):
+    """
+    Abstract interface for the store of external rider name aliases.
+    """
+
+    @abstractmethod
+    def find_riders(self, names: Iterable[str]) -> Dict[AliasKey, Rider]:
+        """
+        Fetches every alias of the given normalised names, team-scoped or
+        not, with the rider it refers to, in a single lookup.
+        """
+        pass
+
+    @abstractmethod
+    def save_learned(self, aliases: List[RiderAlias]) -> None:
+        """
+        Saves automatically learned aliases. Aliases that already exist,
+        learned or manual, are left as they are.
+        """
+        pass
+
+    @abstractmethod
+    def save(self, alias: RiderAlias) -> None:
+        """
+        Creates or replaces an alias; used to correct bad matches. A manual
+        alias for any team also deletes the learned aliases of its name for
+        every team, which the team-scoped lookup would otherwise prefer.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: AliasKey) -> bool:
+        """
+        Deletes an alias. Deleting the alias for any team also deletes the
+        learned aliases of its name for every team. Returns False if there
+        was none.
+        """
+        pass
@@ -0,0 +1,45 @@
+import enum
+import unicodedata
+from dataclasses import dataclass
+from typing import Tuple
+from uuid import UUID
+
+# (normalised name, normalised team or "" when the alias is not team-scoped)
+AliasKey = Tuple[str, str]
+
+
+class AliasSource(enum.Enum):
+    """How an alias was recorded."""
+
+    AUTO = "Auto"  # Written back from a confident fuzzy match
+    MANUAL = "Manual"  # Set by an administrator; never overwritten
+
+
+@dataclass(frozen=True)
+class RiderAlias:
+    """
+    An external spelling of a rider's name, e.g. from a fantasy price list.
+
+    Attributes:
+        name (str): The normalised external name (see ``normalize_alias``).
+        team (str): The normalised team the alias applies to, or "" for an
+            alias valid whatever the team.
+        rider_id (UUID): The database ID of the rider it refers to.
+        source (AliasSource): Whether it was learned or set by hand.
+    """
+
+    name: str
+    team: str
+    rider_id: UUID
+    source: AliasSource
+
+    @property
+    def key(self) -> AliasKey:
+        return self.name, self.team
+
+
+def normalize_alias(text: str) -> str:
+    """Lower-cases, strips accents and collapses whitespace."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.lower().split())
@@ -1,35 +1,197 @@
-from typing import Dict, List, Optional
+import heapq
+from collections import Counter
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+)
+from uuid import UUID
 
-from thefuzz import process
+from thefuzz import fuzz, process, utils
 
+from procycling_scraper.analysis.domain.rider_name_matcher import (
+    RiderNameMatcher,
+    ScoredMatch,
+)
 from procycling_scraper.scraping.domain.entities.rider import Rider
 
+_GRAM_SIZE = 3
 
-class RiderMatchingService:
-    def __init__(self, all_riders: List[Rider], score_cutoff: int = 85):
-        self._choices: Dict[str, Rider] = {
-            self._normalize(r.name): r for r in all_riders
-        }
-        self._score_cutoff = score_cutoff
 
-    def _normalize(self, name: str) -> str:
-        return name.lower()
+class RiderMatchingService(RiderNameMatcher):
+    """
+    Matches external rider names against the riders in the database.
+
+    Scoring is ``thefuzz.process.extractOne`` (``WRatio``), but instead of
+    scoring every rider for every name, an index built once over the
+    processed names shortlists the riders sharing a whole word with the
+    name or the most character trigrams with it, and only those are
+    scored. Riders tied with the last shortlisted one are shortlisted too,
+    and the shortlist keeps the order of the full list, so the best match
+    has the top score a full scan would find. When riders tie on that
+    score, it is the first shortlisted one, which need not be the first of
+    the full list. ``max_candidates`` is the number of riders shortlisted
+    by shared trigrams, before ties.
+
+    Given ``rider_teams``, the teams each rider has raced for lately, names
+    matched with their team are first scored against the riders of the
+    teams whose name matches it (``fuzz.token_set_ratio`` of at least
+    ``team_cutoff``), a few dozen riders instead of the whole history,
+    which also keeps namesakes on other teams from winning. Only names
+    without a good enough match there go through the full index.
+    """
+
+    def __init__(
+        self,
+        all_riders: List[Rider],
+        score_cutoff: int = 85,
+        max_candidates: int = 50,
+        rider_teams: Optional[Mapping[UUID, Collection[str]]] = None,
+        team_cutoff: int = 90,
+    ):
+        self._choices: Dict[str, Rider] = {_normalize(r.name): r for r in all_riders}
+        self._score_cutoff = score_cutoff
+        self._max_candidates = max_candidates
+        self._team_cutoff = team_cutoff
+        self._names: List[str] = list(self._choices)
+        self._by_token: Dict[str, List[int]] = {}
+        self._by_gram: Dict[str, List[int]] = {}
+        self._by_team: Dict[str, List[int]] = {}
+        for position, name in enumerate(self._names):
+            processed = _process(name)
+            for token in set(processed.split()):
+                self._by_token.setdefault(token, []).append(position)
+            for gram in _grams(processed):
+                self._by_gram.setdefault(gram, []).append(position)
+            rider_id = self._choices[name].id
+            if rider_teams and rider_id is not None and rider_id in rider_teams:
+                for team in {_process(t) for t in rider_teams[rider_id]}:
+                    if team:
+                        self._by_team.setdefault(team, []).append(position)
+        self._teams: List[str] = list(self._by_team)
 
     def find_best_match(self, api_name: str) -> Optional[Rider]:
+        return self.find_best_matches([api_name])[0]
+
+    def find_best_matches(
+        self, api_names: Iterable[str], teams: Optional[Sequence[str]] = None
+    ) -> List[Optional[Rider]]:
+        """Returns the best match of every name, None where none is good enough."""
+        return [m[0] if m else None for m in self.find_scored_matches(api_names, teams)]
+
+    def find_scored_matches(
+        self, api_names: Iterable[str], teams: Optional[Sequence[str]] = None
+    ) -> List[Optional[ScoredMatch]]:
+        """
+        Like ``find_best_matches``, with the score (0-100) of each match.
+        ``teams``, the team of each name, narrows the candidates first.
+        """
+        if teams is None:
+            return [self._match(name) for name in api_names]
+
+        by_team: Dict[str, List[Rider]] = {}
+        matches: List[Optional[ScoredMatch]] = []
+        for name, team in zip(api_names, teams):
+            if team not in by_team:
+                by_team[team] = self._team_candidates(team)
+            match = None
+            if by_team[team]:
+                match = best_scored_match(name, by_team[team], self._score_cutoff)
+            matches.append(match or self._match(name))
+        return matches
+
+    def _match(self, api_name: str) -> Optional[ScoredMatch]:
         if not self._choices:
             return None
 
-        normalized_api_name = self._normalize(api_name)
+        candidates = [
+            self._choices[self._names[i]] for i in self._shortlist(_normalize(api_name))
+        ]
+        return best_scored_match(api_name, candidates, self._score_cutoff)
 
-        result = process.extractOne(normalized_api_name, self._choices.keys())
+    def _team_candidates(self, team: str) -> List[Rider]:
+        processed = _process(team)
+        if not processed or not self._teams:
+            return []
+        teams = process.extractBests(
+            processed,
+            self._teams,
+            processor=None,
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=self._team_cutoff,
+            limit=None,
+        )
+        positions: Set[int] = set()
+        for matched_team, _ in teams:
+            positions.update(self._by_team[matched_team])
+        # In the order of the full list, as a full scan would see them.
+        return [self._choices[self._names[i]] for i in sorted(positions)]
 
-        if not result:
-            return None
+    def _shortlist(self, normalized_name: str) -> List[int]:
+        processed = _process(normalized_name)
+        if len(processed) <= _GRAM_SIZE:
+            # Too short to share trigrams with the names containing it.
+            return list(range(len(self._names)))
+        shared_grams: Counter = Counter()
+        for gram in _grams(processed):
+            shared_grams.update(self._by_gram.get(gram, ()))
+
+        shortlist: Set[int] = set()
+        if shared_grams:
+            cutoff = heapq.nlargest(self._max_candidates, shared_grams.values())[-1]
+            shortlist.update(
+                i for i, shared in shared_grams.items() if shared >= cutoff
+            )
+        for token in processed.split():
+            shortlist.update(self._by_token.get(token, ()))
+        return sorted(shortlist)
 
-        best_match_name = result[0]
-        score = result[1]
 
-        if score >= self._score_cutoff:
-            return self._choices[best_match_name]
+def best_scored_match(
+    api_name: str, candidates: List[Rider], score_cutoff: int
+) -> Optional[ScoredMatch]:
+    """
+    Scores a name against candidate riders with ``thefuzz``, the first best
+    one winning ties. Shared by every ``RiderNameMatcher`` so that they
+    agree on scores whatever way they shortlist the candidates.
+    """
+    choices: Dict[str, Rider] = {_normalize(r.name): r for r in candidates}
+    if not choices:
+        return None
+
+    result = process.extractOne(_normalize(api_name), list(choices))
 
+    if not result:
         return None
+
+    best_match_name = result[0]
+    score = result[1]
+
+    if score >= score_cutoff:
+        return choices[best_match_name], score
+
+    return None
+
+
+def _normalize(name: str) -> str:
+    return name.lower()
+
+
+def _process(name: str) -> str:
+    # The processing thefuzz applies to choices before scoring them.
+    return utils.full_process(name, force_ascii=True)
+
+
+def _grams(processed: str) -> Set[str]:
+    grams: Set[str] = set()
+    for token in processed.split():
+        padded = f" {token} "
+        grams.update(
+            padded[i : i + _GRAM_SIZE] for i in range(len(padded) - _GRAM_SIZE + 1)
+        )
+    return grams
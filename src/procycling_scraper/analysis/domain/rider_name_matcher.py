@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from procycling_scraper.scraping.domain.entities.rider import Rider
+
+# A matched rider and its thefuzz score (0-100).
+ScoredMatch = Tuple[Rider, int]
+
+
+class RiderNameMatcher(ABC):
+    """
+    Abstract interface for matching external rider names against the
+    riders in the database.
+    """
+
+    @abstractmethod
+    def find_scored_matches(
+        self, api_names: Iterable[str], teams: Optional[Sequence[str]] = None
+    ) -> List[Optional[ScoredMatch]]:
+        """
+        Returns the best match of every name with its score, None where
+        none is good enough, in the order of the names. ``teams``, the team
+        of each name, may be used to narrow down the candidates.
+        """
+        pass
@@ -1,37 +1,160 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from procycling_scraper.analysis.application.dto.analysis_dtos import RiderResultDTO
 from procycling_scraper.scraping.domain.entities.race import RaceType
 
+# Race type codes of the columnar input of ValueScoreCalculator.calculate_roster.
+RACE_TYPE_CODES: Dict[RaceType, int] = {t: code for code, t in enumerate(RaceType)}
+
+
+@dataclass(frozen=True)
+class ScoreWeights:
+    """
+    Weights applied to a rider's points by the value score.
+
+    Attributes:
+        season_weights (Tuple[float, ...]): Weight of the points of the
+            current season, the previous one and so on. Seasons in the
+            future count as the current one.
+        older_season_weight (float): Weight of every older season.
+        target_race_type_weight (float): Weight of points scored in races
+            of the type being analysed.
+        other_race_type_weight (float): Weight of points scored in races of
+            the other type.
+    """
+
+    season_weights: Tuple[float, ...] = (1.0, 0.5, 0.25)
+    older_season_weight: float = 0.1
+    target_race_type_weight: float = 1.0
+    other_race_type_weight: float = 0.5
+
+    def year_weight(self, year_diff: int) -> float:
+        if year_diff >= len(self.season_weights):
+            return self.older_season_weight
+        return self.season_weights[max(year_diff, 0)]
+
+    def type_weight(self, race_type: RaceType, target_race_type: RaceType) -> float:
+        if race_type == target_race_type:
+            return self.target_race_type_weight
+        return self.other_race_type_weight
+
+
+@dataclass(frozen=True)
+class RosterScores:
+    """
+    Scores of a whole roster, one entry per rider.
+
+    Attributes:
+        total_weighted_points (np.ndarray): Weighted total points (float64).
+        value_scores (np.ndarray): Weighted total points per unit of price
+            (float64), 0.0 where the price is not positive.
+        one_day_points (np.ndarray): Raw points in one-day races (int64).
+        stage_race_points (np.ndarray): Raw points in stage races (int64).
+    """
+
+    total_weighted_points: np.ndarray
+    value_scores: np.ndarray
+    one_day_points: np.ndarray
+    stage_race_points: np.ndarray
+
 
 class ValueScoreCalculator:
+    def __init__(self, weights: ScoreWeights = ScoreWeights()):
+        self.weights = weights
+
     def calculate(
-        self, results: List[RiderResultDTO], price: int, target_race_type: RaceType
+        self,
+        results: List[RiderResultDTO],
+        price: int,
+        target_race_type: RaceType,
+        current_year: Optional[int] = None,
     ) -> Tuple[float, float]:
         """
         Calculates the weighted total points and the value score for a rider.
         """
-        current_year = datetime.now().year
+        if current_year is None:
+            current_year = datetime.now().year
         total_weighted_points = 0.0
 
         for result in results:
-            year_diff = current_year - result.year
-
-            year_weight = 1.0
-            if year_diff == 1:
-                year_weight = 0.5
-            elif year_diff == 2:
-                year_weight = 0.25
-            elif year_diff > 2:
-                year_weight = 0.1
-
-            type_weight = 1.0 if result.race_type == target_race_type else 0.5
+            year_weight = self.weights.year_weight(current_year - result.year)
+            type_weight = self.weights.type_weight(result.race_type, target_race_type)
 
             final_weight = year_weight * type_weight
 
             total_weighted_points += result.points * final_weight
 
-        value_score = (total_weighted_points / price) if price > 0 else 0.0
+        return total_weighted_points, self.value_score(total_weighted_points, price)
+
+    def calculate_roster(
+        self,
+        rider_index: np.ndarray,
+        points: np.ndarray,
+        years: np.ndarray,
+        race_type_codes: np.ndarray,
+        prices: np.ndarray,
+        target_race_type: RaceType,
+        current_year: Optional[int] = None,
+    ) -> RosterScores:
+        """
+        Scores every rider of a roster at once from columnar results: the
+        i-th result is ``points[i]`` scored in ``years[i]`` in a race of
+        type ``race_type_codes[i]`` (see ``RACE_TYPE_CODES``) by rider
+        ``rider_index[i]``, an index into ``prices``.
+
+        The weights come from lookup tables indexed by season and race type
+        code, and ``np.bincount`` sums them per rider in input order, the
+        order ``calculate`` adds them in, so the totals are bit-for-bit
+        those of ``calculate`` over each rider's results.
+        """
+        if current_year is None:
+            current_year = datetime.now().year
+        riders = len(prices)
+        rider_index = np.asarray(rider_index, dtype=np.intp)
+        points = np.asarray(points, dtype=np.int64)
+        race_type_codes = np.asarray(race_type_codes, dtype=np.intp)
+
+        seasons = len(self.weights.season_weights)
+        year_weights = np.array(
+            self.weights.season_weights + (self.weights.older_season_weight,),
+            dtype=np.float64,
+        )
+        type_weights = np.array(
+            [self.weights.type_weight(t, target_race_type) for t in RACE_TYPE_CODES],
+            dtype=np.float64,
+        )
+        # year_weight: seasons in the future count as the current one and
+        # every season from len(season_weights) back as an older one.
+        year_diff = np.clip(current_year - np.asarray(years), 0, seasons)
+        weights = year_weights[year_diff] * type_weights[race_type_codes]
+
+        totals = np.bincount(rider_index, weights=points * weights, minlength=riders)
+        prices = np.asarray(prices, dtype=np.float64)
+        value_scores = np.divide(
+            totals, prices, out=np.zeros(riders, dtype=np.float64), where=prices > 0
+        )
+        one_day = race_type_codes == RACE_TYPE_CODES[RaceType.ONE_DAY]
+        stage_race = race_type_codes == RACE_TYPE_CODES[RaceType.STAGE_RACE]
+        return RosterScores(
+            total_weighted_points=totals,
+            value_scores=value_scores,
+            one_day_points=_sum_points(rider_index, points, one_day, riders),
+            stage_race_points=_sum_points(rider_index, points, stage_race, riders),
+        )
+
+    @staticmethod
+    def value_score(total_weighted_points: float, price: int) -> float:
+        return (total_weighted_points / price) if price > 0 else 0.0
+
 
-        return total_weighted_points, value_score
+def _sum_points(
+    rider_index: np.ndarray, points: np.ndarray, mask: np.ndarray, riders: int
+) -> np.ndarray:
+    # float64 sums of integer points are exact well beyond any rider's total.
+    return np.bincount(
+        rider_index[mask], weights=points[mask], minlength=riders
+    ).astype(np.int64)
@@ -1,6 +1,11 @@
-from typing import Any, Dict
+import logging
+import os
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from typing import Any, AsyncIterator, Dict, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.concurrency import run_in_threadpool
 
 from procycling_scraper.analysis.application.dto.cyclist_dto import (
     AnalysisRequestDTO,  # Importamos el DTO correcto
@@ -8,15 +13,60 @@ from procycling_scraper.analysis.application.dto.cyclist_dto import (
 from procycling_scraper.analysis.application.process_cyclists_use_case import (
     ProcessCyclistsUseCase,
 )
+from procycling_scraper.analysis.application.rider_index import RiderIndex
+from procycling_scraper.analysis.domain.rider_name_matcher import RiderNameMatcher
 from procycling_scraper.scraping.infrastructure.database.schema import engine
+from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_alias_repository import (
+    PostgresRiderAliasRepository,
+)
+from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_name_matcher import (
+    PostgresRiderNameMatcher,
+)
 from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
     PostgresRiderRepository,
 )
 
+logger = logging.getLogger(__name__)
+
+# "memory": every worker holds a rider index; "postgres": pg_trgm queries.
+RIDER_MATCHING_BACKEND = os.environ.get("RIDER_MATCHING_BACKEND", "memory")
+if RIDER_MATCHING_BACKEND not in ("memory", "postgres"):
+    raise ValueError(
+        f"RIDER_MATCHING_BACKEND must be 'memory' or 'postgres', "
+        f"not {RIDER_MATCHING_BACKEND!r}"
+    )
+
+rider_repo = PostgresRiderRepository(engine=engine)
+alias_repo = PostgresRiderAliasRepository(engine=engine)
+# Shared by every request; rebuilt only when the riders table changes.
+rider_index = RiderIndex(rider_repo)
+rider_matcher: Optional[RiderNameMatcher] = (
+    PostgresRiderNameMatcher(engine=engine)
+    if RIDER_MATCHING_BACKEND == "postgres"
+    else None
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    if rider_matcher is not None:
+        # Names are matched in the database; there is no index to build.
+        yield
+        return
+    try:
+        await run_in_threadpool(rider_index.warm)
+    except Exception:
+        # Serve anyway: /ready reports the index cold and the first
+        # request builds it.
+        logger.exception("rider_index_warm_failed")
+    yield
+
+
 app = FastAPI(
     title="ProCycling Scraper & Analyzer API",
     description="API for processing and analyzing cyclist data.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
@@ -24,9 +74,12 @@ app = FastAPI(
 def process_cyclists(
     request_data: AnalysisRequestDTO,
 ) -> Dict[str, Any]:
-    rider_repo = PostgresRiderRepository(engine=engine)
-
-    use_case = ProcessCyclistsUseCase(rider_repository=rider_repo)
+    use_case = ProcessCyclistsUseCase(
+        rider_repository=rider_repo,
+        rider_index=rider_index,
+        alias_repository=alias_repo,
+        rider_matcher=rider_matcher,
+    )
 
     result = use_case.execute(request_data=request_data)
     return result
@@ -37,3 +90,14 @@ def process_cyclists(
 def health() -> dict:
     """Health endpoint used by both clients and kamal-proxy."""
     return {"status": "ok"}
+
+
+@app.get("/ready")
+def ready(response: Response) -> dict:
+    """Readiness: 503 until the rider matching index has been built."""
+    if rider_matcher is not None:
+        return {"status": "ready", "backend": RIDER_MATCHING_BACKEND}
+    status = rider_index.status()
+    if not status.warm:
+        response.status_code = 503
+    return {"status": "ready" if status.warm else "warming", **asdict(status)}
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from procycling_scraper.scraping.domain.entities.classification import (
+    ClassificationType,
+)
+
+
+@dataclass(frozen=True)
+class FetchedPage:
+    """
+    A Data Transfer Object holding a classification page that has been
+    downloaded but not parsed yet.
+
+    Attributes:
+        classification_type (ClassificationType): The classification the
+            page lists.
+        stage_number (Optional[int]): The stage number, if type is STAGE.
+        html (str): The page as served.
+        riders_only (bool): Whether only the riders of the page are kept and
+            its classification is not stored, as for the entry page of a
+            stage race without a classification nav.
+    """
+
+    classification_type: ClassificationType
+    stage_number: Optional[int]
+    html: str
+    riders_only: bool = False
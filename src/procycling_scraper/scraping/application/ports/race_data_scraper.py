@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import AbstractSet, Tuple
 
 from procycling_scraper.scraping.application.dto.scraped_race_data import (
     ScrapedRaceData,
@@ -13,10 +13,17 @@ class RaceDataScraper(ABC):
     """
 
     @abstractmethod
-    def scrape(self, race_info: Tuple[str, RaceType]) -> ScrapedRaceData:
+    def scrape(
+        self,
+        race_info: Tuple[str, RaceType],
+        known_stages: AbstractSet[int] = frozenset(),
+    ) -> ScrapedRaceData:
         """
         Scrapes a race URL and returns a ScrapedRaceData DTO containing:
         - The fully constituted Race aggregate.
         - A list of all unique Rider entities found.
+
+        Stage classifications whose number is in ``known_stages`` are already
+        persisted (stage results are final) and are not fetched again.
         """
         pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from procycling_scraper.scraping.domain.entities.race import RaceType
 
@@ -17,3 +17,12 @@ class RaceListScraper(ABC):
         - The type of the race (RaceType.ONE_DAY or RaceType.STAGE_RACE).
         """
         pass
+
+    def scrape_many(
+        self, years: Iterable[int]
+    ) -> Dict[int, List[Tuple[str, RaceType]]]:
+        """
+        Scrapes the race lists of several seasons, keyed by year.
+        Implementations may fetch them concurrently.
+        """
+        return {year: self.scrape(year) for year in years}
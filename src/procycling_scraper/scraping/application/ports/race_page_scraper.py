@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import AbstractSet, Iterator, List, Tuple
+
+from procycling_scraper.scraping.application.dto.fetched_page import FetchedPage
+from procycling_scraper.scraping.domain.entities.classification import Classification
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+
+
+class RacePageScraper(ABC):
+    """
+    Interface for a race scraper split into a network stage and a parsing
+    stage, so that a pipeline can run them concurrently.
+    """
+
+    @abstractmethod
+    def fetch_pages(
+        self,
+        race_info: Tuple[str, RaceType],
+        known_stages: AbstractSet[int] = frozenset(),
+    ) -> Tuple[Race, Iterator[FetchedPage]]:
+        """
+        Fetches the entry page of a race and returns the Race, without
+        classifications, along with an iterator that downloads its
+        classification pages one at a time as it is consumed. Stages in
+        ``known_stages`` are not fetched.
+        """
+        pass
+
+    @abstractmethod
+    def parse_page(self, page: FetchedPage) -> Tuple[Classification, List[Rider]]:
+        """
+        Parses a fetched page into its classification and the riders that
+        scored in it.
+        """
+        pass
@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.domain.entities.race_work_item import RaceWorkItem
+
+
+class RaceWorkQueue(ABC):
+    """
+    Interface for a work queue of races shared by several worker processes.
+
+    A claimed item is leased to one worker for a limited time. The worker
+    extends the lease with heartbeats while it works; if it dies, the lease
+    expires and the item becomes claimable again.
+    """
+
+    @abstractmethod
+    def enqueue(self, year: int, races_info: List[Tuple[str, RaceType]]) -> int:
+        """
+        Queues the races of ``year``. Races already queued, leased or done
+        are left alone; failed ones are queued again with a fresh attempt
+        budget. Returns the number of races (re)queued.
+        """
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[RaceWorkItem]:
+        """
+        Atomically leases the next queued race to ``worker_id``, or returns
+        None when nothing is claimable.
+        """
+        pass
+
+    @abstractmethod
+    def heartbeat(self, item_id: UUID, worker_id: str, lease_seconds: float) -> bool:
+        """
+        Extends the lease of an item held by ``worker_id``. Returns False if
+        the lease has been lost (expired and reclaimed).
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, item_id: UUID, worker_id: str) -> None:
+        """Marks an item held by ``worker_id`` as DONE."""
+        pass
+
+    @abstractmethod
+    def fail(
+        self, item_id: UUID, worker_id: str, error: str, max_attempts: int
+    ) -> None:
+        """
+        Releases an item held by ``worker_id`` after a failed attempt: it is
+        queued again, or marked FAILED once ``max_attempts`` is reached.
+        """
+        pass
+
+    @abstractmethod
+    def reclaim_expired(self, max_attempts: int) -> int:
+        """
+        Releases items whose lease has expired, as ``fail`` would. Returns the
+        number of items reclaimed.
+        """
+        pass
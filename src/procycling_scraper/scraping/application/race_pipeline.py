@@ -0,0 +1,386 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from procycling_scraper.scraping.application.ports.race_page_scraper import (
+    RacePageScraper,
+)
+from procycling_scraper.scraping.domain.entities.classification import (
+    Classification,
+    ClassificationType,
+)
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+from procycling_scraper.scraping.domain.repositories.race_repository import (
+    RaceRepository,
+)
+from procycling_scraper.scraping.domain.repositories.rider_repository import (
+    RiderRepository,
+)
+
+log = logging.getLogger(__name__)
+
+RaceInfo = Tuple[str, RaceType]
+ParsedPage = Tuple[Classification, List[Rider]]
+
+STAGES = ("fetch", "parse", "persist")
+
+# Tells a stage worker that its input is exhausted.
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """
+    Sizes of the stages of a ``RacePipeline``.
+
+    Attributes:
+        fetchers (int): Threads downloading pages, each one race at a time.
+        parsers (int): Threads parsing downloaded pages.
+        persisters (int): Threads writing classifications to the database.
+        queue_size (int): Capacity of each queue between two stages. A full
+            queue blocks the stage feeding it, which bounds memory when a
+            later stage (typically the database) falls behind.
+    """
+
+    fetchers: int = 4
+    parsers: int = 2
+    persisters: int = 2
+    queue_size: int = 64
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """
+    What one stage of a pipeline run did.
+
+    Attributes:
+        stage (str): "fetch", "parse" or "persist".
+        workers (int): Threads of the stage.
+        items (int): Pages fetched, pages parsed or classifications written.
+        errors (int): Items that failed in this stage.
+        busy_s (float): Time the workers spent working, summed over workers.
+        blocked_s (float): Time the workers waited for room in the next
+            queue (backpressure), summed over workers.
+        items_per_s (float): Items per second of wall-clock run time.
+        max_queue_depth (int): Deepest the queue feeding the stage got.
+        avg_queue_depth (float): Mean depth of that queue, sampled at every
+            enqueue.
+    """
+
+    stage: str
+    workers: int
+    items: int
+    errors: int
+    busy_s: float
+    blocked_s: float
+    items_per_s: float
+    max_queue_depth: int
+    avg_queue_depth: float
+
+
+@dataclass
+class _StageCounters:
+    items: int = 0
+    errors: int = 0
+    busy: float = 0.0
+    blocked: float = 0.0
+    enqueued: int = 0
+    depth_sum: int = 0
+    max_depth: int = 0
+
+
+@dataclass
+class _RaceRun:
+    """Progress of one race through the stages; guarded by the pipeline lock."""
+
+    race_info: RaceInfo
+    race: Optional[Race] = None
+    fetched_all: bool = False
+    in_flight: int = 0
+    persisted: int = 0
+    final_gc: Optional[ParsedPage] = None
+    error: Optional[str] = None
+    finished: bool = False
+
+
+class RacePipeline:
+    """
+    Scrapes races through three stages connected by bounded queues.
+
+    Fetchers download the pages of one race after another and queue them
+    raw; parsers turn them into classifications; persisters write every
+    classification, with its riders, as soon as it is parsed instead of
+    waiting for the whole race. Each stage has its own number of threads,
+    and because the queues are bounded a slow stage holds back the ones
+    before it rather than letting pages pile up in memory.
+
+    A race succeeds once all its pages are persisted. Its general
+    classification is held back and written last, so that a race
+    interrupted half way is never taken for complete by ``incremental``
+    runs. The first error in any stage fails the race; its remaining pages
+    are dropped.
+    """
+
+    def __init__(
+        self,
+        page_scraper: RacePageScraper,
+        race_repository: RaceRepository,
+        rider_repository: RiderRepository,
+        known_stages: Callable[[RaceInfo], Optional[FrozenSet[int]]] = (
+            lambda race_info: frozenset()
+        ),
+        config: PipelineConfig = PipelineConfig(),
+    ):
+        if min(config.fetchers, config.parsers, config.persisters) < 1:
+            raise ValueError("every pipeline stage needs at least one worker")
+        if config.queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self._page_scraper = page_scraper
+        self._race_repository = race_repository
+        self._rider_repository = rider_repository
+        self._known_stages = known_stages
+        self._config = config
+        self._lock = threading.Lock()
+        self._counters: Dict[str, _StageCounters] = {}
+        self._on_race_done: Callable[[RaceInfo, Optional[str]], None] = (
+            lambda race_info, error: None
+        )
+
+    def run(
+        self,
+        races_info: Iterable[RaceInfo],
+        on_race_done: Callable[[RaceInfo, Optional[str]], None],
+    ) -> List[StageStats]:
+        """
+        Scrapes ``races_info`` and returns the statistics of each stage.
+        ``on_race_done`` is called once per race, from a pipeline thread,
+        with the error message of a failed race or None.
+        """
+        config = self._config
+        self._on_race_done = on_race_done
+        self._counters = {stage: _StageCounters() for stage in STAGES}
+        races: "queue.Queue[object]" = queue.Queue()
+        pages: "queue.Queue[object]" = queue.Queue(maxsize=config.queue_size)
+        parsed: "queue.Queue[object]" = queue.Queue(maxsize=config.queue_size)
+        for race_info in races_info:
+            self._put("fetch", races, race_info)
+        for _ in range(config.fetchers):
+            races.put(_DONE)
+
+        started = time.perf_counter()
+        fetchers = self._start("fetch", config.fetchers, self._fetch, races, pages)
+        parsers = self._start("parse", config.parsers, self._parse, pages, parsed)
+        persisters = self._start("persist", config.persisters, self._persist, parsed)
+        for worker in fetchers:
+            worker.join()
+        self._close(pages, len(parsers))
+        for worker in parsers:
+            worker.join()
+        self._close(parsed, len(persisters))
+        for worker in persisters:
+            worker.join()
+        return self._stats(time.perf_counter() - started)
+
+    def _start(self, stage: str, count: int, target, *args) -> List[threading.Thread]:
+        workers = [
+            threading.Thread(target=target, args=args, name=f"pipeline-{stage}-{n}")
+            for n in range(count)
+        ]
+        for worker in workers:
+            worker.start()
+        return workers
+
+    @staticmethod
+    def _close(stage_queue: "queue.Queue[object]", workers: int) -> None:
+        for _ in range(workers):
+            stage_queue.put(_DONE)
+
+    def _fetch(self, races: "queue.Queue[object]", pages: "queue.Queue[object]"):
+        while True:
+            race_info = races.get()
+            if race_info is _DONE:
+                return
+            self._fetch_race(race_info, pages)  # type: ignore[arg-type]
+
+    def _fetch_race(self, race_info: RaceInfo, pages: "queue.Queue[object]") -> None:
+        log.info(
+            "Processing race info",
+            extra={"race_url": race_info[0], "race_type": race_info[1].value},
+        )
+        run = _RaceRun(race_info)
+        counters = self._counters["fetch"]
+        try:
+            known_stages = self._known_stages(race_info)
+            if known_stages is None:
+                run.finished = True
+                self._on_race_done(race_info, None)
+                return
+            started = time.perf_counter()
+            run.race, fetched = self._page_scraper.fetch_pages(race_info, known_stages)
+            for page in fetched:
+                with self._lock:
+                    counters.items += 1
+                    counters.busy += time.perf_counter() - started
+                    run.in_flight += 1
+                self._put("parse", pages, (run, page), blocking_stage="fetch")
+                started = time.perf_counter()
+        except Exception as e:
+            self._fail(run, "fetch", e)
+        finally:
+            with self._lock:
+                run.fetched_all = True
+            self._maybe_finish(run)
+
+    def _parse(self, pages: "queue.Queue[object]", parsed: "queue.Queue[object]"):
+        counters = self._counters["parse"]
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            run, page = item  # type: ignore[misc]
+            if run.error is not None:
+                self._release(run)
+                continue
+            started = time.perf_counter()
+            try:
+                classification, riders = self._page_scraper.parse_page(page)
+            except Exception as e:
+                self._fail(run, "parse", e)
+                self._release(run)
+                continue
+            with self._lock:
+                counters.items += 1
+                counters.busy += time.perf_counter() - started
+            self._put(
+                "persist",
+                parsed,
+                (run, None if page.riders_only else classification, riders),
+                blocking_stage="parse",
+            )
+
+    def _persist(self, parsed: "queue.Queue[object]"):
+        while True:
+            item = parsed.get()
+            if item is _DONE:
+                return
+            run, classification, riders = item  # type: ignore[misc]
+            try:
+                if run.error is not None:
+                    continue
+                if (
+                    classification is not None
+                    and classification.classification_type == ClassificationType.GENERAL
+                ):
+                    with self._lock:
+                        run.final_gc = (classification, riders)
+                    continue
+                self._save(run, classification, riders)
+            except Exception as e:
+                self._fail(run, "persist", e)
+            finally:
+                self._release(run)
+
+    def _save(
+        self,
+        run: _RaceRun,
+        classification: Optional[Classification],
+        riders: List[Rider],
+    ) -> None:
+        assert run.race is not None
+        started = time.perf_counter()
+        rider_id_map = self._rider_repository.save_many(riders)
+        # Saving a race merges into what is stored, so each classification
+        # is written on its own.
+        classifications = [classification] if classification else []
+        self._race_repository.save(
+            replace(run.race, classifications=classifications), rider_id_map
+        )
+        counters = self._counters["persist"]
+        with self._lock:
+            counters.busy += time.perf_counter() - started
+            if classification:
+                counters.items += 1
+                run.persisted += 1
+
+    def _release(self, run: _RaceRun) -> None:
+        with self._lock:
+            run.in_flight -= 1
+        self._maybe_finish(run)
+
+    def _fail(self, run: _RaceRun, stage: str, error: Exception) -> None:
+        log.exception(
+            "Failed to process race",
+            extra={"race_url": run.race_info[0], "stage": stage, "error": str(error)},
+        )
+        with self._lock:
+            self._counters[stage].errors += 1
+            if run.error is None:
+                run.error = str(error)
+
+    def _maybe_finish(self, run: _RaceRun) -> None:
+        """Completes ``run`` once it has been fetched and nothing is in flight."""
+        with self._lock:
+            if run.finished or not run.fetched_all or run.in_flight:
+                return
+            run.finished = True
+        if run.error is None:
+            try:
+                if run.final_gc is not None:
+                    self._save(run, *run.final_gc)
+                elif not run.persisted:
+                    self._save(run, None, [])
+            except Exception as e:
+                self._fail(run, "persist", e)
+        if run.error is None:
+            log.info(
+                "Successfully processed race",
+                extra={"race_url": run.race_info[0], "classifications": run.persisted},
+            )
+        self._on_race_done(run.race_info, run.error)
+
+    def _put(
+        self,
+        stage: str,
+        stage_queue: "queue.Queue[object]",
+        item: object,
+        blocking_stage: Optional[str] = None,
+    ) -> None:
+        """Queues ``item`` for ``stage``, charging any wait to ``blocking_stage``."""
+        started = time.perf_counter()
+        stage_queue.put(item)
+        waited = time.perf_counter() - started
+        depth = stage_queue.qsize()
+        with self._lock:
+            counters = self._counters[stage]
+            counters.enqueued += 1
+            counters.depth_sum += depth
+            counters.max_depth = max(counters.max_depth, depth)
+            if blocking_stage:
+                self._counters[blocking_stage].blocked += waited
+
+    def _stats(self, elapsed: float) -> List[StageStats]:
+        workers = {
+            "fetch": self._config.fetchers,
+            "parse": self._config.parsers,
+            "persist": self._config.persisters,
+        }
+        return [
+            StageStats(
+                stage=stage,
+                workers=workers[stage],
+                items=c.items,
+                errors=c.errors,
+                busy_s=round(c.busy, 3),
+                blocked_s=round(c.blocked, 3),
+                items_per_s=round(c.items / elapsed, 2) if elapsed else 0.0,
+                max_queue_depth=c.max_depth,
+                avg_queue_depth=(
+                    round(c.depth_sum / c.enqueued, 2) if c.enqueued else 0.0
+                ),
+            )
+            for stage, c in self._counters.items()
+        ]
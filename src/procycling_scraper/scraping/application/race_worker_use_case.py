@@ -0,0 +1,158 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from procycling_scraper.scraping.application.ports.race_work_queue import (
+    RaceWorkQueue,
+)
+from procycling_scraper.scraping.application.scrape_race_use_case import (
+    ScrapeRaceUseCase,
+)
+from procycling_scraper.scraping.domain.entities.race_work_item import RaceWorkItem
+
+log = logging.getLogger(__name__)
+
+
+class RaceWorkerUseCase:
+    """
+    Claims races from the shared work queue and scrapes them until stopped.
+
+    Any number of worker processes, on any number of machines, can run
+    against the same queue; each runs ``concurrency`` claim loops. While a
+    race is being processed its lease is renewed every
+    ``heartbeat_interval`` seconds, and leases left behind by crashed
+    workers are reclaimed after ``lease_seconds``. A failing race goes back
+    on the queue until it has been attempted ``max_attempts`` times.
+    """
+
+    def __init__(
+        self,
+        work_queue: RaceWorkQueue,
+        scrape_race: ScrapeRaceUseCase,
+        worker_id: str,
+        concurrency: int = 1,
+        lease_seconds: float = 300.0,
+        heartbeat_interval: float = 60.0,
+        poll_interval: float = 5.0,
+        max_attempts: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if heartbeat_interval >= lease_seconds:
+            raise ValueError("heartbeat_interval must be shorter than lease_seconds")
+        self._work_queue = work_queue
+        self._scrape_race = scrape_race
+        self._worker_id = worker_id
+        self._concurrency = concurrency
+        self._lease_seconds = lease_seconds
+        self._heartbeat_interval = heartbeat_interval
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._clock = clock
+        self._stop = threading.Event()
+        self._reclaim_lock = threading.Lock()
+        self._last_reclaim = float("-inf")
+
+    def run(self, drain: bool = False) -> int:
+        """
+        Processes races until ``stop`` is called or, with ``drain``, until no
+        race is left to claim. Returns the number of races processed.
+        """
+        log.info(
+            "Worker started",
+            extra={"worker_id": self._worker_id, "concurrency": self._concurrency},
+        )
+        slots = [f"{self._worker_id}/{n}" for n in range(self._concurrency)]
+        with ThreadPoolExecutor(
+            max_workers=self._concurrency, thread_name_prefix="scrape-worker"
+        ) as executor:
+            processed = sum(executor.map(lambda slot: self._work(slot, drain), slots))
+        log.info(
+            "Worker stopped",
+            extra={"worker_id": self._worker_id, "processed": processed},
+        )
+        return processed
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _work(self, slot_id: str, drain: bool) -> int:
+        processed = 0
+        while not self._stop.is_set():
+            self._reclaim_expired()
+            item = self._work_queue.claim(slot_id, self._lease_seconds)
+            if item is None:
+                # Nothing queued: leases that expired meanwhile are the only
+                # work left, so look for them before idling or exiting.
+                if self._reclaim_expired(force=True):
+                    continue
+                if drain:
+                    break
+                self._stop.wait(self._poll_interval)
+                continue
+            self._process(slot_id, item)
+            processed += 1
+        return processed
+
+    def _process(self, slot_id: str, item: RaceWorkItem) -> None:
+        started = self._clock()
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(slot_id, item, done),
+            name=f"heartbeat-{slot_id}",
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            self._scrape_race.execute(item.race_info)
+        except Exception as e:
+            log.exception(
+                "Failed to process race",
+                extra={
+                    "race_url": item.race_pcs_id,
+                    "attempt": item.attempts,
+                    "error": str(e),
+                },
+            )
+            self._work_queue.fail(item.id, slot_id, str(e), self._max_attempts)
+        else:
+            self._work_queue.complete(item.id, slot_id)
+            log.info(
+                "Work item done",
+                extra={
+                    "race_url": item.race_pcs_id,
+                    "worker_id": slot_id,
+                    "elapsed_s": round(self._clock() - started, 3),
+                },
+            )
+        finally:
+            done.set()
+            heartbeat.join()
+
+    def _heartbeat(self, slot_id: str, item: RaceWorkItem, done: threading.Event):
+        while not done.wait(self._heartbeat_interval):
+            if not self._work_queue.heartbeat(item.id, slot_id, self._lease_seconds):
+                log.warning(
+                    "Lost lease on work item",
+                    extra={"race_url": item.race_pcs_id, "worker_id": slot_id},
+                )
+                return
+
+    def _reclaim_expired(self, force: bool = False) -> int:
+        """Reclaims expired leases, at most once per lease period unless forced."""
+        with self._reclaim_lock:
+            now = self._clock()
+            if not force and now - self._last_reclaim < self._lease_seconds:
+                return 0
+            self._last_reclaim = now
+        reclaimed = self._work_queue.reclaim_expired(self._max_attempts)
+        if reclaimed:
+            log.warning(
+                "Reclaimed expired work item leases",
+                extra={"worker_id": self._worker_id, "reclaimed": reclaimed},
+            )
+        return reclaimed
@@ -0,0 +1,82 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class ScrapeProgress:
+    """
+    Where a scrape run stands.
+
+    Attributes:
+        total (int): Races the run has to process.
+        done (int): Races processed so far, failed ones included.
+        failed (int): Races that failed.
+        elapsed_s (float): Seconds since the run started.
+        eta_s (Optional[float]): Estimated seconds left at the average pace
+            so far; None until the first race is processed.
+    """
+
+    total: int
+    done: int
+    failed: int
+    elapsed_s: float
+    eta_s: Optional[float]
+
+    @property
+    def percent(self) -> float:
+        return 100.0 * self.done / self.total if self.total else 100.0
+
+
+class ProgressTracker:
+    """
+    Counts processed races and reports a ``ScrapeProgress`` to
+    ``on_progress`` at most every ``interval`` seconds, and always for the
+    last race. Safe to call from the worker threads of a run.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        on_progress: Callable[[ScrapeProgress], None],
+        interval: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._total = total
+        self._on_progress = on_progress
+        self._interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started = clock()
+        self._last_report: Optional[float] = None
+        self._done = 0
+        self._failed = 0
+
+    def race_done(self, succeeded: bool) -> None:
+        with self._lock:
+            self._done += 1
+            if not succeeded:
+                self._failed += 1
+            now = self._clock()
+            due = (
+                self._last_report is None
+                or now - self._last_report >= self._interval
+                or self._done >= self._total
+            )
+            if not due:
+                return
+            self._last_report = now
+            progress = self._snapshot(now)
+        self._on_progress(progress)
+
+    def _snapshot(self, now: float) -> ScrapeProgress:
+        elapsed = now - self._started
+        remaining = max(self._total - self._done, 0)
+        return ScrapeProgress(
+            total=self._total,
+            done=self._done,
+            failed=self._failed,
+            elapsed_s=elapsed,
+            eta_s=elapsed / self._done * remaining if self._done else None,
+        )
@@ -0,0 +1,112 @@
+import logging
+from typing import FrozenSet, Optional, Tuple
+
+from procycling_scraper.scraping.application.dto.scraped_race_data import (
+    ScrapedRaceData,
+)
+from procycling_scraper.scraping.application.ports.race_data_scraper import (
+    RaceDataScraper,
+)
+from procycling_scraper.scraping.domain.entities.classification import (
+    ClassificationType,
+)
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.repositories.race_repository import (
+    RaceRepository,
+)
+from procycling_scraper.scraping.domain.repositories.rider_repository import (
+    RiderRepository,
+)
+
+log = logging.getLogger(__name__)
+
+
+class ScrapeRaceUseCase:
+    """
+    Scrapes a single race and persists its riders and classifications.
+
+    This is the unit of work shared by the per-year scrape and the queue
+    workers. Errors are not swallowed here: callers decide whether a failed
+    race is logged, journaled or put back on a queue.
+
+    In ``incremental`` mode races whose final classification is already
+    persisted are skipped, and for stage races still in progress only the
+    stages not yet stored are fetched.
+    """
+
+    def __init__(
+        self,
+        race_data_scraper: RaceDataScraper,
+        race_repository: RaceRepository,
+        rider_repository: RiderRepository,
+        incremental: bool = False,
+    ):
+        self._race_data_scraper = race_data_scraper
+        self._race_repository = race_repository
+        self._rider_repository = rider_repository
+        self._incremental = incremental
+
+    def execute(self, race_info: Tuple[str, RaceType]) -> None:
+        log.info(
+            "Processing race info",
+            extra={"race_url": race_info[0], "race_type": race_info[1].value},
+        )
+
+        known_stages = self.known_stages(race_info)
+        if known_stages is None:
+            return
+
+        scraped_data: ScrapedRaceData = self._race_data_scraper.scrape(
+            race_info, known_stages
+        )
+
+        if "Scraping Failed" in scraped_data.race.name:
+            raise RuntimeError("Race page could not be scraped")
+
+        log.info(
+            f"  -> Found {len(scraped_data.riders)} riders with points in this race. Saving to DB..."
+        )
+        rider_id_map = self._rider_repository.save_many(scraped_data.riders)
+
+        self._race_repository.save(scraped_data.race, rider_id_map)
+
+        log.info(
+            "Successfully processed race",
+            extra={"race_url": race_info[0], "race_type": race_info[1].value},
+        )
+
+    def known_stages(self, race_info: Tuple[str, RaceType]) -> Optional[FrozenSet[int]]:
+        """
+        Returns the stages of ``race_info`` already persisted, which need not
+        be fetched again, or None when the whole race is persisted and can be
+        skipped. Outside ``incremental`` mode nothing is known.
+        """
+        if not self._incremental:
+            return frozenset()
+        stored_race = self._race_repository.find_by_pcs_id(race_info[0])
+        if stored_race is None:
+            return frozenset()
+        if self._is_complete(stored_race):
+            log.info(
+                "Skipping already persisted race",
+                extra={"race_url": race_info[0]},
+            )
+            return None
+        return self._stored_stages(stored_race)
+
+    @staticmethod
+    def _is_complete(race: Race) -> bool:
+        """A race is complete once its (final) GC has been stored with results."""
+        return any(
+            c.classification_type == ClassificationType.GENERAL and c.results
+            for c in race.classifications
+        )
+
+    @staticmethod
+    def _stored_stages(race: Race) -> FrozenSet[int]:
+        return frozenset(
+            c.stage_number
+            for c in race.classifications
+            if c.classification_type == ClassificationType.STAGE
+            and c.stage_number is not None
+        )
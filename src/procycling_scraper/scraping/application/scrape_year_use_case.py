@@ -1,22 +1,43 @@
 import logging
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
 
-from procycling_scraper.scraping.application.dto.scraped_race_data import (
-    ScrapedRaceData,
-)
 from procycling_scraper.scraping.application.ports.race_data_scraper import (
     RaceDataScraper,
 )
 from procycling_scraper.scraping.application.ports.race_list_scraper import (
     RaceListScraper,
 )
+from procycling_scraper.scraping.application.ports.race_page_scraper import (
+    RacePageScraper,
+)
+from procycling_scraper.scraping.application.race_pipeline import (
+    PipelineConfig,
+    RacePipeline,
+)
+from procycling_scraper.scraping.application.scrape_progress import (
+    ProgressTracker,
+    ScrapeProgress,
+)
+from procycling_scraper.scraping.application.scrape_race_use_case import (
+    ScrapeRaceUseCase,
+)
 from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.domain.entities.scrape_job import (
+    ScrapeItemStatus,
+    ScrapeJob,
+)
 from procycling_scraper.scraping.domain.repositories.race_repository import (
     RaceRepository,
 )
 from procycling_scraper.scraping.domain.repositories.rider_repository import (
     RiderRepository,
 )
+from procycling_scraper.scraping.domain.repositories.scrape_job_repository import (
+    ScrapeJobRepository,
+)
 
 log = logging.getLogger(__name__)
 
@@ -24,6 +45,27 @@ log = logging.getLogger(__name__)
 class ScrapeYearUseCase:
     """
     This class represents the "Scrape and Persist Race Data for a Year" use case.
+
+    Races are independent of each other, so with ``concurrency`` greater than
+    one they are fetched and persisted by a bounded pool of worker threads.
+    A failing race is logged and skipped without affecting the others.
+    Each race is handled by ``ScrapeRaceUseCase``, including ``incremental``
+    mode.
+
+    With a ``pipeline`` config races go through a ``RacePipeline`` instead:
+    fetching, parsing and persisting run as separate stages, classifications
+    are written as they are parsed and ``concurrency`` is replaced by the
+    per-stage sizes. The race data scraper must then also be a
+    ``RacePageScraper``.
+
+    With a ``job_repository`` every run is journaled as a scrape job: the
+    outcome of each race is checkpointed as it completes, an interrupted run
+    of the same year resumes with the races still pending, and races that
+    failed can be reprocessed on their own with ``retry_failed``.
+
+    ``execute_range`` scrapes several seasons as one run: their race lists
+    are fetched together and all their races share the same workers. With
+    ``on_progress`` the run reports a ``ScrapeProgress`` as races complete.
     """
 
     def __init__(
@@ -32,11 +74,35 @@ class ScrapeYearUseCase:
         race_data_scraper: RaceDataScraper,
         race_repository: RaceRepository,
         rider_repository: RiderRepository,
+        concurrency: int = 1,
+        incremental: bool = False,
+        job_repository: Optional[ScrapeJobRepository] = None,
+        pipeline: Optional[PipelineConfig] = None,
+        on_progress: Optional[Callable[[ScrapeProgress], None]] = None,
+        progress_interval: float = 10.0,
     ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
         self._race_list_scraper = race_list_scraper
-        self._race_data_scraper = race_data_scraper
-        self._race_repository = race_repository
-        self._rider_repository = rider_repository
+        self._scrape_race = ScrapeRaceUseCase(
+            race_data_scraper, race_repository, rider_repository, incremental
+        )
+        self._concurrency = concurrency
+        self._job_repository = job_repository
+        self._on_progress = on_progress
+        self._progress_interval = progress_interval
+        self._progress: Optional[ProgressTracker] = None
+        self._pipeline: Optional[RacePipeline] = None
+        if pipeline is not None:
+            if not isinstance(race_data_scraper, RacePageScraper):
+                raise ValueError("the pipeline needs a RacePageScraper")
+            self._pipeline = RacePipeline(
+                race_data_scraper,
+                race_repository,
+                rider_repository,
+                known_stages=self._scrape_race.known_stages,
+                config=pipeline,
+            )
 
     def execute(self, year: int) -> None:
         """
@@ -44,40 +110,212 @@ class ScrapeYearUseCase:
         """
         log.info(f"Executing use case: Scrape and Persist for year {year}...")
 
-        races_info: List[Tuple[str, RaceType]] = self._race_list_scraper.scrape(year)
-        log.info(f"Found {len(races_info)} races to scrape.")
+        if self._job_repository is None:
+            self._process_races(self._race_list_scraper.scrape(year))
+            log.info(f"Finished use case for year {year}.")
+            return
 
-        for race_info in races_info:
-            try:
-                log.info(
-                    "Processing race info",
-                    extra={"race_url": race_info[0], "race_type": race_info[1].value},
-                )
+        job = self._job_repository.find_open_by_year(year)
+        if job is not None:
+            log.info(
+                "Resuming interrupted scrape job",
+                extra={"job_id": str(job.id), "year": year},
+            )
+        else:
+            job = self._job_repository.create(
+                year, self._race_list_scraper.scrape(year)
+            )
 
-                scraped_data: ScrapedRaceData = self._race_data_scraper.scrape(
-                    race_info
-                )
+        pending = self._pending_races(job)
+        failed = self._process_races(pending, {info[0]: job.id for info in pending})
+        self._job_repository.finish(job.id)
 
-                if "Scraping Failed" in scraped_data.race.name:
+        log.info(
+            f"Finished use case for year {year}.",
+            extra={"job_id": str(job.id), "failed_races": failed},
+        )
+
+    def execute_range(self, years: Iterable[int]) -> None:
+        """
+        Scrapes the seasons ``years`` as one run. The race lists of the
+        seasons without an interrupted job to resume are fetched together;
+        then the races of every season, each listed once, go through the
+        same workers. Each season is still journaled as a job of its own.
+        """
+        years = list(years)
+        log.info(f"Executing use case: Scrape and Persist for years {years}...")
+
+        jobs: Dict[int, ScrapeJob] = {}
+        if self._job_repository is not None:
+            for year in years:
+                job = self._job_repository.find_open_by_year(year)
+                if job is not None:
+                    log.info(
+                        "Resuming interrupted scrape job",
+                        extra={"job_id": str(job.id), "year": year},
+                    )
+                    jobs[year] = job
+        race_lists = self._race_list_scraper.scrape_many(
+            [year for year in years if year not in jobs]
+        )
+
+        races_info: List[Tuple[str, RaceType]] = []
+        job_ids: Dict[str, UUID] = {}
+        seen: Set[str] = set()
+        for year in years:
+            if self._job_repository is None:
+                season = race_lists[year]
+            else:
+                if year not in jobs:
+                    jobs[year] = self._job_repository.create(year, race_lists[year])
+                season = self._pending_races(jobs[year])
+            for race_info in season:
+                if race_info[0] in seen:
                     continue
+                seen.add(race_info[0])
+                races_info.append(race_info)
+                if year in jobs:
+                    job_ids[race_info[0]] = jobs[year].id
 
-                log.info(
-                    f"  -> Found {len(scraped_data.riders)} riders with points in this race. Saving to DB..."
-                )
-                for rider in scraped_data.riders:
-                    self._rider_repository.save(rider)
+        failed = self._process_races(races_info, job_ids)
+        if self._job_repository is not None:
+            for job in jobs.values():
+                self._job_repository.finish(job.id)
 
-                self._race_repository.save(scraped_data.race)
+        log.info(
+            f"Finished use case for years {years}.",
+            extra={"failed_races": failed},
+        )
 
-                log.info(
-                    "Successfully processed race",
-                    extra={"race_url": race_info[0], "race_type": race_info[1].value},
-                )
+    def retry_failed(self, year: int) -> None:
+        """
+        Reprocesses only the races that failed in the latest scrape job of
+        ``year``.
+        """
+        if self._job_repository is None:
+            raise ValueError("retry_failed requires a job repository")
+
+        job = self._job_repository.find_latest_by_year(year)
+        if job is None:
+            log.warning(f"No scrape job found for year {year}.")
+            return
+
+        failed = job.items_with_status(ScrapeItemStatus.FAILED)
+        log.info(
+            f"Retrying {len(failed)} failed races.",
+            extra={"job_id": str(job.id), "year": year},
+        )
+        races_info = [item.race_info for item in failed]
+        still_failing = self._process_races(
+            races_info, {info[0]: job.id for info in races_info}
+        )
+        log.info(
+            f"Finished retrying failed races for year {year}.",
+            extra={"job_id": str(job.id), "failed_races": still_failing},
+        )
+
+    @staticmethod
+    def _pending_races(job: ScrapeJob) -> List[Tuple[str, RaceType]]:
+        return [
+            item.race_info for item in job.items_with_status(ScrapeItemStatus.PENDING)
+        ]
+
+    def _process_races(
+        self,
+        races_info: List[Tuple[str, RaceType]],
+        job_ids: Optional[Dict[str, UUID]] = None,
+    ) -> int:
+        """
+        Processes ``races_info`` and returns how many of them failed. The
+        outcome of each race is checkpointed to its job in ``job_ids``,
+        keyed by race URL.
+        """
+        log.info(
+            f"Found {len(races_info)} races to scrape.",
+            extra={"concurrency": self._concurrency},
+        )
+        job_ids = job_ids or {}
+        if self._on_progress is not None:
+            self._progress = ProgressTracker(
+                len(races_info), self._on_progress, self._progress_interval
+            )
 
-            except Exception as e:
-                log.exception(
-                    "Failed to process race",
-                    extra={"race_url": race_info[0], "error": str(e)},
+        if self._pipeline is not None:
+            return self._run_pipeline(self._pipeline, races_info, job_ids)
+        if self._concurrency == 1:
+            outcomes = [
+                self._process_race(info, job_ids.get(info[0])) for info in races_info
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self._concurrency, thread_name_prefix="scrape-race"
+            ) as executor:
+                outcomes = list(
+                    executor.map(
+                        lambda info: self._process_race(info, job_ids.get(info[0])),
+                        races_info,
+                    )
                 )
+        return outcomes.count(False)
+
+    def _run_pipeline(
+        self,
+        pipeline: RacePipeline,
+        races_info: List[Tuple[str, RaceType]],
+        job_ids: Dict[str, UUID],
+    ) -> int:
+        failed: List[str] = []
+
+        def on_race_done(race_info: Tuple[str, RaceType], error: Optional[str]):
+            job_id = job_ids.get(race_info[0])
+            if error is None:
+                self._checkpoint(job_id, race_info, ScrapeItemStatus.DONE)
+            else:
+                failed.append(race_info[0])
+                self._checkpoint(job_id, race_info, ScrapeItemStatus.FAILED, error)
+            self._report_progress(error is None)
+
+        for stats in pipeline.run(races_info, on_race_done):
+            log.info("Pipeline stage stats", extra=asdict(stats))
+        return len(failed)
 
-        log.info(f"Finished use case for year {year}.")
+    def _process_race(
+        self, race_info: Tuple[str, RaceType], job_id: Optional[UUID] = None
+    ) -> bool:
+        """Scrapes and persists one race; returns whether it succeeded."""
+        try:
+            self._scrape_race.execute(race_info)
+        except Exception as e:
+            log.exception(
+                "Failed to process race",
+                extra={"race_url": race_info[0], "error": str(e)},
+            )
+            self._checkpoint(job_id, race_info, ScrapeItemStatus.FAILED, str(e))
+            self._report_progress(False)
+            return False
+
+        self._checkpoint(job_id, race_info, ScrapeItemStatus.DONE)
+        self._report_progress(True)
+        return True
+
+    def _report_progress(self, succeeded: bool) -> None:
+        if self._progress is not None:
+            self._progress.race_done(succeeded)
+
+    def _checkpoint(
+        self,
+        job_id: Optional[UUID],
+        race_info: Tuple[str, RaceType],
+        status: ScrapeItemStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        if self._job_repository is None or job_id is None:
+            return
+        try:
+            self._job_repository.record_attempt(job_id, race_info[0], status, error)
+        except Exception as e:
+            # Losing a checkpoint only means the race is redone on resume.
+            log.exception(
+                "Failed to checkpoint race",
+                extra={"race_url": race_info[0], "error": str(e)},
+            )
@@ -1,4 +1,5 @@
 import enum
+import hashlib
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -33,3 +34,20 @@ class Classification:
     classification_type: ClassificationType
     results: List[ResultLine]
     stage_number: Optional[int] = None
+
+    def content_hash(self) -> str:
+        """
+        Returns a SHA-256 hex digest of the results (rider, team, points).
+
+        The digest ignores the order of the results, so re-scraping an
+        unchanged classification always gives the same value; persistence
+        uses it to skip classifications that have not changed.
+        """
+        digest = hashlib.sha256()
+        for line in sorted(
+            self.results, key=lambda r: (r.rider_pcs_id, r.team_name, r.points)
+        ):
+            # Unit and record separators cannot occur in the fields.
+            record = f"{line.rider_pcs_id}\x1f{line.team_name}\x1f{line.points}\x1e"
+            digest.update(record.encode("utf-8"))
+        return digest.hexdigest()
@@ -0,0 +1,40 @@
+import enum
+from dataclasses import dataclass
+from typing import Tuple
+from uuid import UUID
+
+from procycling_scraper.scraping.domain.entities.race import RaceType
+
+
+class WorkItemStatus(enum.Enum):
+    """Lifecycle of a race in the shared work queue."""
+
+    QUEUED = "Queued"
+    LEASED = "Leased"
+    DONE = "Done"
+    FAILED = "Failed"
+
+
+@dataclass(frozen=True)
+class RaceWorkItem:
+    """
+    A race claimed from the work queue by a worker.
+
+    Attributes:
+        id (UUID): The work item identifier.
+        race_pcs_id (str): The race URL path, e.g., "race/tour-de-france/2024".
+        race_type (RaceType): Whether it is a one-day or a stage race.
+        year (int): The season the race was enqueued for.
+        attempts (int): Number of times the item has been claimed, this
+            claim included.
+    """
+
+    id: UUID
+    race_pcs_id: str
+    race_type: RaceType
+    year: int
+    attempts: int
+
+    @property
+    def race_info(self) -> Tuple[str, RaceType]:
+        return self.race_pcs_id, self.race_type
@@ -0,0 +1,70 @@
+import enum
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from procycling_scraper.scraping.domain.entities.race import RaceType
+
+
+class ScrapeJobStatus(enum.Enum):
+    """Lifecycle of a scrape job."""
+
+    RUNNING = "Running"
+    FINISHED = "Finished"
+
+
+class ScrapeItemStatus(enum.Enum):
+    """Outcome of the last attempt at one race of a scrape job."""
+
+    PENDING = "Pending"
+    DONE = "Done"
+    FAILED = "Failed"
+
+
+@dataclass(frozen=True)
+class ScrapeJobItem:
+    """
+    One race of a scrape job and its checkpoint.
+
+    Attributes:
+        race_pcs_id (str): The race URL path, e.g., "race/tour-de-france/2024".
+        race_type (RaceType): Whether it is a one-day or a stage race.
+        status (ScrapeItemStatus): Outcome of the last attempt.
+        attempts (int): How many times the race has been processed.
+        last_error (Optional[str]): Error message of the last failed attempt.
+    """
+
+    race_pcs_id: str
+    race_type: RaceType
+    status: ScrapeItemStatus = ScrapeItemStatus.PENDING
+    attempts: int = 0
+    last_error: Optional[str] = None
+
+    @property
+    def race_info(self) -> Tuple[str, RaceType]:
+        return self.race_pcs_id, self.race_type
+
+
+@dataclass(frozen=False)
+class ScrapeJob:
+    """
+    Journal of one scrape of a season.
+
+    The job lists every race found for the year in scraping order, so an
+    interrupted run can pick up the races still pending and failed races
+    can be retried later on their own.
+
+    Attributes:
+        id (UUID): The job identifier.
+        year (int): The season being scraped.
+        status (ScrapeJobStatus): RUNNING until every race has been attempted.
+        items (List[ScrapeJobItem]): The races of the job, in scraping order.
+    """
+
+    id: UUID
+    year: int
+    status: ScrapeJobStatus = ScrapeJobStatus.RUNNING
+    items: List[ScrapeJobItem] = field(default_factory=list)
+
+    def items_with_status(self, status: ScrapeItemStatus) -> List[ScrapeJobItem]:
+        return [item for item in self.items if item.status == status]
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional
+from uuid import UUID
 
 from procycling_scraper.scraping.domain.entities.race import Race
 
@@ -11,10 +12,13 @@ class RaceRepository(ABC):
     """
 
     @abstractmethod
-    def save(self, race: Race) -> None:
+    def save(self, race: Race, rider_id_map: Optional[Dict[str, UUID]] = None) -> None:
         """
         Saves the entire Race aggregate, including all its Classifications
         and ResultLines. This handles both new and existing races.
+
+        ``rider_id_map`` (pcs_id -> database ID, as returned by
+        ``RiderRepository.save_many``) spares looking the riders up again.
         """
         pass
 
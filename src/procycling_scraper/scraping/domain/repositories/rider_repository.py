@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from uuid import UUID
 
-from procycling_scraper.analysis.application.dto.analysis_dtos import RiderResultDTO
+from procycling_scraper.analysis.application.dto.analysis_dtos import (
+    RiderResultDTO,
+    RiderScoreDTO,
+)
+from procycling_scraper.analysis.domain.value_score_calculator import ScoreWeights
+from procycling_scraper.scraping.domain.entities.race import RaceType
 from procycling_scraper.scraping.domain.entities.rider import Rider
 
 
@@ -20,6 +25,14 @@ class RiderRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_many(self, riders: List[Rider]) -> Dict[str, UUID]:
+        """
+        Saves a batch of Rider entities, inserting the ones that do not exist
+        yet, and returns the database ID of every rider keyed by its pcs_id.
+        """
+        pass
+
     @abstractmethod
     def find_by_pcs_id(self, pcs_id: str) -> Optional[Rider]:
         """
@@ -35,12 +48,46 @@ class RiderRepository(ABC):
         """Fetches all riders from the database."""
         pass
 
+    @abstractmethod
+    def riders_version(self) -> str:
+        """
+        Returns a value that changes whenever riders are added, renamed or
+        removed, so that caches of ``find_all`` know when to refresh.
+        """
+        pass
+
     @abstractmethod
     def find_all_results_by_rider_ids(
         self, rider_ids: List[UUID]
     ) -> Dict[UUID, List[RiderResultDTO]]:
         """
-        Fetches all point-scoring results for a given list of rider database IDs.
+        Fetches the points of a given list of rider database IDs, as one
+        result per season and race type summing every result in it.
         Returns a dictionary mapping each rider_id to a list of their results.
         """
         pass
+
+    @abstractmethod
+    def find_recent_teams(self, since_year: int) -> Dict[UUID, Set[str]]:
+        """
+        Fetches the team names every rider has scored points for in the
+        seasons from ``since_year`` on.
+        """
+        pass
+
+    @abstractmethod
+    def find_scores_by_rider_ids(
+        self,
+        rider_ids: List[UUID],
+        target_race_type: RaceType,
+        current_year: int,
+        weights: ScoreWeights,
+    ) -> Dict[UUID, RiderScoreDTO]:
+        """
+        Computes the raw points per race type and the weighted total points
+        of every given rider. The totals are those of
+        ``ValueScoreCalculator`` over their results up to floating-point
+        rounding, as the weights may be applied to season totals rather
+        than to each result. Riders without results get zero points.
+        """
+        pass
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.domain.entities.scrape_job import (
+    ScrapeItemStatus,
+    ScrapeJob,
+)
+
+
+class ScrapeJobRepository(ABC):
+    """
+    Abstract interface for the scrape job journal.
+    Implementations must be safe to call from several worker threads.
+    """
+
+    @abstractmethod
+    def create(self, year: int, races_info: List[Tuple[str, RaceType]]) -> ScrapeJob:
+        """
+        Starts a new RUNNING job for ``year`` with every race PENDING.
+        """
+        pass
+
+    @abstractmethod
+    def find_open_by_year(self, year: int) -> Optional[ScrapeJob]:
+        """
+        Finds the most recent job of ``year`` that is still RUNNING, i.e.
+        one that was interrupted before every race had been attempted.
+        """
+        pass
+
+    @abstractmethod
+    def find_latest_by_year(self, year: int) -> Optional[ScrapeJob]:
+        """
+        Finds the most recent job of ``year``, whatever its status.
+        """
+        pass
+
+    @abstractmethod
+    def record_attempt(
+        self,
+        job_id: UUID,
+        race_pcs_id: str,
+        status: ScrapeItemStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Checkpoints the outcome of one attempt at a race, incrementing its
+        attempt counter. ``error`` is stored for FAILED attempts.
+        """
+        pass
+
+    @abstractmethod
+    def finish(self, job_id: UUID) -> None:
+        """
+        Marks a job FINISHED once every race has been attempted.
+        """
+        pass
@@ -0,0 +1,50 @@
+import threading
+from typing import Set
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Engine
+
+# Key of the advisory lock serialising partition creation, so that
+# concurrent savers never race on CREATE TABLE.
+_PARTITION_LOCK_KEY = 0x7063735F70617274
+
+
+def results_partition_name(year: int) -> str:
+    return f"pcs_points_results_y{int(year)}"
+
+
+class ResultsPartitions:
+    """
+    Creates the yearly partitions of ``pcs_points_results`` on demand.
+
+    ``pcs_points_results`` is range-partitioned by race year with one
+    partition per season and no default partition, so a result of a season
+    without its partition cannot be stored. ``ensure`` creates the partition
+    of a season the first time it is needed and remembers the seasons it
+    has seen, so every later call is free.
+    """
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._years: Set[int] = set()
+
+    def ensure(self, year: int) -> None:
+        with self._lock:
+            if year in self._years:
+                return
+            name = results_partition_name(year)
+            with self._engine.connect() as conn:
+                conn.execution_options(isolation_level="READ COMMITTED")
+                with conn.begin():
+                    conn.execute(
+                        select(func.pg_advisory_xact_lock(_PARTITION_LOCK_KEY))
+                    )
+                    conn.execute(
+                        text(
+                            f"CREATE TABLE IF NOT EXISTS {name} "
+                            "PARTITION OF pcs_points_results "
+                            f"FOR VALUES FROM ({int(year)}) TO ({int(year) + 1})"
+                        )
+                    )
+            self._years.add(year)
@@ -1,24 +1,34 @@
 import os
 
 from sqlalchemy import (
+    DDL,
     Column,
     DateTime,
     Enum as PgEnum,
     ForeignKey,
+    Index,
     Integer,
     MetaData,
     String,
     Table,
+    Text,
     UniqueConstraint,
     create_engine,
+    event,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
+from procycling_scraper.analysis.domain.rider_alias import AliasSource
 from procycling_scraper.scraping.domain.entities.classification import (
     ClassificationType,
 )
 from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.domain.entities.race_work_item import WorkItemStatus
+from procycling_scraper.scraping.domain.entities.scrape_job import (
+    ScrapeItemStatus,
+    ScrapeJobStatus,
+)
 
 DATABASE_URL = os.environ.get("DATABASE_URL")
 if not DATABASE_URL:
@@ -27,6 +37,8 @@ if not DATABASE_URL:
 engine = create_engine(DATABASE_URL).execution_options(isolation_level="AUTOCOMMIT")
 
 metadata = MetaData()
+# ix_riders_name_normalized_trgm needs the operator classes of pg_trgm.
+event.listen(metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
 
 riders_table = Table(
     "riders",
@@ -39,6 +51,9 @@ riders_table = Table(
     ),
     Column("pcs_id", String, unique=True, nullable=False, index=True),
     Column("name", String, nullable=False),
+    # Lower-cased and accent-stripped name, written by the rider repository,
+    # for the pg_trgm matching backend.
+    Column("name_normalized", String, nullable=False),
     Column("created_at", DateTime, nullable=False, server_default=func.now()),
     Column(
         "updated_at",
@@ -47,6 +62,12 @@ riders_table = Table(
         server_default=func.now(),
         onupdate=func.now(),
     ),
+    Index(
+        "ix_riders_name_normalized_trgm",
+        "name_normalized",
+        postgresql_using="gin",
+        postgresql_ops={"name_normalized": "gin_trgm_ops"},
+    ),
 )
 
 races_table = Table(
@@ -93,6 +114,7 @@ classifications_table = Table(
         nullable=False,
     ),
     Column("stage_number", Integer, nullable=True),
+    Column("content_hash", String(64), nullable=True),
     Column("created_at", DateTime, nullable=False, server_default=func.now()),
     Column(
         "updated_at",
@@ -106,6 +128,9 @@ classifications_table = Table(
     ),
 )
 
+# Range-partitioned by the race year, denormalised from races, with one
+# partition per season (see database/partitions.py). Unique constraints must
+# include the partition key, hence the year in the primary and unique keys.
 pcs_points_results_table = Table(
     "pcs_points_results",
     metadata,
@@ -115,6 +140,7 @@ pcs_points_results_table = Table(
         primary_key=True,
         server_default=func.gen_random_uuid(),
     ),
+    Column("year", Integer, primary_key=True),
     Column(
         "classification_id",
         UUID(as_uuid=True),
@@ -133,6 +159,172 @@ pcs_points_results_table = Table(
         onupdate=func.now(),
     ),
     UniqueConstraint(
-        "classification_id", "rider_id", name="uq_result_per_rider_per_classification"
+        "classification_id",
+        "rider_id",
+        "year",
+        name="uq_result_per_rider_per_classification",
+    ),
+    # Rider-centric lookups are answered from the index alone.
+    Index(
+        "ix_pcs_points_results_rider_year",
+        "rider_id",
+        "year",
+        postgresql_include=["points", "classification_id"],
+    ),
+    postgresql_partition_by="RANGE (year)",
+)
+
+# Rollup of pcs_points_results per rider, season and race type, kept up to
+# date by the race repositories in the transaction that writes the results.
+# The analysis API reads it instead of every result row of every rider.
+rider_season_points_table = Table(
+    "rider_season_points",
+    metadata,
+    Column(
+        "rider_id",
+        UUID(as_uuid=True),
+        ForeignKey("riders.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("year", Integer, primary_key=True),
+    Column("race_type", PgEnum(RaceType, name="race_type_enum"), primary_key=True),
+    Column("total_points", Integer, nullable=False),
+    Column("result_count", Integer, nullable=False),
+    Column(
+        "updated_at",
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    ),
+)
+
+# External spellings of rider names (e.g. fantasy price lists) resolved to a
+# rider without fuzzy matching. team is "" for aliases valid for any team.
+rider_aliases_table = Table(
+    "rider_aliases",
+    metadata,
+    Column("name", String, primary_key=True),
+    Column("team", String, primary_key=True, server_default=""),
+    Column(
+        "rider_id",
+        UUID(as_uuid=True),
+        ForeignKey("riders.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    ),
+    Column("source", PgEnum(AliasSource, name="alias_source_enum"), nullable=False),
+    Column("created_at", DateTime, nullable=False, server_default=func.now()),
+    Column(
+        "updated_at",
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    ),
+)
+
+# Unlogged landing table for the COPY-based bulk loader. Rows of one save are
+# tagged with a batch_id, merged into classifications/pcs_points_results and
+# then deleted. A NULL rider_id marks a classification without results.
+pcs_points_results_staging_table = Table(
+    "pcs_points_results_staging",
+    metadata,
+    Column("batch_id", UUID(as_uuid=True), nullable=False, index=True),
+    Column("race_id", UUID(as_uuid=True), nullable=False),
+    Column("classification_type", String, nullable=False),
+    Column("stage_number", Integer, nullable=True),
+    Column("rider_id", UUID(as_uuid=True), nullable=True),
+    Column("team_name", String, nullable=True),
+    Column("points", Integer, nullable=True),
+    prefixes=["UNLOGGED"],
+)
+
+scrape_jobs_table = Table(
+    "scrape_jobs",
+    metadata,
+    Column(
+        "id",
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    ),
+    Column("year", Integer, nullable=False, index=True),
+    Column(
+        "status",
+        PgEnum(ScrapeJobStatus, name="scrape_job_status_enum"),
+        nullable=False,
+    ),
+    Column("finished_at", DateTime, nullable=True),
+    Column("created_at", DateTime, nullable=False, server_default=func.now()),
+    Column(
+        "updated_at",
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    ),
+)
+
+scrape_job_races_table = Table(
+    "scrape_job_races",
+    metadata,
+    Column(
+        "job_id",
+        UUID(as_uuid=True),
+        ForeignKey("scrape_jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("race_pcs_id", String, primary_key=True),
+    Column("position", Integer, nullable=False),
+    Column("race_type", PgEnum(RaceType, name="race_type_enum"), nullable=False),
+    Column(
+        "status",
+        PgEnum(ScrapeItemStatus, name="scrape_item_status_enum"),
+        nullable=False,
+    ),
+    Column("attempts", Integer, nullable=False, server_default="0"),
+    Column("last_error", Text, nullable=True),
+    Column("created_at", DateTime, nullable=False, server_default=func.now()),
+    Column(
+        "updated_at",
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    ),
+)
+
+# Work queue shared by `worker` processes. A LEASED item belongs to
+# `leased_by` until `lease_expires_at`; expired leases are reclaimed.
+race_work_items_table = Table(
+    "race_work_items",
+    metadata,
+    Column(
+        "id",
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    ),
+    Column("race_pcs_id", String, unique=True, nullable=False),
+    Column("race_type", PgEnum(RaceType, name="race_type_enum"), nullable=False),
+    Column("year", Integer, nullable=False),
+    Column(
+        "status",
+        PgEnum(WorkItemStatus, name="work_item_status_enum"),
+        nullable=False,
+    ),
+    Column("attempts", Integer, nullable=False, server_default="0"),
+    Column("leased_by", String, nullable=True),
+    Column("lease_expires_at", DateTime, nullable=True),
+    Column("last_error", Text, nullable=True),
+    Column("created_at", DateTime, nullable=False, server_default=func.now()),
+    Column(
+        "updated_at",
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
     ),
+    Index("ix_race_work_items_status_lease", "status", "lease_expires_at"),
 )
@@ -0,0 +1,292 @@
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from procycling_scraper.scraping.infrastructure.http.page_archive import (
+    PageArchiveWriter,
+)
+from procycling_scraper.scraping.infrastructure.http.page_cache import (
+    CachedPage,
+    PageCache,
+)
+from procycling_scraper.scraping.infrastructure.http.rate_limiter import (
+    AdaptiveRateLimiter,
+)
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_AFTER = 300.0
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """
+    A fully read HTTP response, detached from the underlying connection.
+
+    Attributes:
+        url (str): The requested URL.
+        status_code (int): The final HTTP status code.
+        content (bytes): The raw response body.
+        headers (Mapping[str, str]): Response headers (case-insensitive).
+        encoding (Optional[str]): Charset used to decode ``content``.
+        elapsed (float): Seconds spent on the request, retries included.
+        attempts (int): Number of attempts it took to get this response.
+        from_cache (bool): Whether the body was served from the page cache.
+    """
+
+    url: str
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str] = field(default_factory=CaseInsensitiveDict)
+    encoding: Optional[str] = None
+    elapsed: float = 0.0
+    attempts: int = 1
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}"
+            )
+
+
+class HttpClient:
+    """
+    Pooled, retrying HTTP client shared by the ProCyclingStats scrapers.
+
+    A single ``requests.Session`` keeps connections alive across pages and
+    threads. Responses with a retryable status (429/5xx) and timeouts or
+    connection errors are retried with jittered exponential backoff; a
+    ``Retry-After`` header takes precedence over the computed delay.
+
+    With a ``PageCache`` successful pages are stored on disk. Fresh entries
+    are served without touching the network and stale ones are revalidated
+    with ``If-None-Match``/``If-Modified-Since``.
+
+    With an ``AdaptiveRateLimiter`` every network attempt (retries included)
+    first waits for a token of its host, and its outcome is fed back so that
+    the rate adapts to the site.
+
+    With a ``PageArchiveWriter`` every response ``get`` returns, from the
+    network or the cache and whatever its status, is also recorded to the
+    archive so that it can be re-parsed offline later.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        pool_size: int = 10,
+        session: Optional[requests.Session] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        cache: Optional[PageCache] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        archive: Optional[PageArchiveWriter] = None,
+    ):
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._session = session or self._build_session(pool_size)
+        self._sleep = sleep
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._archive = archive
+
+    @property
+    def rate_limiter(self) -> Optional[AdaptiveRateLimiter]:
+        return self._rate_limiter
+
+    def get(
+        self, url: str, headers: Optional[Mapping[str, str]] = None
+    ) -> HttpResponse:
+        """
+        Fetches ``url``, retrying transient failures.
+
+        Returns the final response whatever its status; raises
+        ``requests.exceptions.RequestException`` once network errors have
+        exhausted the retry budget.
+        """
+        response = self._get(url, headers)
+        if self._archive is not None:
+            self._archive.record(
+                url,
+                response.status_code,
+                response.headers,
+                response.content,
+                encoding=response.encoding,
+            )
+        return response
+
+    def _get(
+        self, url: str, headers: Optional[Mapping[str, str]] = None
+    ) -> HttpResponse:
+        if self._cache is None:
+            return self._fetch(url, headers)
+
+        cached = self._cache.get(url)
+        if cached and self._cache.is_fresh(cached):
+            return self._from_cache(cached, elapsed=0.0, attempts=0)
+
+        request_headers = dict(headers or {})
+        if cached and cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
+
+        response = self._fetch(url, request_headers)
+        if response.status_code == 304 and cached:
+            cached = self._cache.mark_validated(cached)
+            return self._from_cache(cached, response.elapsed, response.attempts)
+        if response.status_code == 200:
+            self._cache.put(
+                url,
+                response.content,
+                encoding=response.encoding,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return response
+
+    def _fetch(
+        self, url: str, headers: Optional[Mapping[str, str]] = None
+    ) -> HttpResponse:
+        started = time.perf_counter()
+        host = urlsplit(url).netloc
+        attempt = 0
+        queued = 0.0
+        while True:
+            attempt += 1
+            if self._rate_limiter:
+                queued += self._rate_limiter.acquire(host)
+            attempt_started = time.perf_counter()
+            try:
+                response = self._session.get(
+                    url, timeout=self._timeout, headers=dict(headers or {})
+                )
+            except (
+                requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError,
+            ) as e:
+                self._report(host, None, attempt_started)
+                if attempt > self._max_retries:
+                    raise
+                self._wait_before_retry(url, attempt, None, str(e))
+                continue
+
+            self._report(host, response.status_code, attempt_started)
+
+            if (
+                response.status_code in RETRYABLE_STATUS_CODES
+                and attempt <= self._max_retries
+            ):
+                retry_after = self._parse_retry_after(
+                    response.headers.get("Retry-After")
+                )
+                self._wait_before_retry(
+                    url, attempt, retry_after, f"HTTP {response.status_code}"
+                )
+                continue
+
+            result = HttpResponse(
+                url=url,
+                status_code=response.status_code,
+                content=response.content,
+                headers=CaseInsensitiveDict(response.headers),
+                encoding=response.encoding,
+                elapsed=time.perf_counter() - started,
+                attempts=attempt,
+            )
+            logger.debug(
+                "http_request",
+                extra={
+                    "url": url,
+                    "status": result.status_code,
+                    "attempts": attempt,
+                    "latency_ms": round((time.perf_counter() - attempt_started) * 1000),
+                    "queued_ms": round(queued * 1000),
+                    "elapsed_ms": round(result.elapsed * 1000),
+                },
+            )
+            return result
+
+    def _report(
+        self, host: str, status_code: Optional[int], attempt_started: float
+    ) -> None:
+        if self._rate_limiter:
+            latency = time.perf_counter() - attempt_started
+            self._rate_limiter.on_response(host, status_code, latency)
+
+    @staticmethod
+    def _from_cache(page: CachedPage, elapsed: float, attempts: int) -> HttpResponse:
+        return HttpResponse(
+            url=page.url,
+            status_code=200,
+            content=page.content,
+            encoding=page.encoding,
+            elapsed=elapsed,
+            attempts=attempts,
+            from_cache=True,
+        )
+
+    def _wait_before_retry(
+        self, url: str, attempt: int, retry_after: Optional[float], reason: str
+    ) -> None:
+        delay = retry_after if retry_after is not None else self._backoff(attempt)
+        logger.warning(
+            "http_retry",
+            extra={
+                "url": url,
+                "attempt": attempt,
+                "reason": reason,
+                "delay_s": round(delay, 3),
+            },
+        )
+        self._sleep(delay)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff."""
+        ceiling = min(self._backoff_max, self._backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+    @staticmethod
+    def _build_session(pool_size: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
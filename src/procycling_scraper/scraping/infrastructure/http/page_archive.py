@@ -0,0 +1,256 @@
+import glob
+import gzip
+import http.client
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import IO, Callable, Dict, Mapping, Optional, Tuple
+
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_FILE_BYTES = 512 * 1024**2
+
+# The archive stores bodies decoded, so headers describing the transfer
+# encoding or length of the original bytes would be wrong on replay.
+_TRANSFER_HEADERS = frozenset(
+    {"content-encoding", "transfer-encoding", "content-length"}
+)
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    """
+    One HTTP response read back from a page archive.
+
+    It has the attributes ``HttpClient`` reads from a ``requests`` response,
+    so ``ArchiveReplaySession`` can return it as one.
+
+    Attributes:
+        url (str): The requested URL.
+        status_code (int): The HTTP status code.
+        content (bytes): The response body, decoded from any
+            ``Content-Encoding``.
+        headers (Mapping[str, str]): Response headers (case-insensitive).
+        encoding (Optional[str]): Charset the body was decoded with.
+        fetched_at (str): When the page was recorded, ISO 8601 in UTC.
+    """
+
+    url: str
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str] = field(default_factory=CaseInsensitiveDict)
+    encoding: Optional[str] = None
+    fetched_at: str = ""
+
+
+class PageArchiveWriter:
+    """
+    Records every page the scrapers fetch into append-only archive files.
+
+    Each response is one WARC/1.1 ``response`` record, gzipped on its own
+    as in ``.warc.gz`` files, so standard WARC tools can read the archive.
+    Next to every ``.warc.gz`` a JSON-lines ``.idx`` file gives the URL,
+    status, offset and length of each record, which lets ``PageArchive``
+    jump straight to a page. Files are rotated once they reach
+    ``max_file_bytes``. Every process writes files of its own, so several
+    workers can record into the same directory.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._directory = directory
+        self._max_file_bytes = max_file_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._files: Optional[Tuple[IO[bytes], IO[str]]] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def record(
+        self,
+        url: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        encoding: Optional[str] = None,
+    ) -> None:
+        fetched_at = datetime.fromtimestamp(self._clock(), tz=timezone.utc)
+        member = gzip.compress(
+            _warc_record(url, status_code, headers, content, encoding, fetched_at),
+            mtime=0,
+        )
+        with self._lock:
+            warc, index = self._current_files()
+            offset = warc.tell()
+            warc.write(member)
+            warc.flush()
+            entry = {
+                "url": url,
+                "status": status_code,
+                "offset": offset,
+                "length": len(member),
+                "date": fetched_at.isoformat(),
+            }
+            index.write(json.dumps(entry) + "\n")
+            index.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_files()
+
+    def _current_files(self) -> Tuple[IO[bytes], IO[str]]:
+        if self._files is not None and self._files[0].tell() >= self._max_file_bytes:
+            self._close_files()
+        if self._files is None:
+            self._sequence += 1
+            stamp = datetime.fromtimestamp(self._clock(), tz=timezone.utc)
+            name = f"pcs-{stamp:%Y%m%dT%H%M%S}-{os.getpid()}-{self._sequence:05d}"
+            base = os.path.join(self._directory, name)
+            self._files = (
+                open(f"{base}.warc.gz", "ab"),
+                open(f"{base}.idx", "a", encoding="utf-8"),
+            )
+            logger.info("page_archive_file_opened", extra={"path": f"{base}.warc.gz"})
+        return self._files
+
+    def _close_files(self) -> None:
+        if self._files is not None:
+            warc, index = self._files
+            warc.close()
+            index.close()
+            self._files = None
+
+
+class PageArchive:
+    """
+    Read access to a directory of archives written by ``PageArchiveWriter``.
+
+    The ``.idx`` files are loaded up front; bodies are read from disk on
+    demand. When a URL was recorded more than once, the latest record wins.
+    Reads are thread-safe.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self._index: Dict[str, Tuple[str, int, int]] = {}
+        for index_path in sorted(glob.glob(os.path.join(directory, "*.idx"))):
+            warc_path = index_path[: -len(".idx")] + ".warc.gz"
+            with open(index_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A record cut short by a crash; the rest is usable.
+                        continue
+                    self._index[entry["url"]] = (
+                        warc_path,
+                        entry["offset"],
+                        entry["length"],
+                    )
+        logger.info(
+            "page_archive_loaded",
+            extra={"directory": directory, "pages": len(self._index)},
+        )
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._index
+
+    def get(self, url: str) -> Optional[ArchivedPage]:
+        location = self._index.get(url)
+        if location is None:
+            return None
+        path, offset, length = location
+        with open(path, "rb") as f:
+            f.seek(offset)
+            member = f.read(length)
+        return _parse_warc_record(gzip.decompress(member))
+
+
+class ArchiveReplaySession:
+    """
+    Stands in for the ``requests.Session`` of an ``HttpClient`` and answers
+    every GET from a ``PageArchive``, so that scrapers run unchanged and
+    without network access. URLs missing from the archive get a 404.
+    """
+
+    def __init__(self, archive: PageArchive):
+        self._archive = archive
+
+    def get(self, url: str, timeout=None, headers=None) -> ArchivedPage:
+        page = self._archive.get(url)
+        if page is None:
+            logger.warning("archive_miss", extra={"url": url})
+            return ArchivedPage(url=url, status_code=404, content=b"")
+        return page
+
+
+def _warc_record(
+    url: str,
+    status_code: int,
+    headers: Mapping[str, str],
+    content: bytes,
+    encoding: Optional[str],
+    fetched_at: datetime,
+) -> bytes:
+    reason = http.client.responses.get(status_code, "")
+    http_head = f"HTTP/1.1 {status_code} {reason}\r\n"
+    for name, value in headers.items():
+        if name.lower() not in _TRANSFER_HEADERS:
+            http_head += f"{name}: {value}\r\n"
+    http_head += f"Content-Length: {len(content)}\r\n\r\n"
+    payload = http_head.encode("latin-1", errors="replace") + content
+
+    warc_head = (
+        "WARC/1.1\r\n"
+        "WARC-Type: response\r\n"
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+        f"WARC-Date: {fetched_at:%Y-%m-%dT%H:%M:%SZ}\r\n"
+        f"WARC-Target-URI: {url}\r\n"
+        "Content-Type: application/http;msgtype=response\r\n"
+    )
+    if encoding:
+        # Not a standard WARC field: the charset the page was decoded with,
+        # which the HTTP headers do not always state.
+        warc_head += f"WARC-X-Charset: {encoding}\r\n"
+    warc_head += f"Content-Length: {len(payload)}\r\n\r\n"
+    return warc_head.encode("utf-8") + payload + b"\r\n\r\n"
+
+
+def _parse_warc_record(record: bytes) -> ArchivedPage:
+    warc_head, _, rest = record.partition(b"\r\n\r\n")
+    warc_fields = _parse_fields(warc_head.decode("utf-8").split("\r\n")[1:])
+    payload = rest[: int(warc_fields["Content-Length"])]
+    http_head, _, content = payload.partition(b"\r\n\r\n")
+    status_line, *header_lines = http_head.decode("latin-1").split("\r\n")
+    headers = _parse_fields(header_lines)
+    headers.pop("Content-Length", None)
+    return ArchivedPage(
+        url=warc_fields["WARC-Target-URI"],
+        status_code=int(status_line.split(" ", 2)[1]),
+        content=content,
+        headers=headers,
+        encoding=warc_fields.get("WARC-X-Charset"),
+        fetched_at=warc_fields.get("WARC-Date", ""),
+    )
+
+
+def _parse_fields(lines) -> CaseInsensitiveDict:
+    fields: CaseInsensitiveDict = CaseInsensitiveDict()
+    for line in lines:
+        name, _, value = line.partition(":")
+        fields[name.strip()] = value.strip()
+    return fields
@@ -0,0 +1,227 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+_YEAR_PATTERNS = (re.compile(r"[?&]year=(\d{4})\b"), re.compile(r"/(\d{4})(?:/|$)"))
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """
+    A cached HTTP 200 response together with its validators.
+
+    Attributes:
+        url (str): The URL the page was fetched from.
+        content (bytes): The raw response body.
+        encoding (Optional[str]): Charset of ``content``.
+        etag (Optional[str]): ``ETag`` validator sent by the server.
+        last_modified (Optional[str]): ``Last-Modified`` validator.
+        validated_at (float): Unix time the page was last fetched or
+            revalidated.
+    """
+
+    url: str
+    content: bytes
+    encoding: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    validated_at: float
+
+
+class RaceAgeTtlPolicy:
+    """
+    Decides how long a cached page stays fresh from the season in its URL.
+
+    Results of past seasons effectively never change, so their pages never
+    expire. Pages of the current season (or without a recognisable year) are
+    revalidated once they are older than ``current_season_ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        current_season_ttl: float = 6 * 3600,
+        past_season_ttl: Optional[float] = None,
+        current_year: Optional[int] = None,
+    ):
+        self._current_season_ttl = current_season_ttl
+        self._past_season_ttl = past_season_ttl
+        self._current_year = current_year
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """Returns the TTL in seconds for ``url``; ``None`` means no expiry."""
+        current_year = self._current_year or datetime.now().year
+        year = self._season_of(url)
+        if year is not None and year < current_year:
+            return self._past_season_ttl
+        return self._current_season_ttl
+
+    @staticmethod
+    def _season_of(url: str) -> Optional[int]:
+        for pattern in _YEAR_PATTERNS:
+            match = pattern.search(url)
+            if match:
+                return int(match.group(1))
+        return None
+
+
+class PageCache:
+    """
+    Persistent, size-bounded page cache keyed by URL.
+
+    Each entry is one gzip file named after the SHA-256 of its URL, holding a
+    JSON metadata line followed by the body. Reads bump the file's mtime so
+    that, once the cache grows past ``max_bytes``, the least recently used
+    entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_policy: Optional[RaceAgeTtlPolicy] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._ttl_policy = ttl_policy or RaceAgeTtlPolicy()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, int]] = None
+        self._total_bytes = 0
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        path = self._path_for(url)
+        try:
+            with gzip.open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                content = f.read()
+            now = self._clock()
+            os.utime(path, (now, now))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning("page_cache_corrupt", extra={"url": url, "error": str(e)})
+            self._remove(path)
+            return None
+        return CachedPage(content=content, **meta)
+
+    def put(
+        self,
+        url: str,
+        content: bytes,
+        encoding: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CachedPage:
+        """Stores a freshly fetched page."""
+        page = CachedPage(
+            url=url,
+            content=content,
+            encoding=encoding,
+            etag=etag,
+            last_modified=last_modified,
+            validated_at=self._clock(),
+        )
+        self._write(page)
+        return page
+
+    def mark_validated(self, page: CachedPage) -> CachedPage:
+        """Stores ``page`` as freshly revalidated (e.g. after a 304)."""
+        refreshed = replace(page, validated_at=self._clock())
+        self._write(refreshed)
+        return refreshed
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        ttl = self._ttl_policy.ttl_for(page.url)
+        return ttl is None or self._clock() - page.validated_at < ttl
+
+    def _write(self, page: CachedPage) -> None:
+        path = self._path_for(page.url)
+        meta = {
+            "url": page.url,
+            "encoding": page.encoding,
+            "etag": page.etag,
+            "last_modified": page.last_modified,
+            "validated_at": page.validated_at,
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(
+                fileobj=raw, mode="wb", mtime=0
+            ) as f:
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                f.write(page.content)
+            os.replace(tmp_path, path)
+            now = self._clock()
+            os.utime(path, (now, now))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self._record(path, os.path.getsize(path))
+
+    def _path_for(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, key[:2], f"{key}.gz")
+
+    def _record(self, path: str, size: int) -> None:
+        with self._lock:
+            index = self._load_index()
+            self._total_bytes += size - index.get(path, 0)
+            index[path] = size
+            if self._total_bytes > self._max_bytes:
+                self._evict(index)
+
+    def _load_index(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index = {}
+            for root, _, files in os.walk(self._directory):
+                for name in files:
+                    if name.endswith(".gz"):
+                        path = os.path.join(root, name)
+                        self._index[path] = os.path.getsize(path)
+            self._total_bytes = sum(self._index.values())
+        return self._index
+
+    def _evict(self, index: Dict[str, int]) -> None:
+        """Drops least recently used entries until usage is under 90% of budget."""
+        target = int(self._max_bytes * 0.9)
+        by_recency = sorted(index, key=self._mtime)
+        evicted = 0
+        for path in by_recency:
+            if self._total_bytes <= target:
+                break
+            self._total_bytes -= index.pop(path)
+            self._remove(path)
+            evicted += 1
+        logger.info(
+            "page_cache_evicted",
+            extra={"entries": evicted, "total_bytes": self._total_bytes},
+        )
+
+    @staticmethod
+    def _mtime(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
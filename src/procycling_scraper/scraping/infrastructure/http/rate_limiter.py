@@ -0,0 +1,249 @@
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+@dataclass
+class _BucketState:
+    rate: float
+    tokens: float
+    updated_at: float
+    last_backoff_at: float = float("-inf")
+
+
+@dataclass
+class _HostCounters:
+    requests: int = 0
+    backoffs: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+@dataclass(frozen=True)
+class RateLimiterMetrics:
+    """
+    Snapshot of the rate limiter for one host.
+
+    Attributes:
+        host (str): The host the bucket throttles.
+        rate (float): Current allowed rate in requests per second.
+        requests (int): Requests admitted by this process.
+        backoffs (int): Times this process cut the rate after a 429/503,
+            a timeout or a slow response.
+        total_wait_s (float): Seconds this process spent queued for tokens.
+        max_wait_s (float): Longest single queueing delay.
+        avg_wait_s (float): Mean queueing delay per request.
+    """
+
+    host: str
+    rate: float
+    requests: int
+    backoffs: int
+    total_wait_s: float
+    max_wait_s: float
+    avg_wait_s: float
+
+
+class AdaptiveRateLimiter:
+    """
+    Per-host token bucket whose refill rate adapts with AIMD.
+
+    Every request takes one token; when the bucket is empty the caller
+    reserves the next token and sleeps until it is due, so waiting never
+    holds a lock. Each successful, fast response adds ``additive_increase``
+    requests per second spread over one second of traffic; a 429/503, a
+    timeout or a response slower than ``latency_target`` multiplies the rate
+    by ``decrease_factor`` (at most once per ``backoff_cooldown`` so that a
+    burst of concurrent errors counts once) and drains the bucket.
+
+    Threads share the in-memory buckets. With a ``state_dir`` the buckets
+    live in small files guarded by ``flock`` instead, so that every worker
+    process on the machine draws from, and adapts, the same budget.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 2.0,
+        min_rate: float = 0.2,
+        max_rate: float = 8.0,
+        burst: float = 2.0,
+        additive_increase: float = 0.1,
+        decrease_factor: float = 0.5,
+        latency_target: float = 3.0,
+        backoff_cooldown: float = 2.0,
+        state_dir: Optional[str] = None,
+        report_interval: float = 60.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if not 0 < min_rate <= initial_rate <= max_rate:
+            raise ValueError(
+                "rates must satisfy 0 < min_rate <= initial_rate <= max_rate"
+            )
+        self._initial_rate = initial_rate
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._burst = burst
+        self._additive_increase = additive_increase
+        self._decrease_factor = decrease_factor
+        self._latency_target = latency_target
+        self._backoff_cooldown = backoff_cooldown
+        self._state_dir = state_dir
+        self._report_interval = report_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, _BucketState] = {}
+        self._counters: Dict[str, _HostCounters] = {}
+        self._last_report = clock()
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+
+    def acquire(self, host: str) -> float:
+        """Blocks until a request to ``host`` may be sent; returns the wait."""
+
+        def take(bucket: _BucketState, now: float) -> float:
+            self._refill(bucket, now)
+            bucket.tokens -= 1.0
+            return max(0.0, -bucket.tokens / bucket.rate)
+
+        wait = self._update(host, take)
+        if wait > 0:
+            self._sleep(wait)
+
+        with self._lock:
+            counters = self._counters.setdefault(host, _HostCounters())
+            counters.requests += 1
+            counters.total_wait += wait
+            counters.max_wait = max(counters.max_wait, wait)
+        self._maybe_report()
+        return wait
+
+    def on_response(self, host: str, status_code: Optional[int], latency: float):
+        """
+        Adapts the rate of ``host`` to the outcome of a request;
+        ``status_code`` is None when no response arrived (timeout, reset).
+        """
+        if (
+            status_code is not None
+            and status_code not in THROTTLE_STATUS_CODES
+            and latency <= self._latency_target
+        ):
+            if status_code < 500:
+                self._update(host, self._increase)
+            return
+
+        old_rate = self._rate_of(host)
+        backed_off = self._update(host, self._decrease)
+        if not backed_off:
+            return
+        with self._lock:
+            self._counters.setdefault(host, _HostCounters()).backoffs += 1
+        logger.warning(
+            "rate_limit_backoff",
+            extra={
+                "host": host,
+                "status": status_code,
+                "latency_ms": round(latency * 1000),
+                "old_rate": round(old_rate, 3),
+                "new_rate": round(self._rate_of(host), 3),
+            },
+        )
+
+    def metrics(self) -> Dict[str, RateLimiterMetrics]:
+        with self._lock:
+            counters = {
+                host: _HostCounters(**asdict(c)) for host, c in self._counters.items()
+            }
+        return {
+            host: RateLimiterMetrics(
+                host=host,
+                rate=round(self._rate_of(host), 3),
+                requests=c.requests,
+                backoffs=c.backoffs,
+                total_wait_s=round(c.total_wait, 3),
+                max_wait_s=round(c.max_wait, 3),
+                avg_wait_s=round(c.total_wait / c.requests, 3) if c.requests else 0.0,
+            )
+            for host, c in counters.items()
+        }
+
+    def _increase(self, bucket: _BucketState, now: float) -> bool:
+        self._refill(bucket, now)
+        bucket.rate = min(
+            self._max_rate, bucket.rate + self._additive_increase / bucket.rate
+        )
+        return False
+
+    def _decrease(self, bucket: _BucketState, now: float) -> bool:
+        if now - bucket.last_backoff_at < self._backoff_cooldown:
+            return False
+        self._refill(bucket, now)
+        bucket.rate = max(self._min_rate, bucket.rate * self._decrease_factor)
+        bucket.tokens = min(bucket.tokens, 0.0)
+        bucket.last_backoff_at = now
+        return True
+
+    def _refill(self, bucket: _BucketState, now: float) -> None:
+        elapsed = max(0.0, now - bucket.updated_at)
+        bucket.tokens = min(self._burst, bucket.tokens + elapsed * bucket.rate)
+        bucket.updated_at = now
+
+    def _rate_of(self, host: str) -> float:
+        return self._update(host, lambda bucket, now: bucket.rate)
+
+    def _update(self, host: str, fn: Callable[[_BucketState, float], object]):
+        """Applies ``fn`` to the bucket of ``host`` atomically."""
+        with self._lock:
+            if not self._state_dir:
+                bucket = self._buckets.get(host) or self._new_bucket()
+                self._buckets[host] = bucket
+                return fn(bucket, self._clock())
+            return self._update_shared(host, fn)
+
+    def _update_shared(self, host: str, fn: Callable[[_BucketState, float], object]):
+        assert self._state_dir is not None
+        key = hashlib.sha256(host.encode("utf-8")).hexdigest()[:16]
+        path = os.path.join(self._state_dir, f"{key}.json")
+        with open(path, "a+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                try:
+                    bucket = _BucketState(**json.loads(raw)) if raw else None
+                except (ValueError, TypeError):
+                    bucket = None
+                bucket = bucket or self._new_bucket()
+                result = fn(bucket, self._clock())
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(asdict(bucket)))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return result
+
+    def _new_bucket(self) -> _BucketState:
+        return _BucketState(
+            rate=self._initial_rate, tokens=self._burst, updated_at=self._clock()
+        )
+
+    def _maybe_report(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if now - self._last_report < self._report_interval:
+                return
+            self._last_report = now
+        for snapshot in self.metrics().values():
+            logger.info("rate_limiter_stats", extra=asdict(snapshot))
@@ -0,0 +1,168 @@
+import csv
+import io
+from dataclasses import replace
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from procycling_scraper.scraping.domain.entities.race import Race
+from procycling_scraper.scraping.infrastructure.repositories.postgres_race_repository import (
+    PostgresRaceRepository,
+)
+from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_season_points import (
+    PostgresRiderSeasonPoints,
+)
+
+_COPY_STAGING_SQL = (
+    "COPY pcs_points_results_staging (batch_id, race_id, classification_type, "
+    "stage_number, rider_id, team_name, points) FROM STDIN "
+    "WITH (FORMAT csv, FORCE_NULL (stage_number, rider_id, points))"
+)
+
+_STAGED_CLASSIFICATION_MATCH = """
+    c.race_id = s.race_id
+    AND c.type = CAST(s.classification_type AS classification_type_enum)
+    AND c.stage_number IS NOT DISTINCT FROM s.stage_number
+"""
+
+_MERGE_CLASSIFICATIONS_SQL = f"""
+    INSERT INTO classifications (race_id, type, stage_number)
+    SELECT DISTINCT
+        s.race_id,
+        CAST(s.classification_type AS classification_type_enum),
+        s.stage_number
+    FROM pcs_points_results_staging s
+    WHERE s.batch_id = :batch_id
+      AND NOT EXISTS (
+          SELECT 1 FROM classifications c WHERE {_STAGED_CLASSIFICATION_MATCH}
+      )
+    ON CONFLICT (race_id, type, stage_number) DO NOTHING
+"""
+
+_MERGE_RESULTS_SQL = f"""
+    INSERT INTO pcs_points_results
+        (classification_id, rider_id, team_name, points, year)
+    SELECT c.id, s.rider_id, s.team_name, s.points, :year
+    FROM pcs_points_results_staging s
+    JOIN classifications c ON {_STAGED_CLASSIFICATION_MATCH}
+    WHERE s.batch_id = :batch_id AND s.rider_id IS NOT NULL
+    ON CONFLICT (classification_id, rider_id, year) DO NOTHING
+    RETURNING rider_id, points
+"""
+
+_STORE_CONTENT_HASH_SQL = """
+    UPDATE classifications SET content_hash = :content_hash
+    WHERE race_id = :race_id
+      AND type = CAST(:classification_type AS classification_type_enum)
+      AND stage_number IS NOT DISTINCT FROM :stage_number
+"""
+
+_CLEAR_BATCH_SQL = "DELETE FROM pcs_points_results_staging WHERE batch_id = :batch_id"
+
+
+class PostgresCopyRaceRepository(PostgresRaceRepository):
+    """
+    Race repository tuned for large imports.
+
+    Instead of one upsert per classification plus a multi-row INSERT of its
+    results, every result row of the race is streamed with ``COPY`` into the
+    unlogged ``pcs_points_results_staging`` table and merged into
+    ``classifications`` and ``pcs_points_results`` with one set-based
+    statement each. Unchanged classifications are skipped and changed ones
+    replaced as in ``PostgresRaceRepository``; only the changed ones are
+    staged. The ``rider_season_points`` rollup is updated in the same
+    transaction.
+    """
+
+    def save(self, race: Race, rider_id_map: Optional[Dict[str, UUID]] = None) -> None:
+        plan = self._plan_writes(race)
+        if plan is None:
+            return
+        batch = replace(race, classifications=plan.changed)
+        batch_id = uuid4()
+        params = {"batch_id": batch_id}
+        self._partitions.ensure(race.year)
+        with self._engine.connect() as conn:
+            self._begin_transaction(conn)
+            with conn.begin():
+                self._merge_batch(conn, batch, rider_id_map, batch_id, plan.replace_ids)
+                # A rollback takes the staged rows with it, so they only
+                # need clearing on the way to a commit.
+                conn.execute(text(_CLEAR_BATCH_SQL), params)
+        self._record_stats(race, len(plan.changed), plan.skipped)
+
+    def _merge_batch(
+        self,
+        conn: Connection,
+        race: Race,
+        rider_id_map: Optional[Dict[str, UUID]],
+        batch_id: UUID,
+        replace_ids: List[UUID],
+    ) -> None:
+        race_db_id = self._save_race_and_get_id(conn, race)
+        if rider_id_map is None:
+            rider_id_map = self._get_rider_id_map(conn, race)
+        self._copy_to_staging(conn, race, race_db_id, rider_id_map, batch_id)
+        params = {"batch_id": batch_id}
+        conn.execute(text(_MERGE_CLASSIFICATIONS_SQL), params)
+        deleted = self._delete_results(conn, replace_ids, race.year)
+        inserted = [
+            (row.rider_id, row.points)
+            for row in conn.execute(
+                text(_MERGE_RESULTS_SQL), {**params, "year": race.year}
+            )
+        ]
+        PostgresRiderSeasonPoints.apply(
+            conn, race.year, race.race_type, inserted, deleted
+        )
+        if race.classifications:
+            conn.execute(
+                text(_STORE_CONTENT_HASH_SQL),
+                [
+                    {
+                        "content_hash": c.content_hash(),
+                        "race_id": race_db_id,
+                        "classification_type": c.classification_type.name,
+                        "stage_number": c.stage_number,
+                    }
+                    for c in race.classifications
+                ],
+            )
+
+    def _copy_to_staging(
+        self,
+        conn: Connection,
+        race: Race,
+        race_db_id: UUID,
+        rider_id_map: Dict[str, UUID],
+        batch_id: UUID,
+    ) -> None:
+        buffer = io.StringIO()
+        # csv writes None as "", which FORCE_NULL turns into NULL for the
+        # nullable non-text columns; team names keep "" as an empty string.
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+        for classification in race.classifications:
+            key = (
+                str(batch_id),
+                str(race_db_id),
+                classification.classification_type.name,
+                classification.stage_number,
+            )
+            rows_written = 0
+            for result in classification.results:
+                rider_db_id = rider_id_map.get(result.rider_pcs_id)
+                if rider_db_id:
+                    writer.writerow(
+                        key + (str(rider_db_id), result.team_name, result.points)
+                    )
+                    rows_written += 1
+            if not rows_written:
+                writer.writerow(key + (None, None, None))
+        buffer.seek(0)
+
+        driver_connection = conn.connection.driver_connection
+        assert driver_connection is not None
+        with driver_connection.cursor() as cursor:
+            cursor.copy_expert(_COPY_STAGING_SQL, buffer)
@@ -1,49 +1,144 @@
-from typing import Any, Dict, List, Union
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.engine import Connection, Engine
 
 from procycling_scraper.analysis.application.dto.analysis_dtos import RiderResultDTO
-from procycling_scraper.scraping.domain.entities.classification import Classification
+from procycling_scraper.scraping.domain.entities.classification import (
+    Classification,
+    ClassificationType,
+)
 from procycling_scraper.scraping.domain.entities.race import Race
 from procycling_scraper.scraping.domain.repositories.race_repository import (
     RaceRepository,
 )
 from procycling_scraper.scraping.domain.value_objects.result_line import ResultLine
+from procycling_scraper.scraping.infrastructure.database.partitions import (
+    ResultsPartitions,
+)
 from procycling_scraper.scraping.infrastructure.database.schema import (
     classifications_table,
     pcs_points_results_table,
     races_table,
     riders_table,
 )
+from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_season_points import (
+    PostgresRiderSeasonPoints,
+    ResultPoints,
+)
+
+logger = logging.getLogger(__name__)
+
+ClassificationKey = Tuple[ClassificationType, Optional[int]]
+
+
+@dataclass(frozen=True)
+class ClassificationWriteStats:
+    """
+    Classifications a repository wrote or skipped since it was created.
+
+    Attributes:
+        written (int): Classifications new or changed, and so written.
+        skipped (int): Classifications whose content hash matched the stored
+            one, and so were not written at all.
+    """
+
+    written: int
+    skipped: int
+
+
+@dataclass(frozen=True)
+class _StoredClassification:
+    id: UUID
+    content_hash: Optional[str]
+
+
+@dataclass(frozen=True)
+class _WritePlan:
+    """What saving a race has to write."""
+
+    changed: List[Classification]
+    stored: Dict[ClassificationKey, _StoredClassification]
+    # Stored classifications whose results are replaced rather than merged.
+    replace_ids: List[UUID]
+    # Classifications left out because their content hash is unchanged.
+    skipped: int
 
 
 class PostgresRaceRepository(RaceRepository):
-    def __init__(self, engine: Engine):
+    """
+    Race repository writing each classification with an upsert and its
+    results with a multi-row INSERT.
+
+    Every classification is stored with the ``content_hash`` of its
+    results. A saved classification whose hash matches the stored one is
+    skipped without any write, so re-scraping unchanged races costs one
+    read; ``write_stats`` counts written and skipped classifications of
+    the saves that committed.
+
+    A classification whose hash changed gets its stored results replaced.
+    One stored before hashes existed is merged into instead (results
+    already present are kept), unless ``replace_results`` is set, which is
+    what a re-parse that corrects earlier data needs.
+
+    Each save is one transaction, which also applies the results it
+    inserted and deleted to the ``rider_season_points`` rollup. Results are
+    stored with the race year, creating the season's partition if needed.
+    """
+
+    def __init__(self, engine: Engine, replace_results: bool = False):
         self._engine = engine
+        self._replace_results = replace_results
+        self._partitions = ResultsPartitions(engine)
+        self._stats_lock = threading.Lock()
+        self._written = 0
+        self._skipped = 0
+
+    def write_stats(self) -> ClassificationWriteStats:
+        with self._stats_lock:
+            return ClassificationWriteStats(self._written, self._skipped)
 
-    def save(self, race: Race) -> None:
+    def save(self, race: Race, rider_id_map: Optional[Dict[str, UUID]] = None) -> None:
+        plan = self._plan_writes(race)
+        if plan is None:
+            return
+        self._partitions.ensure(race.year)
         with self._engine.connect() as conn:
+            self._begin_transaction(conn)
             with conn.begin() as transaction:
                 try:
                     race_db_id = self._save_race_and_get_id(conn, race)
-                    rider_id_map = self._get_rider_id_map(conn, race)
+                    if rider_id_map is None:
+                        rider_id_map = self._get_rider_id_map(conn, race)
+                    deleted = self._delete_results(conn, plan.replace_ids, race.year)
 
-                    for classification in race.classifications:
+                    inserted: List[ResultPoints] = []
+                    for classification in plan.changed:
                         classification_db_id = self._save_classification_and_get_id(
-                            conn, classification, race_db_id
+                            conn,
+                            classification,
+                            race_db_id,
+                            plan.stored.get(_key(classification)),
                         )
-                        self._save_results(
+                        inserted += self._save_results(
                             conn,
                             classification.results,
                             classification_db_id,
                             rider_id_map,
+                            race.year,
                         )
+                    PostgresRiderSeasonPoints.apply(
+                        conn, race.year, race.race_type, inserted, deleted
+                    )
                 except Exception:
                     transaction.rollback()
                     raise
+        self._record_stats(race, len(plan.changed), plan.skipped)
 
     def find_all_results_by_rider_ids(
         self, rider_ids: List[UUID]
@@ -81,8 +176,156 @@ class PostgresRaceRepository(RaceRepository):
             grouped_results[row.rider_id].append(result)
         return grouped_results
 
-    def find_by_pcs_id(self, pcs_id: str):
-        pass
+    def find_by_pcs_id(self, pcs_id: str) -> Optional[Race]:
+        race_stmt = select(races_table).where(races_table.c.pcs_id == pcs_id)
+        with self._engine.connect() as conn:
+            race_row = conn.execute(race_stmt).first()
+            if race_row is None:
+                return None
+            results_stmt = (
+                select(
+                    classifications_table.c.id,
+                    classifications_table.c.type,
+                    classifications_table.c.stage_number,
+                    riders_table.c.pcs_id.label("rider_pcs_id"),
+                    pcs_points_results_table.c.team_name,
+                    pcs_points_results_table.c.points,
+                )
+                .select_from(classifications_table)
+                .outerjoin(
+                    pcs_points_results_table,
+                    and_(
+                        pcs_points_results_table.c.classification_id
+                        == classifications_table.c.id,
+                        # Lets the planner scan the race's partition only.
+                        pcs_points_results_table.c.year == race_row.year,
+                    ),
+                )
+                .outerjoin(
+                    riders_table,
+                    pcs_points_results_table.c.rider_id == riders_table.c.id,
+                )
+                .where(classifications_table.c.race_id == race_row.id)
+                .order_by(
+                    classifications_table.c.stage_number.nulls_last(),
+                    classifications_table.c.type,
+                )
+            )
+            rows: List[Any] = list(conn.execute(results_stmt).fetchall())
+
+        classification_keys: Dict[UUID, Tuple[ClassificationType, Optional[int]]] = {}
+        results_by_classification: Dict[UUID, List[ResultLine]] = {}
+        for row in rows:
+            classification_keys[row.id] = (row.type, row.stage_number)
+            results = results_by_classification.setdefault(row.id, [])
+            if row.rider_pcs_id is not None:
+                results.append(
+                    ResultLine(
+                        rider_pcs_id=row.rider_pcs_id,
+                        team_name=row.team_name,
+                        points=row.points,
+                    )
+                )
+
+        race = Race(
+            pcs_id=race_row.pcs_id,
+            name=race_row.name,
+            year=race_row.year,
+            race_type=race_row.type,
+        )
+        for classification_id, key in classification_keys.items():
+            race.add_classification(
+                Classification(
+                    classification_type=key[0],
+                    results=results_by_classification[classification_id],
+                    stage_number=key[1],
+                )
+            )
+        return race
+
+    def _plan_writes(self, race: Race) -> Optional[_WritePlan]:
+        """
+        Compares the classifications of ``race`` with the stored hashes.
+        Returns None when every classification is unchanged, so that
+        nothing, not even the race, needs writing.
+        """
+        stored = self._find_stored_classifications(race.pcs_id)
+        changed: List[Classification] = []
+        replace_ids: List[UUID] = []
+        for classification in race.classifications:
+            existing = stored.get(_key(classification))
+            if existing is None:
+                changed.append(classification)
+            elif existing.content_hash != classification.content_hash():
+                changed.append(classification)
+                if self._replace_results or existing.content_hash is not None:
+                    replace_ids.append(existing.id)
+
+        skipped = len(race.classifications) - len(changed)
+        if race.classifications and not changed:
+            self._record_stats(race, 0, skipped)
+            return None
+        return _WritePlan(changed, stored, replace_ids, skipped)
+
+    def _record_stats(self, race: Race, written: int, skipped: int) -> None:
+        """Counts the classifications of a save once it has committed."""
+        with self._stats_lock:
+            self._written += written
+            self._skipped += skipped
+        logger.debug(
+            "race_classifications_saved",
+            extra={"race_url": race.pcs_id, "written": written, "skipped": skipped},
+        )
+
+    def _find_stored_classifications(
+        self, race_pcs_id: str
+    ) -> Dict[ClassificationKey, _StoredClassification]:
+        stmt = (
+            select(
+                classifications_table.c.id,
+                classifications_table.c.type,
+                classifications_table.c.stage_number,
+                classifications_table.c.content_hash,
+            )
+            .select_from(classifications_table)
+            .join(races_table, classifications_table.c.race_id == races_table.c.id)
+            .where(races_table.c.pcs_id == race_pcs_id)
+        )
+        with self._engine.connect() as conn:
+            rows: List[Any] = list(conn.execute(stmt).fetchall())
+        return {
+            (row.type, row.stage_number): _StoredClassification(
+                row.id, row.content_hash
+            )
+            for row in rows
+        }
+
+    @staticmethod
+    def _begin_transaction(conn: Connection) -> None:
+        """
+        The engine autocommits every statement; a save needs a real
+        transaction so that readers never see a classification emptied, nor
+        the rollup out of step with the results.
+        """
+        conn.execution_options(isolation_level="READ COMMITTED")
+
+    @staticmethod
+    def _delete_results(
+        conn: Connection, classification_ids: List[UUID], year: int
+    ) -> List[ResultPoints]:
+        if not classification_ids:
+            return []
+        stmt = (
+            delete(pcs_points_results_table)
+            .where(
+                pcs_points_results_table.c.classification_id.in_(classification_ids),
+                pcs_points_results_table.c.year == year,
+            )
+            .returning(
+                pcs_points_results_table.c.rider_id, pcs_points_results_table.c.points
+            )
+        )
+        return [(row.rider_id, row.points) for row in conn.execute(stmt)]
 
     def _save_race_and_get_id(self, conn: Connection, race: Race) -> UUID:
         ins = insert(races_table).values(
@@ -108,16 +351,29 @@ class PostgresRaceRepository(RaceRepository):
         return {pcs_id: db_id for pcs_id, db_id in result}
 
     def _save_classification_and_get_id(
-        self, conn: Connection, classification: Classification, race_db_id: UUID
+        self,
+        conn: Connection,
+        classification: Classification,
+        race_db_id: UUID,
+        stored: Optional[_StoredClassification] = None,
     ) -> UUID:
+        content_hash = classification.content_hash()
+        if stored is not None:
+            conn.execute(
+                update(classifications_table)
+                .where(classifications_table.c.id == stored.id)
+                .values(content_hash=content_hash)
+            )
+            return stored.id
         ins = insert(classifications_table).values(
             race_id=race_db_id,
             type=classification.classification_type,
             stage_number=classification.stage_number,
+            content_hash=content_hash,
         )
         stmt = ins.on_conflict_do_update(
             index_elements=["race_id", "type", "stage_number"],
-            set_={"type": classification.classification_type},
+            set_={"content_hash": ins.excluded.content_hash},
         ).returning(classifications_table.c.id)
         result = conn.execute(stmt).scalar_one()
         return result
@@ -128,9 +384,11 @@ class PostgresRaceRepository(RaceRepository):
         results: List[ResultLine],
         classification_db_id: UUID,
         rider_id_map: Dict[str, UUID],
-    ):
+        year: int,
+    ) -> List[ResultPoints]:
+        """Inserts the results not stored yet and returns those inserted."""
         if not results:
-            return
+            return []
         results_to_insert: List[Dict[str, Union[UUID, str, int]]] = []
         for result in results:
             rider_db_id = rider_id_map.get(result.rider_pcs_id)
@@ -139,6 +397,7 @@ class PostgresRaceRepository(RaceRepository):
                     {
                         "classification_id": classification_db_id,
                         "rider_id": rider_db_id,
+                        "year": year,
                         "team_name": result.team_name,
                         "points": result.points,
                     }
@@ -147,6 +406,13 @@ class PostgresRaceRepository(RaceRepository):
         if results_to_insert:
             ins = insert(pcs_points_results_table).values(results_to_insert)
             stmt = ins.on_conflict_do_nothing(
-                index_elements=["classification_id", "rider_id"]
+                index_elements=["classification_id", "rider_id", "year"]
+            ).returning(
+                pcs_points_results_table.c.rider_id, pcs_points_results_table.c.points
             )
-            conn.execute(stmt)
+            return [(row.rider_id, row.points) for row in conn.execute(stmt)]
+        return []
+
+
+def _key(classification: Classification) -> ClassificationKey:
+    return (classification.classification_type, classification.stage_number)
@@ -0,0 +1,177 @@
+from datetime import timedelta
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, cast, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import func
+
+from procycling_scraper.scraping.application.ports.race_work_queue import (
+    RaceWorkQueue,
+)
+from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.domain.entities.race_work_item import (
+    RaceWorkItem,
+    WorkItemStatus,
+)
+from procycling_scraper.scraping.infrastructure.database.schema import (
+    race_work_items_table,
+)
+
+_items = race_work_items_table
+
+
+def _status(status: WorkItemStatus):
+    return cast(literal(status, _items.c.status.type), _items.c.status.type)
+
+
+def _requeue_or_fail(max_attempts: int):
+    """Status of a released item: FAILED once its attempts are used up."""
+    return case(
+        (_items.c.attempts >= max_attempts, _status(WorkItemStatus.FAILED)),
+        else_=_status(WorkItemStatus.QUEUED),
+    )
+
+
+class PostgresRaceWorkQueue(RaceWorkQueue):
+    """
+    Work queue on the ``race_work_items`` table.
+
+    Workers claim with ``SELECT ... FOR UPDATE SKIP LOCKED`` inside a single
+    ``UPDATE``, so concurrent claims never block on, or hand out, the same
+    row. Every state change is guarded by ``leased_by`` so that a worker
+    whose lease was reclaimed cannot overwrite the new holder's outcome.
+    """
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+
+    def enqueue(self, year: int, races_info: List[Tuple[str, RaceType]]) -> int:
+        if not races_info:
+            return 0
+        stmt = insert(_items).values(
+            [
+                {
+                    "race_pcs_id": pcs_id,
+                    "race_type": race_type,
+                    "year": year,
+                    "status": WorkItemStatus.QUEUED,
+                }
+                for pcs_id, race_type in dict(races_info).items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["race_pcs_id"],
+            set_={
+                "status": WorkItemStatus.QUEUED,
+                "attempts": 0,
+                "last_error": None,
+                "updated_at": func.now(),
+            },
+            where=_items.c.status == WorkItemStatus.FAILED,
+        ).returning(_items.c.id)
+        with self._engine.connect() as conn:
+            return len(conn.execute(stmt).all())
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[RaceWorkItem]:
+        next_item = (
+            select(_items.c.id)
+            .where(_items.c.status == WorkItemStatus.QUEUED)
+            .order_by(_items.c.year, _items.c.created_at, _items.c.race_pcs_id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(_items)
+            .where(_items.c.id == next_item)
+            .values(
+                status=WorkItemStatus.LEASED,
+                leased_by=worker_id,
+                lease_expires_at=func.now() + timedelta(seconds=lease_seconds),
+                attempts=_items.c.attempts + 1,
+            )
+            .returning(
+                _items.c.id,
+                _items.c.race_pcs_id,
+                _items.c.race_type,
+                _items.c.year,
+                _items.c.attempts,
+            )
+        )
+        with self._engine.connect() as conn:
+            row = conn.execute(stmt).first()
+        if row is None:
+            return None
+        return RaceWorkItem(
+            id=row.id,
+            race_pcs_id=row.race_pcs_id,
+            race_type=row.race_type,
+            year=row.year,
+            attempts=row.attempts,
+        )
+
+    def heartbeat(self, item_id: UUID, worker_id: str, lease_seconds: float) -> bool:
+        stmt = (
+            update(_items)
+            .where(*self._held_by(item_id, worker_id))
+            .values(lease_expires_at=func.now() + timedelta(seconds=lease_seconds))
+        )
+        with self._engine.connect() as conn:
+            return conn.execute(stmt).rowcount == 1
+
+    def complete(self, item_id: UUID, worker_id: str) -> None:
+        stmt = (
+            update(_items)
+            .where(*self._held_by(item_id, worker_id))
+            .values(
+                status=WorkItemStatus.DONE,
+                leased_by=None,
+                lease_expires_at=None,
+                last_error=None,
+            )
+        )
+        with self._engine.connect() as conn:
+            conn.execute(stmt)
+
+    def fail(
+        self, item_id: UUID, worker_id: str, error: str, max_attempts: int
+    ) -> None:
+        stmt = (
+            update(_items)
+            .where(*self._held_by(item_id, worker_id))
+            .values(
+                status=_requeue_or_fail(max_attempts),
+                leased_by=None,
+                lease_expires_at=None,
+                last_error=error,
+            )
+        )
+        with self._engine.connect() as conn:
+            conn.execute(stmt)
+
+    def reclaim_expired(self, max_attempts: int) -> int:
+        stmt = (
+            update(_items)
+            .where(
+                _items.c.status == WorkItemStatus.LEASED,
+                _items.c.lease_expires_at < func.now(),
+            )
+            .values(
+                status=_requeue_or_fail(max_attempts),
+                leased_by=None,
+                lease_expires_at=None,
+                last_error="Lease expired",
+            )
+        )
+        with self._engine.connect() as conn:
+            return conn.execute(stmt).rowcount
+
+    @staticmethod
+    def _held_by(item_id: UUID, worker_id: str):
+        return (
+            _items.c.id == item_id,
+            _items.c.leased_by == worker_id,
+            _items.c.status == WorkItemStatus.LEASED,
+        )
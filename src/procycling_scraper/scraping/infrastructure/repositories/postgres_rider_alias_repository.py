@@ -0,0 +1,112 @@
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import func
+
+from procycling_scraper.analysis.domain.repositories.rider_alias_repository import (
+    RiderAliasRepository,
+)
+from procycling_scraper.analysis.domain.rider_alias import (
+    AliasKey,
+    AliasSource,
+    RiderAlias,
+)
+from procycling_scraper.scraping.domain.entities.rider import Rider
+from procycling_scraper.scraping.infrastructure.database.schema import (
+    rider_aliases_table,
+    riders_table,
+)
+
+
+class PostgresRiderAliasRepository(RiderAliasRepository):
+    def __init__(self, engine: Engine):
+        self._engine = engine
+
+    def find_riders(self, names: Iterable[str]) -> Dict[AliasKey, Rider]:
+        names = sorted(set(names))
+        if not names:
+            return {}
+        # The primary key (name, team) serves the lookup of every name.
+        stmt = (
+            select(
+                rider_aliases_table.c.name,
+                rider_aliases_table.c.team,
+                riders_table.c.id,
+                riders_table.c.pcs_id,
+                riders_table.c.name.label("rider_name"),
+            )
+            .select_from(rider_aliases_table)
+            .join(riders_table, rider_aliases_table.c.rider_id == riders_table.c.id)
+            .where(rider_aliases_table.c.name.in_(names))
+        )
+        with self._engine.connect() as conn:
+            rows: List[Any] = list(conn.execute(stmt).fetchall())
+        return {
+            (row.name, row.team): Rider(
+                pcs_id=row.pcs_id, name=row.rider_name, id=row.id
+            )
+            for row in rows
+        }
+
+    def save_learned(self, aliases: List[RiderAlias]) -> None:
+        unique: Dict[AliasKey, RiderAlias] = {a.key: a for a in aliases}
+        if not unique:
+            return
+        # Sorted keys give concurrent requests a consistent lock order.
+        stmt = (
+            insert(rider_aliases_table)
+            .values([_row(unique[key]) for key in sorted(unique)])
+            .on_conflict_do_nothing(index_elements=["name", "team"])
+        )
+        with self._engine.connect() as conn:
+            conn.execute(stmt)
+
+    def save(self, alias: RiderAlias) -> None:
+        ins = insert(rider_aliases_table).values(_row(alias))
+        stmt = ins.on_conflict_do_update(
+            index_elements=["name", "team"],
+            set_={
+                "rider_id": ins.excluded.rider_id,
+                "source": ins.excluded.source,
+                "updated_at": func.now(),
+            },
+        )
+        with self._engine.connect() as conn:
+            conn.execution_options(isolation_level="READ COMMITTED")
+            with conn.begin():
+                if alias.source == AliasSource.MANUAL and not alias.team:
+                    conn.execute(_delete_learned(alias.name))
+                conn.execute(stmt)
+
+    def delete(self, key: AliasKey) -> bool:
+        name, team = key
+        stmt = delete(rider_aliases_table).where(
+            rider_aliases_table.c.name == name,
+            rider_aliases_table.c.team == team,
+        )
+        with self._engine.connect() as conn:
+            conn.execution_options(isolation_level="READ COMMITTED")
+            with conn.begin():
+                deleted = conn.execute(stmt).rowcount
+                if not team:
+                    deleted += conn.execute(_delete_learned(name)).rowcount
+        return deleted > 0
+
+
+def _delete_learned(name: str):
+    # Learned aliases of a name for every team.
+    return delete(rider_aliases_table).where(
+        rider_aliases_table.c.name == name,
+        rider_aliases_table.c.source == AliasSource.AUTO,
+    )
+
+
+def _row(alias: RiderAlias) -> Dict[str, Any]:
+    return {
+        "name": alias.name,
+        "team": alias.team,
+        "rider_id": alias.rider_id,
+        "source": alias.source,
+    }
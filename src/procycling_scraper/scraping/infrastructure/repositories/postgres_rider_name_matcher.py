@@ -0,0 +1,97 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from procycling_scraper.analysis.domain.rider_alias import normalize_alias
+from procycling_scraper.analysis.domain.rider_matching_service import (
+    best_scored_match,
+)
+from procycling_scraper.analysis.domain.rider_name_matcher import (
+    RiderNameMatcher,
+    ScoredMatch,
+)
+from procycling_scraper.scraping.domain.entities.rider import Rider
+
+# Up to :max_candidates riders per name, most similar first. `%` is the
+# pg_trgm similarity operator, served by ix_riders_name_normalized_trgm.
+_CANDIDATES_SQL = """
+    SELECT q.ord, r.id, r.pcs_id, r.name
+    FROM unnest(CAST(:names AS text[])) WITH ORDINALITY AS q(name, ord)
+    CROSS JOIN LATERAL (
+        SELECT riders.id, riders.pcs_id, riders.name
+        FROM riders
+        WHERE riders.name_normalized % q.name
+        ORDER BY similarity(riders.name_normalized, q.name) DESC,
+            riders.name, riders.id
+        LIMIT :max_candidates
+    ) AS r
+    ORDER BY q.ord
+"""
+
+
+class PostgresRiderNameMatcher(RiderNameMatcher):
+    """
+    Matches rider names inside PostgreSQL, for deployments where holding
+    every rider in each API worker, as ``RiderMatchingService`` does, is
+    too costly.
+
+    One query shortlists the riders of the whole roster through the pg_trgm
+    index on ``riders.name_normalized``; the shortlist is then scored with
+    ``best_scored_match``, so scores and cutoff are those of the in-process
+    matcher. Riders sharing fewer trigrams with a name than
+    ``similarity_threshold`` are never candidates, which leaves names of
+    three characters or less, which the in-process matcher compares with
+    every rider, mostly unmatched. Teams are not used.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        score_cutoff: int = 85,
+        max_candidates: int = 50,
+        similarity_threshold: float = 0.3,
+    ):
+        self._engine = engine
+        self._score_cutoff = score_cutoff
+        self._max_candidates = max_candidates
+        self._similarity_threshold = similarity_threshold
+
+    def find_scored_matches(
+        self, api_names: Iterable[str], teams: Optional[Sequence[str]] = None
+    ) -> List[Optional[ScoredMatch]]:
+        api_names = list(api_names)
+        if not api_names:
+            return []
+
+        with self._engine.connect() as conn:
+            # set_config(..., true) only lasts for the transaction.
+            conn.execution_options(isolation_level="READ COMMITTED")
+            with conn.begin():
+                conn.execute(
+                    text(
+                        "SELECT set_config("
+                        "'pg_trgm.similarity_threshold', :threshold, true)"
+                    ),
+                    {"threshold": str(self._similarity_threshold)},
+                )
+                rows: List[Any] = list(
+                    conn.execute(
+                        text(_CANDIDATES_SQL),
+                        {
+                            "names": [normalize_alias(n) for n in api_names],
+                            "max_candidates": self._max_candidates,
+                        },
+                    ).fetchall()
+                )
+
+        candidates: Dict[int, List[Rider]] = {}
+        for row in rows:
+            candidates.setdefault(row.ord, []).append(
+                Rider(pcs_id=row.pcs_id, name=row.name, id=row.id)
+            )
+        # WITH ORDINALITY numbers the names from 1.
+        return [
+            best_scored_match(name, candidates.get(position, []), self._score_cutoff)
+            for position, name in enumerate(api_names, start=1)
+        ]
@@ -1,19 +1,24 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import case, cast, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, insert
 from sqlalchemy.engine import Engine
 
-from procycling_scraper.analysis.application.dto.analysis_dtos import RiderResultDTO
+from procycling_scraper.analysis.application.dto.analysis_dtos import (
+    RiderResultDTO,
+    RiderScoreDTO,
+)
+from procycling_scraper.analysis.domain.rider_alias import normalize_alias
+from procycling_scraper.analysis.domain.value_score_calculator import ScoreWeights
+from procycling_scraper.scraping.domain.entities.race import RaceType
 from procycling_scraper.scraping.domain.entities.rider import Rider
 from procycling_scraper.scraping.domain.repositories.rider_repository import (
     RiderRepository,
 )
 from procycling_scraper.scraping.infrastructure.database.schema import (
-    classifications_table,
     pcs_points_results_table,
-    races_table,
+    rider_season_points_table,
     riders_table,
 )
 
@@ -23,13 +28,51 @@ class PostgresRiderRepository(RiderRepository):
         self._engine = engine
 
     def save(self, rider: Rider) -> None:
-        stmt = insert(riders_table).values(pcs_id=rider.pcs_id, name=rider.name)
+        stmt = insert(riders_table).values(_row(rider.pcs_id, rider.name))
         stmt = stmt.on_conflict_do_nothing(index_elements=["pcs_id"])
         with self._engine.connect() as conn:
             conn.execute(stmt)
 
+    def save_many(self, riders: List[Rider]) -> Dict[str, UUID]:
+        names_by_pcs_id = {rider.pcs_id: rider.name for rider in riders}
+        if not names_by_pcs_id:
+            return {}
+        # Sorted keys give concurrent batches a consistent lock order.
+        pcs_ids = sorted(names_by_pcs_id)
+        inserted = (
+            insert(riders_table)
+            .values([_row(p, names_by_pcs_id[p]) for p in pcs_ids])
+            .on_conflict_do_nothing(index_elements=["pcs_id"])
+            .returning(riders_table.c.pcs_id, riders_table.c.id)
+            .cte("inserted_riders")
+        )
+        stmt = union_all(
+            select(inserted.c.pcs_id, inserted.c.id),
+            select(riders_table.c.pcs_id, riders_table.c.id).where(
+                riders_table.c.pcs_id.in_(pcs_ids)
+            ),
+        )
+        with self._engine.connect() as conn:
+            rider_id_map: Dict[str, UUID] = {
+                pcs_id: rider_id for pcs_id, rider_id in conn.execute(stmt)
+            }
+            # Rows committed by a concurrent batch after this statement's
+            # snapshot are neither inserted nor visible; fetch them now.
+            missing = [p for p in pcs_ids if p not in rider_id_map]
+            if missing:
+                missing_stmt = select(riders_table.c.pcs_id, riders_table.c.id).where(
+                    riders_table.c.pcs_id.in_(missing)
+                )
+                rider_id_map.update(
+                    {
+                        pcs_id: rider_id
+                        for pcs_id, rider_id in conn.execute(missing_stmt)
+                    }
+                )
+        return rider_id_map
+
     def find_all(self) -> List[Rider]:
-        stmt = select(riders_table)
+        stmt = select(riders_table.c.id, riders_table.c.pcs_id, riders_table.c.name)
         with self._engine.connect() as conn:
             results: List[Any] = list(conn.execute(stmt).fetchall())
 
@@ -40,28 +83,27 @@ class PostgresRiderRepository(RiderRepository):
             riders.append(Rider(pcs_id=row.pcs_id, name=row.name, id=row.id))
         return riders
 
+    def riders_version(self) -> str:
+        # New riders get a later updated_at; the count also catches deletes.
+        stmt = select(func.count(), func.max(riders_table.c.updated_at))
+        with self._engine.connect() as conn:
+            count, last_updated = conn.execute(stmt).one()
+        return f"{count}:{last_updated.isoformat() if last_updated else ''}"
+
     def find_all_results_by_rider_ids(
         self, rider_ids: List[UUID]
     ) -> Dict[UUID, List[RiderResultDTO]]:
         if not rider_ids:
             return {}
 
-        stmt = (
-            select(
-                pcs_points_results_table.c.rider_id,
-                pcs_points_results_table.c.points,
-                races_table.c.year,
-                races_table.c.type.label("race_type"),
-            )
-            .select_from(pcs_points_results_table)
-            .join(
-                classifications_table,
-                pcs_points_results_table.c.classification_id
-                == classifications_table.c.id,
-            )
-            .join(races_table, classifications_table.c.race_id == races_table.c.id)
-            .where(pcs_points_results_table.c.rider_id.in_(rider_ids))
-        )
+        # One row per rider, season and race type from the rollup rather
+        # than every result row joined through classifications and races.
+        stmt = select(
+            rider_season_points_table.c.rider_id,
+            rider_season_points_table.c.total_points.label("points"),
+            rider_season_points_table.c.year,
+            rider_season_points_table.c.race_type,
+        ).where(rider_season_points_table.c.rider_id.in_(rider_ids))
 
         with self._engine.connect() as conn:
             db_results: List[Any] = list(conn.execute(stmt).fetchall())
@@ -80,5 +122,101 @@ class PostgresRiderRepository(RiderRepository):
 
         return grouped_results
 
-    def find_by_pcs_id(self, pcs_id: str):
-        pass
+    def find_recent_teams(self, since_year: int) -> Dict[UUID, Set[str]]:
+        # The year filter prunes the scan to the partitions of those seasons.
+        stmt = (
+            select(
+                pcs_points_results_table.c.rider_id,
+                pcs_points_results_table.c.team_name,
+            )
+            .where(pcs_points_results_table.c.year >= since_year)
+            .distinct()
+        )
+        with self._engine.connect() as conn:
+            rows: List[Any] = list(conn.execute(stmt).fetchall())
+
+        teams: Dict[UUID, Set[str]] = {}
+        for row in rows:
+            teams.setdefault(row.rider_id, set()).add(row.team_name)
+        return teams
+
+    def find_scores_by_rider_ids(
+        self,
+        rider_ids: List[UUID],
+        target_race_type: RaceType,
+        current_year: int,
+        weights: ScoreWeights,
+    ) -> Dict[UUID, RiderScoreDTO]:
+        if not rider_ids:
+            return {}
+
+        # One GROUP BY over the rollup; the weights are bound parameters.
+        points = rider_season_points_table.c.total_points
+        race_type = rider_season_points_table.c.race_type
+        year_diff = literal(current_year) - rider_season_points_table.c.year
+        year_weight = case(
+            (year_diff <= 0, _weight(weights.season_weights[0])),
+            *[
+                (year_diff == diff, _weight(weight))
+                for diff, weight in enumerate(weights.season_weights)
+                if diff > 0
+            ],
+            else_=_weight(weights.older_season_weight),
+        )
+        type_weight = case(
+            (race_type == target_race_type, _weight(weights.target_race_type_weight)),
+            else_=_weight(weights.other_race_type_weight),
+        )
+        stmt = (
+            select(
+                rider_season_points_table.c.rider_id,
+                func.sum(case((race_type == RaceType.ONE_DAY, points), else_=0)).label(
+                    "one_day_points"
+                ),
+                func.sum(
+                    case((race_type == RaceType.STAGE_RACE, points), else_=0)
+                ).label("stage_race_points"),
+                # Grouped like ValueScoreCalculator: points * (year * type),
+                # but over season totals, so the last bits may differ.
+                func.sum(points * (year_weight * type_weight).self_group()).label(
+                    "total_weighted_points"
+                ),
+            )
+            .where(rider_season_points_table.c.rider_id.in_(rider_ids))
+            .group_by(rider_season_points_table.c.rider_id)
+        )
+
+        with self._engine.connect() as conn:
+            rows: List[Any] = list(conn.execute(stmt).fetchall())
+
+        scores = {
+            rider_id: RiderScoreDTO(rider_id, 0, 0, 0.0) for rider_id in rider_ids
+        }
+        for row in rows:
+            scores[row.rider_id] = RiderScoreDTO(
+                rider_id=row.rider_id,
+                one_day_points=int(row.one_day_points),
+                stage_race_points=int(row.stage_race_points),
+                total_weighted_points=float(row.total_weighted_points),
+            )
+        return scores
+
+    def find_by_pcs_id(self, pcs_id: str) -> Optional[Rider]:
+        stmt = select(
+            riders_table.c.id, riders_table.c.pcs_id, riders_table.c.name
+        ).where(riders_table.c.pcs_id == pcs_id)
+        with self._engine.connect() as conn:
+            row = conn.execute(stmt).first()
+        if row is None:
+            return None
+        return Rider(pcs_id=row.pcs_id, name=row.name, id=row.id)
+
+
+def _row(pcs_id: str, name: str) -> Dict[str, str]:
+    # Names are normalised as alias keys are, for the pg_trgm matcher.
+    return {"pcs_id": pcs_id, "name": name, "name_normalized": normalize_alias(name)}
+
+
+def _weight(value: float):
+    # Cast so that Postgres multiplies doubles, as Python does, not numerics.
+    return cast(literal(value), DOUBLE_PRECISION)
@@ -0,0 +1,109 @@
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import func
+
+from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.infrastructure.database.schema import (
+    rider_season_points_table,
+)
+
+# (rider_id, points) of one pcs_points_results row.
+ResultPoints = Tuple[UUID, int]
+
+_REBUILD_SQL = """
+    INSERT INTO rider_season_points
+        (rider_id, year, race_type, total_points, result_count)
+    SELECT r.rider_id, ra.year, ra.type, SUM(r.points), COUNT(*)
+    FROM pcs_points_results r
+    JOIN classifications c ON c.id = r.classification_id
+    JOIN races ra ON ra.id = c.race_id
+    GROUP BY r.rider_id, ra.year, ra.type
+"""
+
+
+class PostgresRiderSeasonPoints:
+    """
+    The ``rider_season_points`` rollup: total points and number of results
+    of every rider per season and race type.
+
+    Race repositories call ``apply`` in the transaction that writes the
+    results of a race, with the result rows it inserted and deleted, so the
+    rollup commits together with the results it summarises. ``rebuild``
+    recomputes it from ``pcs_points_results``, for results changed by any
+    other means (deleting a race, editing rows by hand).
+    """
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+
+    def rebuild(self) -> int:
+        """Recomputes the whole rollup and returns the number of rows."""
+        with self._engine.connect() as conn:
+            # DELETE rather than TRUNCATE: readers keep seeing the old rows
+            # until the rebuild commits instead of blocking on the table.
+            conn.execution_options(isolation_level="READ COMMITTED")
+            with conn.begin():
+                conn.execute(delete(rider_season_points_table))
+                return conn.execute(text(_REBUILD_SQL)).rowcount
+
+    @staticmethod
+    def apply(
+        conn: Connection,
+        year: int,
+        race_type: RaceType,
+        inserted: Iterable[ResultPoints],
+        deleted: Iterable[ResultPoints] = (),
+    ) -> None:
+        """
+        Adds the ``inserted`` results of a race of ``year`` and ``race_type``
+        to the rollup and subtracts the ``deleted`` ones.
+        """
+        deltas: Dict[UUID, List[int]] = {}
+        for rider_id, points in inserted:
+            delta = deltas.setdefault(rider_id, [0, 0])
+            delta[0] += points
+            delta[1] += 1
+        for rider_id, points in deleted:
+            delta = deltas.setdefault(rider_id, [0, 0])
+            delta[0] -= points
+            delta[1] -= 1
+        changed = sorted(r for r, delta in deltas.items() if delta != [0, 0])
+        if not changed:
+            return
+
+        table = rider_season_points_table
+        # Sorted keys give concurrent saves a consistent lock order.
+        ins = insert(table).values(
+            [
+                {
+                    "rider_id": rider_id,
+                    "year": year,
+                    "race_type": race_type,
+                    "total_points": deltas[rider_id][0],
+                    "result_count": deltas[rider_id][1],
+                }
+                for rider_id in changed
+            ]
+        )
+        conn.execute(
+            ins.on_conflict_do_update(
+                index_elements=["rider_id", "year", "race_type"],
+                set_={
+                    "total_points": table.c.total_points + ins.excluded.total_points,
+                    "result_count": table.c.result_count + ins.excluded.result_count,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        conn.execute(
+            delete(table).where(
+                table.c.rider_id.in_(changed),
+                table.c.year == year,
+                table.c.race_type == race_type,
+                table.c.result_count <= 0,
+            )
+        )
@@ -0,0 +1,142 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import func
+
+from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.domain.entities.scrape_job import (
+    ScrapeItemStatus,
+    ScrapeJob,
+    ScrapeJobItem,
+    ScrapeJobStatus,
+)
+from procycling_scraper.scraping.domain.repositories.scrape_job_repository import (
+    ScrapeJobRepository,
+)
+from procycling_scraper.scraping.infrastructure.database.schema import (
+    scrape_job_races_table,
+    scrape_jobs_table,
+)
+
+
+class PostgresScrapeJobRepository(ScrapeJobRepository):
+    def __init__(self, engine: Engine):
+        self._engine = engine
+
+    def create(self, year: int, races_info: List[Tuple[str, RaceType]]) -> ScrapeJob:
+        # One journal row per race URL, in the order the races were listed.
+        races_info = list(dict(races_info).items())
+        job_stmt = (
+            insert(scrape_jobs_table)
+            .values(year=year, status=ScrapeJobStatus.RUNNING)
+            .returning(scrape_jobs_table.c.id)
+        )
+        # A job must never be visible without its races, otherwise a resumed
+        # run would find nothing pending; the engine autocommits, so ask for
+        # a real transaction here.
+        with self._engine.connect() as conn:
+            conn.execution_options(isolation_level="READ COMMITTED")
+            with conn.begin():
+                job_id = conn.execute(job_stmt).scalar_one()
+                if races_info:
+                    conn.execute(
+                        insert(scrape_job_races_table),
+                        [
+                            {
+                                "job_id": job_id,
+                                "race_pcs_id": pcs_id,
+                                "position": position,
+                                "race_type": race_type,
+                                "status": ScrapeItemStatus.PENDING,
+                            }
+                            for position, (pcs_id, race_type) in enumerate(races_info)
+                        ],
+                    )
+        return ScrapeJob(
+            id=job_id,
+            year=year,
+            items=[
+                ScrapeJobItem(pcs_id, race_type) for pcs_id, race_type in races_info
+            ],
+        )
+
+    def find_open_by_year(self, year: int) -> Optional[ScrapeJob]:
+        return self._find_latest(year, ScrapeJobStatus.RUNNING)
+
+    def find_latest_by_year(self, year: int) -> Optional[ScrapeJob]:
+        return self._find_latest(year)
+
+    def record_attempt(
+        self,
+        job_id: UUID,
+        race_pcs_id: str,
+        status: ScrapeItemStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        stmt = (
+            update(scrape_job_races_table)
+            .where(
+                scrape_job_races_table.c.job_id == job_id,
+                scrape_job_races_table.c.race_pcs_id == race_pcs_id,
+            )
+            .values(
+                status=status,
+                attempts=scrape_job_races_table.c.attempts + 1,
+                last_error=error,
+            )
+        )
+        with self._engine.connect() as conn:
+            conn.execute(stmt)
+
+    def finish(self, job_id: UUID) -> None:
+        stmt = (
+            update(scrape_jobs_table)
+            .where(scrape_jobs_table.c.id == job_id)
+            .values(status=ScrapeJobStatus.FINISHED, finished_at=func.now())
+        )
+        with self._engine.connect() as conn:
+            conn.execute(stmt)
+
+    def _find_latest(
+        self, year: int, status: Optional[ScrapeJobStatus] = None
+    ) -> Optional[ScrapeJob]:
+        stmt = select(scrape_jobs_table.c.id, scrape_jobs_table.c.status).where(
+            scrape_jobs_table.c.year == year
+        )
+        if status is not None:
+            stmt = stmt.where(scrape_jobs_table.c.status == status)
+        stmt = stmt.order_by(scrape_jobs_table.c.created_at.desc()).limit(1)
+
+        with self._engine.connect() as conn:
+            row = conn.execute(stmt).first()
+            if row is None:
+                return None
+            return ScrapeJob(
+                id=row.id, year=year, status=row.status, items=self._items(conn, row.id)
+            )
+
+    @staticmethod
+    def _items(conn: Connection, job_id: UUID) -> List[ScrapeJobItem]:
+        stmt = (
+            select(
+                scrape_job_races_table.c.race_pcs_id,
+                scrape_job_races_table.c.race_type,
+                scrape_job_races_table.c.status,
+                scrape_job_races_table.c.attempts,
+                scrape_job_races_table.c.last_error,
+            )
+            .where(scrape_job_races_table.c.job_id == job_id)
+            .order_by(scrape_job_races_table.c.position)
+        )
+        return [
+            ScrapeJobItem(
+                race_pcs_id=row.race_pcs_id,
+                race_type=row.race_type,
+                status=row.status,
+                attempts=row.attempts,
+                last_error=row.last_error,
+            )
+            for row in conn.execute(stmt)
+        ]
@@ -1,16 +1,22 @@
 import logging
 import re
-from typing import Dict, List, Optional, Set, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AbstractSet, Callable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 import requests
 from bs4 import BeautifulSoup, Tag
 
+from procycling_scraper.scraping.application.dto.fetched_page import FetchedPage
 from procycling_scraper.scraping.application.dto.scraped_race_data import (
     ScrapedRaceData,
 )
 from procycling_scraper.scraping.application.ports.race_data_scraper import (
     RaceDataScraper,
 )
+from procycling_scraper.scraping.application.ports.race_page_scraper import (
+    RacePageScraper,
+)
 from procycling_scraper.scraping.domain.entities.classification import (
     Classification,
     ClassificationType,
@@ -18,16 +24,151 @@ from procycling_scraper.scraping.domain.entities.classification import (
 from procycling_scraper.scraping.domain.entities.race import Race, RaceType
 from procycling_scraper.scraping.domain.entities.rider import Rider
 from procycling_scraper.scraping.domain.value_objects.result_line import ResultLine
+from procycling_scraper.scraping.infrastructure.http.http_client import HttpClient
+from procycling_scraper.scraping.infrastructure.scrapers.results_table_extractor import (
+    ResultRow,
+    ResultsTableHeadersError,
+    ResultsTableNotFoundError,
+    extract_result_rows,
+)
 
 logger = logging.getLogger(__name__)
 
+ClassificationUrl = Tuple[str, ClassificationType, Optional[int]]
+PendingRows = Callable[[], List[ResultRow]]
+
+T = TypeVar("T")
+
+_CLASSIFICATION_TYPE_ORDER = {t: i for i, t in enumerate(ClassificationType)}
+
+
+def _classification_order(classification: Classification) -> Tuple[bool, int, int]:
+    """Sort key: numbered stages first, then by classification type."""
+    return (
+        classification.stage_number is None,
+        classification.stage_number or 0,
+        _CLASSIFICATION_TYPE_ORDER[classification.classification_type],
+    )
+
+
+@dataclass(frozen=True)
+class _RacePage:
+    """
+    What is read from a race entry page, small enough to return from a parse
+    process.
+
+    Attributes:
+        title (Optional[str]): Text of the h1, None if the page has none.
+        classification_urls (Optional[List[ClassificationUrl]]): Pages of the
+            classification nav; None when the nav has no menu to read them
+            from.
+    """
+
+    title: Optional[str]
+    classification_urls: Optional[List[ClassificationUrl]]
+
+
+def _parse_race_page(html: str) -> _RacePage:
+    soup = BeautifulSoup(html, "lxml")
+    title_tag = soup.find("h1")
+    return _RacePage(
+        title=title_tag.text.strip() if isinstance(title_tag, Tag) else None,
+        classification_urls=_extract_classification_urls(soup),
+    )
+
+
+def _extract_classification_urls(
+    soup: BeautifulSoup,
+) -> Optional[List[ClassificationUrl]]:
+    nav_containers = soup.select("div.selectNav")
+    if not nav_containers:
+        return []
+    for container in nav_containers:
+        prev_next_links = container.find_all("a")
+        has_prev_next = False
+        for link in prev_next_links:
+            link_text = link.get_text(strip=True)
+            if (
+                "PREV" in link_text
+                or "NEXT" in link_text
+                or "«" in link_text
+                or "»" in link_text
+            ):
+                has_prev_next = True
+                break
+        if has_prev_next:
+            target_select_menu = container.find("select")
+            if isinstance(target_select_menu, Tag):
+                return _parse_select_menu_options(target_select_menu)
+    return None
+
+
+def _parse_select_menu_options(select_menu: Tag) -> List[ClassificationUrl]:
+    urls_to_scrape: List[ClassificationUrl] = []
+    for option in select_menu.find_all("option"):
+        if not isinstance(option, Tag) or not option.has_attr("value"):
+            continue
+        value_attr = option["value"]
+        if not isinstance(value_attr, str) or not value_attr:
+            continue
+        url_path, option_text = value_attr, option.text.lower()
+        if "teams" in url_path or "youth" in url_path:
+            continue
+        stage_num_match = re.search(r"stage-(\d+)", url_path)
+        if (
+            "stage-" in url_path
+            and stage_num_match
+            and "points" not in url_path
+            and "kom" not in url_path
+        ):
+            urls_to_scrape.append(
+                (url_path, ClassificationType.STAGE, int(stage_num_match.group(1)))
+            )
+            continue
+        if "points classification" in option_text:
+            urls_to_scrape.append((url_path, ClassificationType.POINTS, None))
+        elif "mountains classification" in option_text:
+            urls_to_scrape.append((url_path, ClassificationType.KOM, None))
+        elif "final gc" in option_text:
+            urls_to_scrape.append((url_path, ClassificationType.GENERAL, None))
+    return urls_to_scrape
+
+
+class ProCyclingStatsRaceDataScraper(RaceDataScraper, RacePageScraper):
+    """
+    Scrapes a race page by page from ProCyclingStats.
+
+    Fetching is I/O-bound and runs in the calling thread, or in up to
+    ``max_parallel_pages`` threads per race. Parsing is CPU-bound: with a
+    ``parse_executor`` (a ``ProcessPoolExecutor``) each fetched page is
+    handed to it as soon as it arrives and parsed on another core while the
+    next pages download; only the HTML and the extracted rows cross the
+    process boundary. Without one, pages are parsed in the fetching thread.
+
+    As a ``RacePageScraper`` it also exposes the two steps separately, for
+    pipelines that fetch and parse in stages of their own.
+    """
 
-class ProCyclingStatsRaceDataScraper(RaceDataScraper):
-    def __init__(self, base_url: str = "https://www.procyclingstats.com"):
+    def __init__(
+        self,
+        base_url: str = "https://www.procyclingstats.com",
+        max_parallel_pages: int = 1,
+        http_client: Optional[HttpClient] = None,
+        parse_executor: Optional[Executor] = None,
+    ):
+        if max_parallel_pages < 1:
+            raise ValueError("max_parallel_pages must be at least 1")
         self._base_url = base_url
+        self._max_parallel_pages = max_parallel_pages
+        self._http_client = http_client or HttpClient()
+        self._parse_executor = parse_executor
 
-    def scrape(self, race_info: Tuple[str, RaceType]) -> ScrapedRaceData:
-        base_race_url_path = re.sub(r"/(gc|result|results)$", "", race_info[0])
+    def scrape(
+        self,
+        race_info: Tuple[str, RaceType],
+        known_stages: AbstractSet[int] = frozenset(),
+    ) -> ScrapedRaceData:
+        base_race_url_path = self._race_path(race_info[0])
         race_type = race_info[1]
         full_base_url = f"{self._base_url}/{base_race_url_path}"
         logger.info(
@@ -38,7 +179,7 @@ class ProCyclingStatsRaceDataScraper(RaceDataScraper):
             if race_type == RaceType.ONE_DAY:
                 return self._scrape_one_day_race(full_base_url, race_type)
             else:
-                return self._scrape_stage_race(full_base_url, race_type)
+                return self._scrape_stage_race(full_base_url, race_type, known_stages)
         except ValueError as e:
             logger.error(
                 "scrape_race_failed", extra={"race_url": full_base_url, "error": str(e)}
@@ -51,223 +192,232 @@ class ProCyclingStatsRaceDataScraper(RaceDataScraper):
             )
             return ScrapedRaceData(race=race, riders=[])
 
+    def fetch_pages(
+        self,
+        race_info: Tuple[str, RaceType],
+        known_stages: AbstractSet[int] = frozenset(),
+    ) -> Tuple[Race, Iterator[FetchedPage]]:
+        race_url = f"{self._base_url}/{self._race_path(race_info[0])}"
+        if race_info[1] == RaceType.ONE_DAY:
+            race, _, html = self._scrape_race_details(
+                f"{race_url}/result", race_info[1]
+            )
+            return race, iter([FetchedPage(ClassificationType.GENERAL, None, html)])
+
+        race, classification_urls, html = self._scrape_race_details(
+            f"{race_url}/gc", race_info[1]
+        )
+        if classification_urls is None:
+            logger.warning("classification_select_missing")
+        if not classification_urls:
+            logger.warning("classification_urls_missing", extra={"race_url": race_url})
+            # Like _scrape_stage_race: the riders of the table on the entry
+            # page are kept, but it is not stored as the final GC.
+            return race, iter(
+                [FetchedPage(ClassificationType.GENERAL, None, html, riders_only=True)]
+            )
+        return race, self._fetch_pages(
+            [
+                url
+                for url in classification_urls
+                if url[1] != ClassificationType.STAGE or url[2] not in known_stages
+            ]
+        )
+
+    def parse_page(self, page: FetchedPage) -> Tuple[Classification, List[Rider]]:
+        return self._scrape_classification_table(
+            self._submit_parse(extract_result_rows, page.html),
+            page.classification_type,
+            page.stage_number,
+        )
+
+    def _fetch_pages(
+        self, classification_urls: List[ClassificationUrl]
+    ) -> Iterator[FetchedPage]:
+        for classification_url in classification_urls:
+            html = self._get_classification_html(classification_url)
+            if html is not None:
+                yield FetchedPage(classification_url[1], classification_url[2], html)
+
+    @staticmethod
+    def _race_path(race_pcs_id: str) -> str:
+        return re.sub(r"/(gc|result|results)$", "", race_pcs_id)
+
     def _scrape_one_day_race(
         self, race_url: str, race_type: RaceType
     ) -> ScrapedRaceData:
         results_url = f"{race_url}/result"
-        race, soup = self._scrape_race_details(results_url, race_type)
-        if not soup:
-            return ScrapedRaceData(race=race, riders=[])
+        race, _, html = self._scrape_race_details(results_url, race_type)
         gc_classification, gc_riders = self._scrape_classification_table(
-            soup, ClassificationType.GENERAL
+            self._submit_parse(extract_result_rows, html), ClassificationType.GENERAL
         )
         race.add_classification(gc_classification)
         return ScrapedRaceData(race=race, riders=gc_riders)
 
-    def _scrape_stage_race(self, race_url: str, race_type: RaceType) -> ScrapedRaceData:
+    def _scrape_stage_race(
+        self, race_url: str, race_type: RaceType, known_stages: AbstractSet[int]
+    ) -> ScrapedRaceData:
         entry_url = f"{race_url}/gc"
-        race, soup = self._scrape_race_details(entry_url, race_type)
-        if not soup:
-            return ScrapedRaceData(race=race, riders=[])
+        race, classification_urls, html = self._scrape_race_details(
+            entry_url, race_type
+        )
 
         all_found_riders: Set[Rider] = set()
 
-        classification_urls = self._extract_classification_urls(soup)
+        if classification_urls is None:
+            logger.warning("classification_select_missing")
         if not classification_urls:
             logger.warning("classification_urls_missing", extra={"race_url": race_url})
             _, gc_riders = self._scrape_classification_table(
-                soup, ClassificationType.GENERAL
+                self._submit_parse(extract_result_rows, html),
+                ClassificationType.GENERAL,
             )
             all_found_riders.update(gc_riders)
         else:
-            for url_path, classification_type, stage_num in classification_urls:
-                full_url = f"{self._base_url}/{url_path}"
-                logger.info(
-                    "scrape_classification",
-                    extra={
-                        "classification_url": full_url,
-                        "type": classification_type.value,
-                        "stage": stage_num,
-                    },
-                )
-                page_soup = self._get_page_soup(full_url)
-                if not page_soup:
+            classification_urls = [
+                (url_path, classification_type, stage_num)
+                for url_path, classification_type, stage_num in classification_urls
+                if classification_type != ClassificationType.STAGE
+                or stage_num not in known_stages
+            ]
+            scraped_classifications: List[Classification] = []
+            for scraped in self._scrape_classification_pages(classification_urls):
+                if not scraped:
                     continue
-                classification, riders = self._scrape_classification_table(
-                    page_soup, classification_type, stage_num
-                )
-                race.add_classification(classification)
+                classification, riders = scraped
+                scraped_classifications.append(classification)
                 all_found_riders.update(riders)
+            for classification in sorted(
+                scraped_classifications, key=_classification_order
+            ):
+                race.add_classification(classification)
         return ScrapedRaceData(race=race, riders=list(all_found_riders))
 
-    def _extract_classification_urls(
-        self, soup: BeautifulSoup
-    ) -> List[Tuple[str, ClassificationType, Optional[int]]]:
-        nav_containers = soup.select("div.selectNav")
-        if not nav_containers:
-            return []
-        for container in nav_containers:
-            prev_next_links = container.find_all("a")
-            has_prev_next = False
-            for link in prev_next_links:
-                link_text = link.get_text(strip=True)
-                if (
-                    "PREV" in link_text
-                    or "NEXT" in link_text
-                    or "«" in link_text
-                    or "»" in link_text
-                ):
-                    has_prev_next = True
-                    break
-            if has_prev_next:
-                target_select_menu = container.find("select")
-                if isinstance(target_select_menu, Tag):
-                    return self._parse_select_menu_options(target_select_menu)
-        logger.warning("classification_select_missing")
-        return []
-
-    def _parse_select_menu_options(
-        self, select_menu: Tag
-    ) -> List[Tuple[str, ClassificationType, Optional[int]]]:
-        urls_to_scrape: List[Tuple[str, ClassificationType, Optional[int]]] = []
-        for option in select_menu.find_all("option"):
-            if not isinstance(option, Tag) or not option.has_attr("value"):
-                continue
-            value_attr = option["value"]
-            if not isinstance(value_attr, str) or not value_attr:
-                continue
-            url_path, option_text = value_attr, option.text.lower()
-            if "teams" in url_path or "youth" in url_path:
-                continue
-            stage_num_match = re.search(r"stage-(\d+)", url_path)
-            if (
-                "stage-" in url_path
-                and stage_num_match
-                and "points" not in url_path
-                and "kom" not in url_path
-            ):
-                urls_to_scrape.append(
-                    (url_path, ClassificationType.STAGE, int(stage_num_match.group(1)))
+    def _scrape_classification_pages(
+        self, classification_urls: List[ClassificationUrl]
+    ) -> List[Optional[Tuple[Classification, List[Rider]]]]:
+        """
+        Fetches every classification page, up to ``max_parallel_pages`` at a
+        time, submitting each to the parse stage as it arrives. Results keep
+        the input order.
+        """
+        workers = min(self._max_parallel_pages, len(classification_urls))
+        if workers <= 1:
+            pending = [self._fetch_classification_page(u) for u in classification_urls]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="scrape-page"
+            ) as executor:
+                pending = list(
+                    executor.map(self._fetch_classification_page, classification_urls)
                 )
-                continue
-            if "points classification" in option_text:
-                urls_to_scrape.append((url_path, ClassificationType.POINTS, None))
-            elif "mountains classification" in option_text:
-                urls_to_scrape.append((url_path, ClassificationType.KOM, None))
-            elif "final gc" in option_text:
-                urls_to_scrape.append((url_path, ClassificationType.GENERAL, None))
-        return urls_to_scrape
-
-    def _get_page_soup(self, url: str) -> Optional[BeautifulSoup]:
+        return [
+            (
+                self._scrape_classification_table(rows, classification_type, stage_num)
+                if rows is not None
+                else None
+            )
+            for rows, (_, classification_type, stage_num) in zip(
+                pending, classification_urls
+            )
+        ]
+
+    def _fetch_classification_page(
+        self, classification_url: ClassificationUrl
+    ) -> Optional[PendingRows]:
+        page_html = self._get_classification_html(classification_url)
+        if page_html is None:
+            return None
+        return self._submit_parse(extract_result_rows, page_html)
+
+    def _get_classification_html(
+        self, classification_url: ClassificationUrl
+    ) -> Optional[str]:
+        url_path, classification_type, stage_num = classification_url
+        full_url = f"{self._base_url}/{url_path}"
+        logger.info(
+            "scrape_classification",
+            extra={
+                "classification_url": full_url,
+                "type": classification_type.value,
+                "stage": stage_num,
+            },
+        )
+        return self._get_page_html(full_url)
+
+    def _submit_parse(self, parse: Callable[[str], T], html: str) -> Callable[[], T]:
+        """
+        Hands ``html`` to the parse stage. The returned callable yields what
+        ``parse`` (a module-level function, so that it pickles) returned, or
+        raises what it raised.
+        """
+        if self._parse_executor is None:
+            return lambda: parse(html)
+        return self._parse_executor.submit(parse, html).result
+
+    def _get_page_html(self, url: str) -> Optional[str]:
         try:
-            response = requests.get(url, timeout=10)
+            response = self._http_client.get(url)
             if response.status_code == 404:
                 return None
             response.raise_for_status()
-            return BeautifulSoup(response.text, "lxml")
+            return response.text
         except requests.exceptions.RequestException as e:
             logger.error("fetch_failed", extra={"url": url, "error": str(e)})
             return None
 
     def _scrape_race_details(
         self, url: str, race_type: RaceType
-    ) -> Tuple[Race, BeautifulSoup]:
-        soup = self._get_page_soup(url)
-        if not soup:
+    ) -> Tuple[Race, Optional[List[ClassificationUrl]], str]:
+        """
+        Parses the race entry page. Returns the race, the classification
+        pages listed in its nav and the raw HTML for the results table.
+        """
+        html = self._get_page_html(url)
+        if html is None:
             raise ValueError(f"Could not fetch or parse page: {url}")
-        title_tag = soup.find("h1")
-        if not isinstance(title_tag, Tag):
+        page = self._submit_parse(_parse_race_page, html)()
+        if page.title is None:
             raise ValueError(f"Race title (h1) not found on page: {url}")
-        title = title_tag.text.strip()
-        year_match = re.search(r"^\d{4}", title)
+        year_match = re.search(r"^\d{4}", page.title)
         year = int(year_match.group(0)) if year_match else 0
         pcs_id = re.sub(
             r"/(gc|result|results|stage-\d+|points|kom).*", "", url
         ).replace(f"{self._base_url}/", "")
-        race = Race(pcs_id=pcs_id, name=title, year=year, race_type=race_type)
-        return race, soup
+        race = Race(pcs_id=pcs_id, name=page.title, year=year, race_type=race_type)
+        return race, page.classification_urls, html
 
     def _scrape_classification_table(
         self,
-        soup: BeautifulSoup,
+        pending_rows: PendingRows,
         classification_type: ClassificationType,
         stage_number: Optional[int] = None,
     ) -> Tuple[Classification, List[Rider]]:
-        results: List[ResultLine] = []
-        found_riders: List[Rider] = []
-        table = soup.select_one("div.resTab:not(.hide) table.results")
-        if not isinstance(table, Tag):
+        try:
+            rows = pending_rows()
+        except ResultsTableNotFoundError:
             logger.warning(
                 "results_table_missing",
                 extra={"classification": classification_type.value},
             )
             return Classification(classification_type, [], stage_number), []
-        try:
-            thead = table.find("thead")
-            if not isinstance(thead, Tag):
-                raise ValueError("Table head not found")
-            header_tags = thead.find_all("th")
-            team_headers, points_header, rider_header = ["Team", "Tm"], "Pnt", "Rider"
-            headers = [h.text.strip() for h in header_tags]
-            team_header_found = next((th for th in team_headers if th in headers), None)
-            if not team_header_found:
-                raise ValueError("Team header not found")
-            header_map: Dict[str, int] = {
-                "Rider": headers.index(rider_header),
-                "Team": headers.index(team_header_found),
-                "Pnt": headers.index(points_header),
-            }
-        except (ValueError, AttributeError):
+        except ResultsTableHeadersError:
             logger.warning(
                 "results_table_headers_missing",
                 extra={"classification": classification_type.value},
             )
             return Classification(classification_type, [], stage_number), []
-        tbody = table.find("tbody")
-        if not isinstance(tbody, Tag):
-            return Classification(classification_type, [], stage_number), []
-        for row_element in tbody.find_all("tr"):
-            if not isinstance(row_element, Tag):
-                continue
-            parsed_data = self._parse_result_row(row_element, header_map)
-            if parsed_data:
-                rider, result_line = parsed_data
-                results.append(result_line)
-                found_riders.append(rider)
         classification = Classification(
             classification_type=classification_type,
-            results=results,
+            results=[
+                ResultLine(
+                    rider_pcs_id=row.rider_pcs_id,
+                    team_name=row.team_name,
+                    points=row.points,
+                )
+                for row in rows
+            ],
             stage_number=stage_number,
         )
-        return classification, found_riders
-
-    def _parse_result_row(
-        self, row: Tag, header_map: Dict[str, int]
-    ) -> Optional[Tuple[Rider, ResultLine]]:
-        if len(row.find_all("td")) <= max(header_map.values()):
-            return None
-        try:
-            pcs_points_text = row.find_all("td")[header_map["Pnt"]].text.strip()
-            pcs_points_str = pcs_points_text.split()[0] if pcs_points_text else "0"
-            pcs_points = int(pcs_points_str)
-            if pcs_points <= 0:
-                return None
-        except (ValueError, IndexError):
-            return None
-        rider_cell = row.find_all("td")[header_map["Rider"]]
-        if not isinstance(rider_cell, Tag):
-            return None
-        rider_link = rider_cell.find("a")
-        if not isinstance(rider_link, Tag):
-            return None
-        href_value = rider_link.get("href")
-        if not isinstance(href_value, str):
-            return None
-        rider_pcs_id = href_value
-        rider_name = rider_link.text.strip()
-        rider = Rider(pcs_id=rider_pcs_id, name=rider_name)
-        team_name = row.find_all("td")[header_map["Team"]].text.strip()
-        result_line = ResultLine(
-            rider_pcs_id=rider_pcs_id, team_name=team_name, points=pcs_points
-        )
-        return rider, result_line
+        riders = [Rider(pcs_id=row.rider_pcs_id, name=row.rider_name) for row in rows]
+        return classification, riders
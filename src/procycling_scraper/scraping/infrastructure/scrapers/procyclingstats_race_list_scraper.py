@@ -1,6 +1,7 @@
 import logging
 import re
-from typing import Dict, List, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import requests
 from bs4 import BeautifulSoup, Tag
@@ -9,6 +10,7 @@ from procycling_scraper.scraping.application.ports.race_list_scraper import (
     RaceListScraper,
 )
 from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.infrastructure.http.http_client import HttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -19,95 +21,136 @@ class ProCyclingStatsRaceListScraper(RaceListScraper):
     EUROPE_TOUR_ID = "13"
     CIRCUIT_IDS = [WORLD_TOUR_CIRCUIT_ID, UCI_PRO_SERIES_CIRCUIT_ID, EUROPE_TOUR_ID]
 
-    def __init__(self, base_url: str = "https://www.procyclingstats.com"):
+    def __init__(
+        self,
+        base_url: str = "https://www.procyclingstats.com",
+        http_client: Optional[HttpClient] = None,
+        max_parallel_pages: int = 1,
+    ):
+        if max_parallel_pages < 1:
+            raise ValueError("max_parallel_pages must be at least 1")
         self._base_url = base_url
+        self._max_parallel_pages = max_parallel_pages
+        self._http_client = http_client or HttpClient()
 
     def scrape(self, year: int) -> List[Tuple[str, RaceType]]:
-        logger.info("scrape_race_list_start", extra={"year": year})
-        unique_races: Set[Tuple[str, RaceType]] = set()
+        return self.scrape_many([year])[year]
+
+    def scrape_many(
+        self, years: Iterable[int]
+    ) -> Dict[int, List[Tuple[str, RaceType]]]:
+        """
+        Fetches the race list of every circuit of every year in ``years``, up
+        to ``max_parallel_pages`` pages at a time. A race listed in several
+        circuits is returned once.
+        """
+        years = list(years)
+        pages = [
+            (year, circuit_id) for year in years for circuit_id in self.CIRCUIT_IDS
+        ]
+        for year in years:
+            logger.info("scrape_race_list_start", extra={"year": year})
+
+        workers = min(self._max_parallel_pages, len(pages))
+        if workers <= 1:
+            circuit_races = [self._scrape_circuit(*page) for page in pages]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="scrape-list"
+            ) as executor:
+                circuit_races = list(
+                    executor.map(lambda page: self._scrape_circuit(*page), pages)
+                )
 
-        for circuit_id in self.CIRCUIT_IDS:
-            target_url = f"{self._base_url}/races.php?year={year}&circuit={circuit_id}&filter=Filter"
+        unique_races: Dict[int, Set[Tuple[str, RaceType]]] = {y: set() for y in years}
+        for (year, _), races in zip(pages, circuit_races):
+            unique_races[year].update(races)
+        for year in years:
             logger.info(
-                "fetch_circuit_races",
-                extra={"url": target_url, "circuit_id": circuit_id},
+                "scrape_race_list_complete",
+                extra={"year": year, "unique_races": len(unique_races[year])},
             )
+        return {year: list(races) for year, races in unique_races.items()}
 
-            try:
-                response = requests.get(target_url, timeout=10)
-                response.raise_for_status()
-            except requests.exceptions.RequestException as e:
-                logger.warning(
-                    "fetch_circuit_failed",
-                    extra={
-                        "url": target_url,
-                        "error": str(e),
-                        "circuit_id": circuit_id,
-                    },
-                )
-                continue
+    def _scrape_circuit(self, year: int, circuit_id: str) -> List[Tuple[str, RaceType]]:
+        races: List[Tuple[str, RaceType]] = []
+        target_url = (
+            f"{self._base_url}/races.php?year={year}&circuit={circuit_id}&filter=Filter"
+        )
+        logger.info(
+            "fetch_circuit_races",
+            extra={"url": target_url, "circuit_id": circuit_id},
+        )
 
-            soup = BeautifulSoup(response.text, "lxml")
+        try:
+            response = self._http_client.get(target_url)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.warning(
+                "fetch_circuit_failed",
+                extra={
+                    "url": target_url,
+                    "error": str(e),
+                    "circuit_id": circuit_id,
+                },
+            )
+            return races
 
-            table = soup.select_one('table[class*="basic"]')
-            if not isinstance(table, Tag):
-                logger.warning("no_races_table", extra={"circuit_id": circuit_id})
-                continue
+        soup = BeautifulSoup(response.text, "lxml")
 
-            try:
-                thead = table.find("thead")
-                if not isinstance(thead, Tag):
-                    continue
-
-                header_tags = thead.find_all("th")
-                headers = [h.text.strip() for h in header_tags]
-
-                header_map: Dict[str, int] = {
-                    "race": headers.index("Race"),
-                    "class": headers.index("Class"),
-                }
-            except (ValueError, AttributeError):
-                logger.warning(
-                    "table_headers_missing", extra={"circuit_id": circuit_id}
-                )
-                continue
+        table = soup.select_one('table[class*="basic"]')
+        if not isinstance(table, Tag):
+            logger.warning("no_races_table", extra={"circuit_id": circuit_id})
+            return races
 
-            tbody = table.find("tbody")
-            if not isinstance(tbody, Tag):
-                continue
+        try:
+            thead = table.find("thead")
+            if not isinstance(thead, Tag):
+                return races
 
-            for row in tbody.find_all("tr"):
-                if not isinstance(row, Tag):
-                    continue
+            header_tags = thead.find_all("th")
+            headers = [h.text.strip() for h in header_tags]
 
-                cells = row.find_all("td")
-                if len(cells) <= max(header_map.values()):
-                    continue
+            header_map: Dict[str, int] = {
+                "race": headers.index("Race"),
+                "class": headers.index("Class"),
+            }
+        except (ValueError, AttributeError):
+            logger.warning("table_headers_missing", extra={"circuit_id": circuit_id})
+            return races
 
-                class_cell_text = cells[header_map["class"]].text.strip()
-                race_type = (
-                    RaceType.STAGE_RACE
-                    if class_cell_text.startswith("2.")
-                    else RaceType.ONE_DAY
-                )
+        tbody = table.find("tbody")
+        if not isinstance(tbody, Tag):
+            return races
 
-                link_cell = cells[header_map["race"]]
-                if not isinstance(link_cell, Tag):
-                    continue
+        for row in tbody.find_all("tr"):
+            if not isinstance(row, Tag):
+                continue
 
-                link_tag = link_cell.find("a")
-                if not isinstance(link_tag, Tag):
-                    continue
+            cells = row.find_all("td")
+            if len(cells) <= max(header_map.values()):
+                continue
 
-                href_value = link_tag.get("href")
-                if not isinstance(href_value, str):
-                    continue
+            class_cell_text = cells[header_map["class"]].text.strip()
+            race_type = (
+                RaceType.STAGE_RACE
+                if class_cell_text.startswith("2.")
+                else RaceType.ONE_DAY
+            )
 
-                base_race_url = re.sub(r"/(gc|result|results)$", "", href_value)
-                unique_races.add((base_race_url, race_type))
+            link_cell = cells[header_map["race"]]
+            if not isinstance(link_cell, Tag):
+                continue
 
-        logger.info(
-            "scrape_race_list_complete",
-            extra={"year": year, "unique_races": len(unique_races)},
-        )
-        return list(unique_races)
+            link_tag = link_cell.find("a")
+            if not isinstance(link_tag, Tag):
+                continue
+
+            href_value = link_tag.get("href")
+            if not isinstance(href_value, str):
+                continue
+
+            base_race_url = re.sub(r"/(gc|result|results)$", "", href_value)
+            races.append((base_race_url, race_type))
+
+        return races
@@ -0,0 +1,167 @@
+import io
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from lxml import etree
+
+TEAM_HEADERS = ("Team", "Tm")
+RIDER_HEADER = "Rider"
+POINTS_HEADER = "Pnt"
+
+# BeautifulSoup leaves the strings of these elements out of ``.text``; skip
+# them too so that both parsers agree on cell contents.
+_NON_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+
+class ResultsTableNotFoundError(ValueError):
+    """The page has no visible ``div.resTab table.results``."""
+
+
+class ResultsTableHeadersError(ValueError):
+    """The results table lacks the Rider, Team/Tm or Pnt column."""
+
+
+@dataclass(frozen=True)
+class ResultRow:
+    """
+    One point-scoring row of a results table.
+
+    Attributes:
+        rider_pcs_id (str): The ``href`` of the rider link, e.g.
+            "rider/tadej-pogacar".
+        rider_name (str): The text of the rider link.
+        team_name (str): The text of the team cell.
+        points (int): PCS points, always positive.
+    """
+
+    rider_pcs_id: str
+    rider_name: str
+    team_name: str
+    points: int
+
+
+def extract_result_rows(html: str) -> List[ResultRow]:
+    """
+    Extracts the point-scoring rows of the visible results table of a PCS
+    page, equivalent to ``soup.select_one("div.resTab:not(.hide)
+    table.results")`` plus row parsing, without building a soup.
+
+    The page is streamed through lxml's HTML parser and parsing stops as soon
+    as the first matching table is complete, so the rest of the page (other
+    tabs, footer, scripts) is never turned into a tree. The header map is
+    resolved once and each row's cells are collected once.
+
+    Raises:
+        ResultsTableNotFoundError: No visible results table.
+        ResultsTableHeadersError: A required column is missing.
+    """
+    table = _find_results_table(html)
+    if table is None:
+        raise ResultsTableNotFoundError("Results table not found")
+    header_map = _header_map(table)
+
+    rows: List[ResultRow] = []
+    tbody = _first(table.iter("tbody"))
+    if tbody is None:
+        return rows
+    last_column = max(header_map.values())
+    for tr in tbody.iter("tr"):
+        cells = list(tr.iter("td"))
+        if len(cells) <= last_column:
+            continue
+        row = _parse_row(cells, header_map)
+        if row:
+            rows.append(row)
+    return rows
+
+
+def _find_results_table(html: str) -> Optional[etree._Element]:
+    events = etree.iterparse(
+        io.BytesIO(html.encode("utf-8")),
+        events=("end",),
+        tag="table",
+        html=True,
+        encoding="utf-8",
+    )
+    try:
+        for _, table in events:
+            if "results" in _classes(table) and _in_visible_tab(table):
+                return table
+    except etree.LxmlError:
+        pass
+    return None
+
+
+def _in_visible_tab(element: etree._Element) -> bool:
+    for ancestor in element.iterancestors("div"):
+        classes = _classes(ancestor)
+        if "resTab" in classes and "hide" not in classes:
+            return True
+    return False
+
+
+def _header_map(table: etree._Element) -> Dict[str, int]:
+    thead = _first(table.iter("thead"))
+    if thead is None:
+        raise ResultsTableHeadersError("Table head not found")
+    headers = [_text(th).strip() for th in thead.iter("th")]
+    team_header = next((h for h in TEAM_HEADERS if h in headers), None)
+    if (
+        team_header is None
+        or RIDER_HEADER not in headers
+        or POINTS_HEADER not in headers
+    ):
+        raise ResultsTableHeadersError(f"Missing result columns in {headers}")
+    return {
+        "Rider": headers.index(RIDER_HEADER),
+        "Team": headers.index(team_header),
+        "Pnt": headers.index(POINTS_HEADER),
+    }
+
+
+def _parse_row(
+    cells: List[etree._Element], header_map: Dict[str, int]
+) -> Optional[ResultRow]:
+    points_text = _text(cells[header_map["Pnt"]]).strip()
+    try:
+        points = int(points_text.split()[0]) if points_text else 0
+    except ValueError:
+        return None
+    if points <= 0:
+        return None
+    rider_link = _first(cells[header_map["Rider"]].iter("a"))
+    if rider_link is None:
+        return None
+    href = rider_link.get("href")
+    if href is None:
+        return None
+    return ResultRow(
+        rider_pcs_id=href,
+        rider_name=_text(rider_link).strip(),
+        team_name=_text(cells[header_map["Team"]]).strip(),
+        points=points,
+    )
+
+
+def _text(element: etree._Element) -> str:
+    return "".join(_strings(element))
+
+
+def _strings(element: etree._Element) -> Iterator[str]:
+    if element.text and element.tag not in _NON_TEXT_TAGS:
+        yield element.text
+    for child in element:
+        # Comments (and CDATA, which the HTML parser turns into comments)
+        # have a non-string tag; only their tail is page text.
+        if isinstance(child.tag, str):
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _classes(element: etree._Element) -> List[str]:
+    return (element.get("class") or "").split()
+
+
+def _first(elements: Iterator[etree._Element]) -> Optional[etree._Element]:
+    return next(elements, None)
@@ -0,0 +1,181 @@
+from datetime import datetime
+from typing import Dict, List
+from uuid import uuid4
+
+from in_memory_rider_repository import InMemoryRiderRepository
+
+from procycling_scraper.analysis.application.dto.analysis_dtos import RiderResultDTO
+from procycling_scraper.analysis.application.dto.cyclist_dto import (
+    AnalysisRequestDTO,
+)
+from procycling_scraper.analysis.application.process_cyclists_use_case import (
+    ProcessCyclistsUseCase,
+)
+from procycling_scraper.analysis.domain.repositories.rider_alias_repository import (
+    RiderAliasRepository,
+)
+from procycling_scraper.analysis.domain.rider_alias import (
+    AliasKey,
+    AliasSource,
+    RiderAlias,
+    normalize_alias,
+)
+from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+
+
+class FakeRiderRepository(InMemoryRiderRepository):
+    def __init__(self, riders: List[Rider], results: List[RiderResultDTO]):
+        super().__init__(riders, results)
+        self.score_calls = []
+
+    def find_scores_by_rider_ids(self, rider_ids, target_race_type, year, weights):
+        self.score_calls.append((list(rider_ids), target_race_type, year))
+        return super().find_scores_by_rider_ids(
+            rider_ids, target_race_type, year, weights
+        )
+
+
+def test_scores_a_roster_with_one_repository_query():
+    this_year = datetime.now().year
+    pogacar = Rider(pcs_id="tadej-pogacar", name="Pogacar Tadej", id=uuid4())
+    evenepoel = Rider(pcs_id="remco-evenepoel", name="Evenepoel Remco", id=uuid4())
+    repository = FakeRiderRepository(
+        [pogacar, evenepoel],
+        [
+            RiderResultDTO(pogacar.id, 100, this_year, RaceType.STAGE_RACE),
+            RiderResultDTO(pogacar.id, 40, this_year - 1, RaceType.ONE_DAY),
+            RiderResultDTO(evenepoel.id, 60, this_year, RaceType.ONE_DAY),
+        ],
+    )
+    request = AnalysisRequestDTO(
+        race_type="one-day",
+        cyclists=[
+            {"name": "Pogacar Tadej", "team": "UAE", "price": 200},
+            {"name": "Evenepoel Remco", "team": "Soudal", "price": 100},
+        ],
+    )
+
+    response = ProcessCyclistsUseCase(repository).execute(request)
+
+    assert repository.score_calls == [
+        ([pogacar.id, evenepoel.id], RaceType.ONE_DAY, this_year)
+    ]
+    names = [c["name"] for c in response["analyzed_cyclists"]]
+    assert names == ["Evenepoel Remco", "Pogacar Tadej"]
+    pogacar_payload = response["analyzed_cyclists"][1]
+    # 100 * 0.5 (other race type) + 40 * 0.5 (previous season)
+    assert pogacar_payload["total_weighted_points"] == 70.0
+    assert pogacar_payload["value_score"] == 0.35
+    assert pogacar_payload["raw_points_breakdown"] == {
+        "one_day": 40,
+        "stage_race": 100,
+    }
+
+
+class InMemoryAliasRepository(RiderAliasRepository):
+    def __init__(self, riders: List[Rider]):
+        self._riders = {r.id: r for r in riders}
+        self.aliases: Dict[AliasKey, RiderAlias] = {}
+
+    def find_riders(self, names):
+        names = set(names)
+        return {
+            key: self._riders[alias.rider_id]
+            for key, alias in self.aliases.items()
+            if key[0] in names
+        }
+
+    def save_learned(self, aliases):
+        for alias in aliases:
+            self.aliases.setdefault(alias.key, alias)
+
+    def save(self, alias):
+        if alias.source == AliasSource.MANUAL and not alias.team:
+            self._delete_learned(alias.name)
+        self.aliases[alias.key] = alias
+
+    def delete(self, key):
+        deleted = self.aliases.pop(key, None) is not None
+        if not key[1]:
+            deleted = self._delete_learned(key[0]) or deleted
+        return deleted
+
+    def _delete_learned(self, name):
+        learned = [
+            key
+            for key, alias in self.aliases.items()
+            if key[0] == name and alias.source == AliasSource.AUTO
+        ]
+        for key in learned:
+            del self.aliases[key]
+        return bool(learned)
+
+
+class FailingMatchingIndex:
+    def matching_service(self):
+        raise AssertionError("every name should have been resolved by alias")
+
+
+def test_confident_matches_become_aliases_that_skip_fuzzy_matching():
+    pogacar = Rider(pcs_id="rider/tadej-pogacar", name="POGAČAR Tadej", id=uuid4())
+    adam = Rider(pcs_id="rider/adam-yates", name="YATES Adam", id=uuid4())
+    simon = Rider(pcs_id="rider/simon-yates", name="YATES Simon", id=uuid4())
+    repository = FakeRiderRepository([pogacar, adam, simon], [])
+    aliases = InMemoryAliasRepository([pogacar, adam, simon])
+    request = AnalysisRequestDTO(
+        race_type="stage-race",
+        cyclists=[
+            {"name": "Pogačar Tadej", "team": "UAE", "price": 200},
+            {"name": "Yates", "team": "Jayco AlUla", "price": 100},
+        ],
+    )
+
+    first = ProcessCyclistsUseCase(repository, alias_repository=aliases)
+    first.execute(request)
+
+    # Only the confident match is learned, under its accent-free spelling
+    # and for its team.
+    assert list(aliases.aliases) == [("pogacar tadej", "uae")]
+    assert aliases.aliases[("pogacar tadej", "uae")].source == AliasSource.AUTO
+
+    # An administrator points "Yates" of Jayco AlUla at Simon.
+    aliases.save(
+        RiderAlias(
+            "yates", normalize_alias("Jayco AlUla"), simon.id, AliasSource.MANUAL
+        )
+    )
+    second = ProcessCyclistsUseCase(
+        repository, rider_index=FailingMatchingIndex(), alias_repository=aliases
+    )
+    response = second.execute(request)
+
+    urls = {c["name"]: c["pcs_url"] for c in response["analyzed_cyclists"]}
+    assert urls == {
+        "Pogačar Tadej": "https://www.procyclingstats.com/rider/tadej-pogacar",
+        "Yates": "https://www.procyclingstats.com/rider/simon-yates",
+    }
+
+
+def test_a_manual_alias_for_any_team_corrects_learned_ones_for_every_team():
+    adam = Rider(pcs_id="rider/adam-yates", name="YATES Adam", id=uuid4())
+    simon = Rider(pcs_id="rider/simon-yates", name="YATES Simon", id=uuid4())
+    repository = FakeRiderRepository([adam, simon], [])
+    aliases = InMemoryAliasRepository([adam, simon])
+    request = AnalysisRequestDTO(
+        race_type="stage-race",
+        cyclists=[{"name": "Adam Yates", "team": "Jayco AlUla", "price": 100}],
+    )
+    ProcessCyclistsUseCase(repository, alias_repository=aliases).execute(request)
+    assert aliases.aliases[("adam yates", "jayco alula")].rider_id == adam.id
+
+    # Suppose the learned match was wrong: the name is corrected for any team.
+    aliases.save(RiderAlias("adam yates", "", simon.id, AliasSource.MANUAL))
+    response = ProcessCyclistsUseCase(
+        repository, rider_index=FailingMatchingIndex(), alias_repository=aliases
+    ).execute(request)
+
+    assert list(aliases.aliases) == [("adam yates", "")]
+    assert response["analyzed_cyclists"][0]["pcs_url"] == (
+        "https://www.procyclingstats.com/rider/simon-yates"
+    )
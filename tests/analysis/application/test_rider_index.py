@@ -0,0 +1,59 @@
+from typing import List
+
+from in_memory_rider_repository import InMemoryRiderRepository
+
+from procycling_scraper.analysis.application.rider_index import RiderIndex
+from procycling_scraper.scraping.domain.entities.rider import Rider
+
+
+class CountingRiderRepository(InMemoryRiderRepository):
+    def __init__(self, riders: List[Rider]):
+        super().__init__(riders)
+        self.find_all_calls = 0
+        self.version_calls = 0
+
+    def find_all(self) -> List[Rider]:
+        self.find_all_calls += 1
+        return super().find_all()
+
+    def riders_version(self) -> str:
+        self.version_calls += 1
+        return super().riders_version()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_index_is_rebuilt_only_when_the_riders_change():
+    repository = CountingRiderRepository(
+        [Rider(pcs_id="tadej-pogacar", name="Pogacar Tadej")]
+    )
+    clock = FakeClock()
+    index = RiderIndex(repository, check_interval=10.0, clock=clock)
+    assert not index.status().warm
+
+    index.warm()
+    assert index.status().warm and index.status().riders == 1
+
+    # Within the check interval the database is not queried at all.
+    clock.now = 5.0
+    service = index.matching_service()
+    assert (repository.version_calls, repository.find_all_calls) == (1, 1)
+
+    # After it, an unchanged version keeps the index.
+    clock.now = 12.0
+    assert index.matching_service() is service
+    assert (repository.version_calls, repository.find_all_calls) == (2, 1)
+
+    repository.save(Rider(pcs_id="jonas-vingegaard", name="Vingegaard Jonas"))
+    clock.now = 30.0
+    refreshed = index.matching_service()
+    assert refreshed is not service
+    assert refreshed.find_best_match("Jonas Vingegaard").pcs_id == "jonas-vingegaard"
+    assert index.status().riders == 2
+    assert index.status().age_s == 0.0
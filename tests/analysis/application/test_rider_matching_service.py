@@ -1,3 +1,7 @@
+from uuid import uuid4
+
+from thefuzz import process
+
 from procycling_scraper.analysis.domain.rider_matching_service import (
     RiderMatchingService,
 )
@@ -19,3 +23,74 @@ def test_find_best_match_high_score():
 def test_find_best_match_no_choices():
     service = RiderMatchingService([], score_cutoff=80)
     assert service.find_best_match("any") is None
+
+
+def test_find_best_matches_agrees_with_a_full_scan():
+    evenepoel = Rider(pcs_id="remco-evenepoel", name="EVENEPOEL Remco")
+    riders = [evenepoel] + [
+        Rider(pcs_id=f"rider-{i}", name=f"{last} {first}")
+        for i, (last, first) in enumerate(
+            (last, first)
+            for last in ("POGACAR", "ROGLIC", "VAN AERT", "VAN DER POEL", "YATES")
+            for first in ("Tadej", "Primoz", "Wout", "Mathieu", "Adam", "Simon")
+        )
+    ]
+    names = [
+        "Tadej Pogacar",
+        "Pogačar Tadej",
+        "Primoz Roglic",
+        "Wout van Aert",
+        "Mathieu van der Poel",
+        "Simon Yates",
+        "Adam Yate",
+        "Van",
+        "Poel",
+        "Unknown Rider",
+    ]
+    choices = {r.name.lower(): r for r in riders}
+
+    # A small max_candidates makes the shortlist, not the full list, decide.
+    service = RiderMatchingService(riders, score_cutoff=80, max_candidates=3)
+    matches = service.find_scored_matches(names)
+
+    full_scan = {}
+    for name, match in zip(names, matches):
+        best = process.extractOne(name.lower(), choices.keys())
+        full_scan[name] = choices[best[0]] if best and best[1] >= 80 else None
+        expected_score = best[1] if full_scan[name] else None
+        assert (match[1] if match else None) == expected_score, name
+    assert matches[0] is not None and matches[0][0].pcs_id == "rider-0"
+    assert matches[-1] is None
+    # "Poel" scores 90 against Evenepoel, first in the list, and against
+    # every Van der Poel; only those share enough trigrams to be shortlisted.
+    poel = matches[names.index("Poel")]
+    assert full_scan["Poel"] is evenepoel
+    assert poel is not None and poel[0].name.startswith("VAN DER POEL")
+    assert poel[1] == 90
+
+
+def test_teams_pick_the_namesake_and_fall_back_to_every_rider():
+    adam = Rider(pcs_id="adam-yates", name="YATES Adam", id=uuid4())
+    simon = Rider(pcs_id="simon-yates", name="YATES Simon", id=uuid4())
+    pogacar = Rider(pcs_id="tadej-pogacar", name="POGACAR Tadej", id=uuid4())
+    service = RiderMatchingService(
+        [adam, simon, pogacar],
+        rider_teams={
+            adam.id: {"UAE Team Emirates XRG"},
+            simon.id: {"Team Visma | Lease a Bike", "Team Jayco AlUla"},
+            pogacar.id: {"UAE Team Emirates XRG"},
+        },
+    )
+
+    matches = service.find_best_matches(
+        ["Yates", "Yates", "Yates", "Tadej Pogacar"],
+        teams=["Jayco AlUla", "UAE", "Unknown Team", "Jayco AlUla"],
+    )
+
+    # Without a team to go by, the first of the namesakes wins.
+    assert [m.pcs_id if m else None for m in matches] == [
+        "simon-yates",
+        "adam-yates",
+        "adam-yates",
+        "tadej-pogacar",
+    ]
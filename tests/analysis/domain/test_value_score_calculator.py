@@ -1,9 +1,14 @@
 import math
+import random
 from datetime import datetime
 from uuid import uuid4
 
+import numpy as np
+
 from procycling_scraper.analysis.application.dto.analysis_dtos import RiderResultDTO
 from procycling_scraper.analysis.domain.value_score_calculator import (
+    RACE_TYPE_CODES,
+    ScoreWeights,
     ValueScoreCalculator,
 )
 from procycling_scraper.scraping.domain.entities.race import RaceType
@@ -42,3 +47,89 @@ def test_value_score_zero_price():
     total, value = calc.calculate([], price=0, target_race_type=RaceType.ONE_DAY)
     assert total == 0
     assert value == 0.0
+
+
+def test_season_totals_score_like_the_results_they_sum():
+    # The API scores the rider_season_points rollup: one row per season and
+    # race type instead of one per result. The default weights are binary
+    # fractions, so here the totals are exactly equal; in general they are
+    # equal up to rounding.
+    calc = ValueScoreCalculator()
+    rider_id = uuid4()
+    results = [
+        RiderResultDTO(rider_id, 40, _year(0), RaceType.ONE_DAY),
+        RiderResultDTO(rider_id, 60, _year(0), RaceType.ONE_DAY),
+        RiderResultDTO(rider_id, 30, _year(1), RaceType.STAGE_RACE),
+        RiderResultDTO(rider_id, 20, _year(1), RaceType.STAGE_RACE),
+        RiderResultDTO(rider_id, 10, _year(4), RaceType.ONE_DAY),
+    ]
+    season_totals = [
+        RiderResultDTO(rider_id, 100, _year(0), RaceType.ONE_DAY),
+        RiderResultDTO(rider_id, 50, _year(1), RaceType.STAGE_RACE),
+        RiderResultDTO(rider_id, 10, _year(4), RaceType.ONE_DAY),
+    ]
+
+    assert calc.calculate(results, 150, RaceType.ONE_DAY) == calc.calculate(
+        season_totals, 150, RaceType.ONE_DAY
+    )
+
+
+def test_score_weights_decay_by_season_and_flatten_after_the_last():
+    weights = ScoreWeights()
+
+    assert [weights.year_weight(d) for d in (-1, 0, 1, 2, 3, 10)] == [
+        1.0,
+        1.0,
+        0.5,
+        0.25,
+        0.1,
+        0.1,
+    ]
+    assert weights.type_weight(RaceType.ONE_DAY, RaceType.STAGE_RACE) == 0.5
+
+
+def test_roster_scores_are_exactly_those_of_the_scalar_calculator():
+    # Weights without exact binary fractions, so that any change in the
+    # order of the additions would show in the last bits.
+    calc = ValueScoreCalculator(
+        ScoreWeights(
+            season_weights=(1.0, 0.7, 0.3, 0.15),
+            older_season_weight=0.07,
+            other_race_type_weight=0.45,
+        )
+    )
+    rng = random.Random(11)
+    prices = [rng.choice((0, 50, 75, 120, 333)) for _ in range(40)]
+    rider_ids = [uuid4() for _ in prices]
+    positions = {rider_id: i for i, rider_id in enumerate(rider_ids)}
+    results = [
+        RiderResultDTO(
+            rider_id=rider_ids[rng.randrange(len(prices) - 1)],  # not the last
+            points=rng.randrange(0, 500),
+            year=2025 - rng.randrange(-1, 8),
+            race_type=rng.choice(list(RaceType)),
+        )
+        for _ in range(2000)
+    ]
+
+    scores = calc.calculate_roster(
+        np.array([positions[r.rider_id] for r in results]),
+        np.array([r.points for r in results]),
+        np.array([r.year for r in results]),
+        np.array([RACE_TYPE_CODES[r.race_type] for r in results]),
+        np.array(prices),
+        RaceType.STAGE_RACE,
+        current_year=2025,
+    )
+
+    for rider, price in enumerate(prices):
+        own = [r for r in results if r.rider_id == rider_ids[rider]]
+        total, value = calc.calculate(own, price, RaceType.STAGE_RACE, 2025)
+        assert scores.total_weighted_points[rider] == total
+        assert scores.value_scores[rider] == value
+        assert scores.one_day_points[rider] == sum(
+            r.points for r in own if r.race_type == RaceType.ONE_DAY
+        )
+        assert scores.stage_race_points[rider] == sum(
+            r.points for r in own if r.race_type == RaceType.STAGE_RACE
+        )
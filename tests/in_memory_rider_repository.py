@@ -0,0 +1,73 @@
+"""Thread-safe in-memory RiderRepository shared by the tests and benchmarks."""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+from procycling_scraper.analysis.application.dto.analysis_dtos import (
+    RiderResultDTO,
+    RiderScoreDTO,
+)
+from procycling_scraper.analysis.domain.value_score_calculator import (
+    ValueScoreCalculator,
+)
+from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+from procycling_scraper.scraping.domain.repositories.rider_repository import (
+    RiderRepository,
+)
+
+
+class InMemoryRiderRepository(RiderRepository):
+    """
+    Keeps riders by PCS id and hands out ids derived from it. Scores are
+    computed from ``results`` with ValueScoreCalculator.
+    """
+
+    def __init__(
+        self, riders: Iterable[Rider] = (), results: Iterable[RiderResultDTO] = ()
+    ):
+        self.riders: Dict[str, Rider] = {r.pcs_id: r for r in riders}
+        self.results = list(results)
+        self._lock = threading.Lock()
+
+    def save(self, rider: Rider) -> None:
+        with self._lock:
+            self.riders.setdefault(rider.pcs_id, rider)
+
+    def save_many(self, riders: List[Rider]) -> Dict[str, UUID]:
+        with self._lock:
+            for rider in riders:
+                self.riders.setdefault(rider.pcs_id, rider)
+        return {r.pcs_id: uuid5(NAMESPACE_URL, r.pcs_id) for r in riders}
+
+    def find_by_pcs_id(self, pcs_id: str) -> Optional[Rider]:
+        with self._lock:
+            return self.riders.get(pcs_id)
+
+    def find_all(self) -> List[Rider]:
+        with self._lock:
+            return list(self.riders.values())
+
+    def riders_version(self) -> str:
+        with self._lock:
+            return str(len(self.riders))
+
+    def find_all_results_by_rider_ids(self, rider_ids):
+        return {r: [x for x in self.results if x.rider_id == r] for r in rider_ids}
+
+    def find_recent_teams(self, since_year):
+        return {}
+
+    def find_scores_by_rider_ids(self, rider_ids, target_race_type, year, weights):
+        calculator = ValueScoreCalculator(weights)
+        scores: Dict[UUID, RiderScoreDTO] = {}
+        for rider_id, results in self.find_all_results_by_rider_ids(rider_ids).items():
+            total, _ = calculator.calculate(results, 1, target_race_type, year)
+            scores[rider_id] = RiderScoreDTO(
+                rider_id,
+                sum(r.points for r in results if r.race_type == RaceType.ONE_DAY),
+                sum(r.points for r in results if r.race_type == RaceType.STAGE_RACE),
+                total,
+            )
+        return scores
@@ -0,0 +1,183 @@
+import threading
+import time
+from typing import AbstractSet, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+from in_memory_rider_repository import InMemoryRiderRepository
+
+from procycling_scraper.scraping.application.dto.fetched_page import FetchedPage
+from procycling_scraper.scraping.application.ports.race_page_scraper import (
+    RacePageScraper,
+)
+from procycling_scraper.scraping.application.race_pipeline import (
+    PipelineConfig,
+    RacePipeline,
+)
+from procycling_scraper.scraping.domain.entities.classification import (
+    Classification,
+    ClassificationType,
+)
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+from procycling_scraper.scraping.domain.repositories.race_repository import (
+    RaceRepository,
+)
+from procycling_scraper.scraping.domain.value_objects.result_line import ResultLine
+
+RACES = [(f"race/race-{i}/2024", RaceType.STAGE_RACE) for i in range(6)]
+STAGES = 3
+
+
+class FakeRacePageScraper(RacePageScraper):
+    def __init__(self, failing_parse: Tuple[str, ...] = ()):
+        self._failing_parse = failing_parse
+        self.fetched: List[str] = []
+
+    def fetch_pages(
+        self,
+        race_info: Tuple[str, RaceType],
+        known_stages: AbstractSet[int] = frozenset(),
+    ) -> Tuple[Race, Iterator[FetchedPage]]:
+        self.fetched.append(race_info[0])
+        race = Race(
+            pcs_id=race_info[0], name="2024 Race", year=2024, race_type=race_info[1]
+        )
+        pages = [
+            FetchedPage(ClassificationType.STAGE, n, race_info[0])
+            for n in range(1, STAGES + 1)
+            if n not in known_stages
+        ]
+        # The general classification comes first so that holding it back is
+        # actually exercised.
+        pages.insert(0, FetchedPage(ClassificationType.GENERAL, None, race_info[0]))
+        return race, iter(pages)
+
+    def parse_page(self, page: FetchedPage) -> Tuple[Classification, List[Rider]]:
+        if page.html in self._failing_parse:
+            raise RuntimeError("boom")
+        rider = Rider(pcs_id=f"rider/{page.stage_number}", name="Some Rider")
+        classification = Classification(
+            page.classification_type,
+            [ResultLine(rider.pcs_id, "Team A", 10)],
+            page.stage_number,
+        )
+        return classification, [rider]
+
+
+class MergingRaceRepository(RaceRepository):
+    """Merges saved classifications into the stored race, like Postgres does."""
+
+    def __init__(self, delay: float = 0.0):
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.races: Dict[str, Race] = {}
+        self.saved: List[Tuple[str, Optional[ClassificationType]]] = []
+
+    def save(self, race: Race, rider_id_map=None) -> None:
+        time.sleep(self._delay)
+        with self._lock:
+            stored = self.races.setdefault(
+                race.pcs_id, Race(race.pcs_id, race.name, race.year, race.race_type)
+            )
+            for classification in race.classifications:
+                stored.add_classification(classification)
+                self.saved.append((race.pcs_id, classification.classification_type))
+            if not race.classifications:
+                self.saved.append((race.pcs_id, None))
+
+    def find_by_pcs_id(self, pcs_id: str):
+        return self.races.get(pcs_id)
+
+
+def _run(pipeline: RacePipeline, races=RACES):
+    outcomes: Dict[str, Optional[str]] = {}
+    stats = pipeline.run(
+        races, lambda race_info, error: outcomes.__setitem__(race_info[0], error)
+    )
+    return outcomes, {s.stage: s for s in stats}
+
+
+def test_every_classification_is_persisted_with_the_gc_last():
+    race_repo = MergingRaceRepository()
+    pipeline = RacePipeline(
+        FakeRacePageScraper(),
+        race_repo,
+        InMemoryRiderRepository(),
+        config=PipelineConfig(fetchers=3, parsers=2, persisters=3, queue_size=4),
+    )
+
+    outcomes, stats = _run(pipeline)
+
+    assert outcomes == {pcs_id: None for pcs_id, _ in RACES}
+    for pcs_id, _ in RACES:
+        saved = [t for race, t in race_repo.saved if race == pcs_id]
+        assert saved[-1] == ClassificationType.GENERAL
+        assert len(saved) == STAGES + 1
+    pages = len(RACES) * (STAGES + 1)
+    assert (stats["fetch"].items, stats["parse"].items) == (pages, pages)
+    assert stats["persist"].items == pages
+
+
+def test_a_failing_race_is_reported_and_its_gc_never_written():
+    race_repo = MergingRaceRepository()
+    failing = RACES[2][0]
+    pipeline = RacePipeline(
+        FakeRacePageScraper(failing_parse=(failing,)),
+        race_repo,
+        InMemoryRiderRepository(),
+    )
+
+    outcomes, stats = _run(pipeline)
+
+    assert outcomes.pop(failing) == "boom"
+    assert set(outcomes.values()) == {None}
+    assert (failing, ClassificationType.GENERAL) not in race_repo.saved
+    assert stats["parse"].errors >= 1
+
+
+def test_slow_database_applies_backpressure_instead_of_buffering():
+    race_repo = MergingRaceRepository(delay=0.01)
+    pipeline = RacePipeline(
+        FakeRacePageScraper(),
+        race_repo,
+        InMemoryRiderRepository(),
+        config=PipelineConfig(fetchers=4, parsers=2, persisters=1, queue_size=2),
+    )
+
+    outcomes, stats = _run(pipeline)
+
+    assert set(outcomes.values()) == {None}
+    assert stats["parse"].max_queue_depth <= 2
+    assert stats["persist"].max_queue_depth <= 2
+    assert stats["parse"].blocked_s > 0 and stats["fetch"].blocked_s > 0
+
+
+def test_complete_races_are_skipped_and_known_stages_not_fetched():
+    race_repo = MergingRaceRepository()
+    scraper = FakeRacePageScraper()
+    known = {RACES[0][0]: None, RACES[1][0]: frozenset({1, 2})}
+    pipeline = RacePipeline(
+        scraper,
+        race_repo,
+        InMemoryRiderRepository(),
+        known_stages=lambda race_info: known.get(race_info[0], frozenset()),
+    )
+
+    outcomes, _ = _run(pipeline, RACES[:2])
+
+    assert outcomes == {RACES[0][0]: None, RACES[1][0]: None}
+    assert scraper.fetched == [RACES[1][0]]
+    assert [c.stage_number for c in race_repo.races[RACES[1][0]].classifications] == [
+        3,
+        None,
+    ]
+
+
+def test_every_stage_needs_a_worker():
+    with pytest.raises(ValueError):
+        RacePipeline(
+            FakeRacePageScraper(),
+            MergingRaceRepository(),
+            InMemoryRiderRepository(),
+            config=PipelineConfig(parsers=0),
+        )
@@ -0,0 +1,224 @@
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import AbstractSet, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from in_memory_rider_repository import InMemoryRiderRepository
+
+from procycling_scraper.scraping.application.dto.scraped_race_data import (
+    ScrapedRaceData,
+)
+from procycling_scraper.scraping.application.ports.race_data_scraper import (
+    RaceDataScraper,
+)
+from procycling_scraper.scraping.application.ports.race_work_queue import (
+    RaceWorkQueue,
+)
+from procycling_scraper.scraping.application.race_worker_use_case import (
+    RaceWorkerUseCase,
+)
+from procycling_scraper.scraping.application.scrape_race_use_case import (
+    ScrapeRaceUseCase,
+)
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.entities.race_work_item import (
+    RaceWorkItem,
+    WorkItemStatus,
+)
+from procycling_scraper.scraping.domain.repositories.race_repository import (
+    RaceRepository,
+)
+
+RACES = [(f"race/race-{i}/2024", RaceType.ONE_DAY) for i in range(12)]
+
+
+@dataclass
+class QueuedRace:
+    id: UUID
+    race_info: Tuple[str, RaceType]
+    status: WorkItemStatus = WorkItemStatus.QUEUED
+    attempts: int = 0
+    leased_by: Optional[str] = None
+    lease_expires_at: float = 0.0
+    last_error: Optional[str] = None
+
+
+class InMemoryRaceWorkQueue(RaceWorkQueue):
+    def __init__(self):
+        self.items: List[QueuedRace] = []
+        self._lock = threading.Lock()
+
+    def enqueue(self, year, races_info):
+        self.items.extend(QueuedRace(uuid4(), info) for info in races_info)
+        return len(races_info)
+
+    def claim(self, worker_id, lease_seconds):
+        with self._lock:
+            for item in self.items:
+                if item.status == WorkItemStatus.QUEUED:
+                    item.status = WorkItemStatus.LEASED
+                    item.leased_by = worker_id
+                    item.lease_expires_at = time.monotonic() + lease_seconds
+                    item.attempts += 1
+                    return RaceWorkItem(
+                        item.id, *item.race_info, year=2024, attempts=item.attempts
+                    )
+        return None
+
+    def heartbeat(self, item_id, worker_id, lease_seconds):
+        with self._lock:
+            item = self._held(item_id, worker_id)
+            if item:
+                item.lease_expires_at = time.monotonic() + lease_seconds
+            return item is not None
+
+    def complete(self, item_id, worker_id):
+        with self._lock:
+            item = self._held(item_id, worker_id)
+            if item:
+                item.status, item.leased_by = WorkItemStatus.DONE, None
+
+    def fail(self, item_id, worker_id, error, max_attempts):
+        with self._lock:
+            item = self._held(item_id, worker_id)
+            if item:
+                self._release(item, error, max_attempts)
+
+    def reclaim_expired(self, max_attempts):
+        with self._lock:
+            expired = [
+                i
+                for i in self.items
+                if i.status == WorkItemStatus.LEASED
+                and i.lease_expires_at < time.monotonic()
+            ]
+            for item in expired:
+                self._release(item, "Lease expired", max_attempts)
+            return len(expired)
+
+    def _held(self, item_id, worker_id) -> Optional[QueuedRace]:
+        return next(
+            (
+                i
+                for i in self.items
+                if i.id == item_id
+                and i.leased_by == worker_id
+                and i.status == WorkItemStatus.LEASED
+            ),
+            None,
+        )
+
+    @staticmethod
+    def _release(item: QueuedRace, error: str, max_attempts: int) -> None:
+        item.status = (
+            WorkItemStatus.FAILED
+            if item.attempts >= max_attempts
+            else WorkItemStatus.QUEUED
+        )
+        item.leased_by, item.last_error = None, error
+
+
+class FakeRaceDataScraper(RaceDataScraper):
+    def __init__(self, failing: Tuple[str, ...] = (), delay: float = 0.0):
+        self._failing = failing
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.calls: Counter = Counter()
+
+    def scrape(
+        self,
+        race_info: Tuple[str, RaceType],
+        known_stages: AbstractSet[int] = frozenset(),
+    ) -> ScrapedRaceData:
+        with self._lock:
+            self.calls[race_info[0]] += 1
+        time.sleep(self._delay)
+        if race_info[0] in self._failing:
+            raise RuntimeError("boom")
+        race = Race(
+            pcs_id=race_info[0], name="2024 Race", year=2024, race_type=race_info[1]
+        )
+        return ScrapedRaceData(race=race, riders=[])
+
+
+class InMemoryRaceRepository(RaceRepository):
+    def __init__(self):
+        self.races: Dict[str, Race] = {}
+
+    def save(self, race: Race, rider_id_map=None) -> None:
+        self.races[race.pcs_id] = race
+
+    def find_by_pcs_id(self, pcs_id: str):
+        return self.races.get(pcs_id)
+
+
+def _worker(queue, scraper, race_repo, **kwargs) -> RaceWorkerUseCase:
+    scrape_race = ScrapeRaceUseCase(scraper, race_repo, InMemoryRiderRepository())
+    return RaceWorkerUseCase(queue, scrape_race, worker_id="test-host", **kwargs)
+
+
+def test_workers_process_every_race_exactly_once():
+    queue, race_repo = InMemoryRaceWorkQueue(), InMemoryRaceRepository()
+    queue.enqueue(2024, RACES)
+    scraper = FakeRaceDataScraper(delay=0.01)
+
+    processed = _worker(queue, scraper, race_repo, concurrency=4).run(drain=True)
+
+    assert processed == len(RACES)
+    assert set(scraper.calls.values()) == {1}
+    assert set(race_repo.races) == {pcs_id for pcs_id, _ in RACES}
+    assert all(i.status == WorkItemStatus.DONE for i in queue.items)
+
+
+def test_failing_race_is_requeued_until_attempts_run_out():
+    queue, race_repo = InMemoryRaceWorkQueue(), InMemoryRaceRepository()
+    queue.enqueue(2024, RACES[:3])
+    scraper = FakeRaceDataScraper(failing=(RACES[1][0],))
+
+    _worker(queue, scraper, race_repo, max_attempts=2).run(drain=True)
+
+    assert scraper.calls[RACES[1][0]] == 2
+    failed = queue.items[1]
+    assert (failed.status, failed.attempts, failed.last_error) == (
+        WorkItemStatus.FAILED,
+        2,
+        "boom",
+    )
+    assert queue.items[0].status == queue.items[2].status == WorkItemStatus.DONE
+
+
+def test_expired_lease_of_a_dead_worker_is_reclaimed():
+    queue, race_repo = InMemoryRaceWorkQueue(), InMemoryRaceRepository()
+    queue.enqueue(2024, RACES[:2])
+    abandoned = queue.claim("dead-host/0", lease_seconds=0.01)
+    time.sleep(0.02)
+    scraper = FakeRaceDataScraper()
+
+    _worker(queue, scraper, race_repo).run(drain=True)
+
+    assert scraper.calls[abandoned.race_pcs_id] == 1
+    assert all(i.status == WorkItemStatus.DONE for i in queue.items)
+
+
+def test_heartbeat_keeps_the_lease_of_a_slow_race():
+    queue, race_repo = InMemoryRaceWorkQueue(), InMemoryRaceRepository()
+    queue.enqueue(2024, RACES[:1])
+    scraper = FakeRaceDataScraper(delay=0.3)
+    reclaimed_meanwhile = []
+    # Another worker sweeping for expired leases while the race is running.
+    sweeper = threading.Timer(
+        0.2, lambda: reclaimed_meanwhile.append(queue.reclaim_expired(3))
+    )
+    sweeper.start()
+
+    worker = _worker(
+        queue, scraper, race_repo, lease_seconds=0.1, heartbeat_interval=0.02
+    )
+    worker.run(drain=True)
+    sweeper.join()
+
+    assert reclaimed_meanwhile == [0]
+    assert scraper.calls[RACES[0][0]] == 1
+    assert queue.items[0].status == WorkItemStatus.DONE
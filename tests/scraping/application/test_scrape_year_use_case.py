@@ -0,0 +1,327 @@
+import threading
+import time
+from dataclasses import replace
+from typing import AbstractSet, Dict, List, Tuple
+from uuid import NAMESPACE_URL, uuid4, uuid5
+
+from in_memory_rider_repository import InMemoryRiderRepository
+
+from procycling_scraper.scraping.application.dto.scraped_race_data import (
+    ScrapedRaceData,
+)
+from procycling_scraper.scraping.application.ports.race_data_scraper import (
+    RaceDataScraper,
+)
+from procycling_scraper.scraping.application.ports.race_list_scraper import (
+    RaceListScraper,
+)
+from procycling_scraper.scraping.application.scrape_year_use_case import (
+    ScrapeYearUseCase,
+)
+from procycling_scraper.scraping.domain.entities.classification import (
+    Classification,
+    ClassificationType,
+)
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+from procycling_scraper.scraping.domain.entities.scrape_job import (
+    ScrapeItemStatus,
+    ScrapeJob,
+    ScrapeJobItem,
+    ScrapeJobStatus,
+)
+from procycling_scraper.scraping.domain.repositories.race_repository import (
+    RaceRepository,
+)
+from procycling_scraper.scraping.domain.repositories.scrape_job_repository import (
+    ScrapeJobRepository,
+)
+from procycling_scraper.scraping.domain.value_objects.result_line import ResultLine
+
+RACES = [(f"race/race-{i}/2024", RaceType.ONE_DAY) for i in range(12)]
+
+
+class FakeRaceListScraper(RaceListScraper):
+    def scrape(self, year: int) -> List[Tuple[str, RaceType]]:
+        return list(RACES)
+
+
+class FakeRaceDataScraper(RaceDataScraper):
+    def __init__(self, failing: Tuple[str, ...] = (), delay: float = 0.0):
+        self._failing = failing
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls: Dict[str, AbstractSet[int]] = {}
+
+    def scrape(
+        self,
+        race_info: Tuple[str, RaceType],
+        known_stages: AbstractSet[int] = frozenset(),
+    ) -> ScrapedRaceData:
+        with self._lock:
+            self.calls[race_info[0]] = known_stages
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self._delay)
+            if race_info[0] in self._failing:
+                raise RuntimeError("boom")
+            rider = Rider(pcs_id=f"rider/{race_info[0]}", name="Some Rider")
+            race = Race(
+                pcs_id=race_info[0], name="2024 Race", year=2024, race_type=race_info[1]
+            )
+            race.add_classification(
+                Classification(
+                    ClassificationType.GENERAL,
+                    [ResultLine(rider.pcs_id, "Team A", 10)],
+                )
+            )
+            return ScrapedRaceData(race=race, riders=[rider])
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class InMemoryRaceRepository(RaceRepository):
+    def __init__(self):
+        self.races: Dict[str, Race] = {}
+        self.rider_id_maps: Dict[str, Dict] = {}
+
+    def save(self, race: Race, rider_id_map=None) -> None:
+        self.races[race.pcs_id] = race
+        self.rider_id_maps[race.pcs_id] = rider_id_map
+
+    def find_by_pcs_id(self, pcs_id: str):
+        return self.races.get(pcs_id)
+
+
+class InMemoryScrapeJobRepository(ScrapeJobRepository):
+    def __init__(self):
+        self.jobs: List[ScrapeJob] = []
+        self._lock = threading.Lock()
+
+    def create(self, year, races_info):
+        job = ScrapeJob(
+            id=uuid4(),
+            year=year,
+            items=[
+                ScrapeJobItem(pcs_id, race_type) for pcs_id, race_type in races_info
+            ],
+        )
+        self.jobs.append(job)
+        return job
+
+    def find_open_by_year(self, year):
+        open_jobs = [
+            j
+            for j in self.jobs
+            if j.year == year and j.status == ScrapeJobStatus.RUNNING
+        ]
+        return self._snapshot(open_jobs[-1]) if open_jobs else None
+
+    def find_latest_by_year(self, year):
+        jobs = [j for j in self.jobs if j.year == year]
+        return self._snapshot(jobs[-1]) if jobs else None
+
+    def record_attempt(self, job_id, race_pcs_id, status, error=None):
+        with self._lock:
+            job = self._job(job_id)
+            job.items = [
+                (
+                    replace(i, status=status, attempts=i.attempts + 1, last_error=error)
+                    if i.race_pcs_id == race_pcs_id
+                    else i
+                )
+                for i in job.items
+            ]
+
+    def finish(self, job_id):
+        self._job(job_id).status = ScrapeJobStatus.FINISHED
+
+    def _job(self, job_id) -> ScrapeJob:
+        return next(j for j in self.jobs if j.id == job_id)
+
+    @staticmethod
+    def _snapshot(job: ScrapeJob) -> ScrapeJob:
+        return replace(job, items=list(job.items))
+
+
+def _use_case(
+    concurrency: int,
+    scraper: FakeRaceDataScraper,
+    race_repo=None,
+    incremental: bool = False,
+    job_repo=None,
+):
+    race_repo = race_repo or InMemoryRaceRepository()
+    rider_repo = InMemoryRiderRepository()
+    use_case = ScrapeYearUseCase(
+        race_list_scraper=FakeRaceListScraper(),
+        race_data_scraper=scraper,
+        race_repository=race_repo,
+        rider_repository=rider_repo,
+        concurrency=concurrency,
+        incremental=incremental,
+        job_repository=job_repo,
+    )
+    return use_case, race_repo, rider_repo
+
+
+def _run(
+    concurrency: int,
+    scraper: FakeRaceDataScraper,
+    race_repo=None,
+    incremental: bool = False,
+):
+    use_case, race_repo, rider_repo = _use_case(
+        concurrency, scraper, race_repo, incremental
+    )
+    use_case.execute(2024)
+    return race_repo, rider_repo
+
+
+def test_concurrent_execution_matches_serial_state():
+    serial_races, serial_riders = _run(1, FakeRaceDataScraper())
+    scraper = FakeRaceDataScraper(delay=0.02)
+    concurrent_races, concurrent_riders = _run(4, scraper)
+
+    assert concurrent_races.races == serial_races.races
+    assert concurrent_riders.riders == serial_riders.riders
+    assert 1 < scraper.max_in_flight <= 4
+
+
+def test_failing_race_does_not_stop_the_others():
+    failing = (RACES[3][0],)
+    races, _ = _run(4, FakeRaceDataScraper(failing=failing))
+
+    assert set(races.races) == {pcs_id for pcs_id, _ in RACES} - set(failing)
+
+
+def test_race_is_saved_with_the_batch_rider_id_map():
+    races, _ = _run(1, FakeRaceDataScraper())
+
+    pcs_id = RACES[0][0]
+    assert races.rider_id_maps[pcs_id] == {
+        f"rider/{pcs_id}": uuid5(NAMESPACE_URL, f"rider/{pcs_id}")
+    }
+
+
+def test_incremental_skips_complete_races_and_known_stages():
+    race_repo = InMemoryRaceRepository()
+    finished = Race(
+        pcs_id=RACES[0][0], name="2024 Race", year=2024, race_type=RACES[0][1]
+    )
+    finished.add_classification(
+        Classification(
+            ClassificationType.GENERAL, [ResultLine("rider/x", "Team A", 10)]
+        )
+    )
+    running = Race(
+        pcs_id=RACES[1][0], name="2024 Race", year=2024, race_type=RACES[1][1]
+    )
+    for stage in (1, 2):
+        running.add_classification(
+            Classification(
+                ClassificationType.STAGE, [ResultLine("rider/x", "Team A", 5)], stage
+            )
+        )
+    race_repo.save(finished)
+    race_repo.save(running)
+    scraper = FakeRaceDataScraper()
+
+    _run(1, scraper, race_repo=race_repo, incremental=True)
+
+    assert RACES[0][0] not in scraper.calls
+    assert scraper.calls[RACES[1][0]] == {1, 2}
+    assert scraper.calls[RACES[2][0]] == frozenset()
+
+
+def test_job_journal_records_each_race_and_retries_only_failures():
+    job_repo = InMemoryScrapeJobRepository()
+    failing = (RACES[2][0], RACES[5][0])
+    use_case, races, _ = _use_case(
+        4, FakeRaceDataScraper(failing=failing), job_repo=job_repo
+    )
+
+    use_case.execute(2024)
+
+    job = job_repo.jobs[0]
+    assert job.status == ScrapeJobStatus.FINISHED
+    failed = job.items_with_status(ScrapeItemStatus.FAILED)
+    assert [i.race_pcs_id for i in failed] == list(failing)
+    assert all(i.attempts == 1 and i.last_error == "boom" for i in failed)
+    assert len(job.items_with_status(ScrapeItemStatus.DONE)) == len(RACES) - 2
+
+    scraper = FakeRaceDataScraper()
+    retry, _, _ = _use_case(1, scraper, race_repo=races, job_repo=job_repo)
+    retry.retry_failed(2024)
+
+    assert set(scraper.calls) == set(failing)
+    assert all(i.status == ScrapeItemStatus.DONE for i in job.items)
+    assert set(races.races) == {pcs_id for pcs_id, _ in RACES}
+
+
+def test_interrupted_job_resumes_with_pending_races():
+    job_repo = InMemoryScrapeJobRepository()
+    job = job_repo.create(2024, RACES)
+    for pcs_id, _ in RACES[:5]:
+        job_repo.record_attempt(job.id, pcs_id, ScrapeItemStatus.DONE)
+    job_repo.record_attempt(job.id, RACES[5][0], ScrapeItemStatus.FAILED, "boom")
+    scraper = FakeRaceDataScraper()
+    use_case, _, _ = _use_case(1, scraper, job_repo=job_repo)
+
+    use_case.execute(2024)
+
+    assert list(scraper.calls) == [pcs_id for pcs_id, _ in RACES[6:]]
+    assert len(job_repo.jobs) == 1
+    assert job_repo.jobs[0].status == ScrapeJobStatus.FINISHED
+
+
+class SeasonsRaceListScraper(RaceListScraper):
+    """Lists RACES under 2024 and a few of them again, plus new ones, in 2025."""
+
+    def __init__(self):
+        self.requested: List[List[int]] = []
+
+    def scrape(self, year: int) -> List[Tuple[str, RaceType]]:
+        if year == 2024:
+            return list(RACES)
+        return RACES[:2] + [(f"race/race-{i}/2025", RaceType.ONE_DAY) for i in range(3)]
+
+    def scrape_many(self, years):
+        years = list(years)
+        self.requested.append(years)
+        return {year: self.scrape(year) for year in years}
+
+
+def test_range_schedules_every_season_once_and_journals_each_year():
+    job_repo = InMemoryScrapeJobRepository()
+    resumed = job_repo.create(2023, [("race/race-0/2023", RaceType.ONE_DAY)])
+    list_scraper = SeasonsRaceListScraper()
+    scraper = FakeRaceDataScraper()
+    progress = []
+    use_case = ScrapeYearUseCase(
+        race_list_scraper=list_scraper,
+        race_data_scraper=scraper,
+        race_repository=InMemoryRaceRepository(),
+        rider_repository=InMemoryRiderRepository(),
+        concurrency=4,
+        job_repository=job_repo,
+        on_progress=progress.append,
+        progress_interval=0.0,
+    )
+
+    use_case.execute_range([2023, 2024, 2025])
+
+    assert list_scraper.requested == [[2024, 2025]]
+    assert len(scraper.calls) == 1 + len(RACES) + 3
+    assert [job.year for job in job_repo.jobs] == [2023, 2024, 2025]
+    assert all(job.status == ScrapeJobStatus.FINISHED for job in job_repo.jobs)
+    assert resumed.items[0].status == ScrapeItemStatus.DONE
+    assert all(item.status == ScrapeItemStatus.DONE for item in job_repo.jobs[1].items)
+    # Races listed again in 2025 are only scraped, and journaled, with 2024.
+    assert [i.attempts for i in job_repo.jobs[2].items[:2]] == [0, 0]
+    assert [p.done for p in progress] == list(range(1, len(scraper.calls) + 1))
+    assert progress[-1].percent == 100.0 and progress[-1].eta_s == 0.0
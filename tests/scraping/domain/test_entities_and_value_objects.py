@@ -27,3 +27,22 @@ def test_race_aggregate_add_classification_and_results():
     assert len(race.classifications) == 1
     assert race.classifications[0].classification_type == ClassificationType.GENERAL
     assert sum(r.points for r in race.classifications[0].results) == 80
+
+
+def test_classification_content_hash_ignores_order_but_not_content():
+    results = [
+        ResultLine(rider_pcs_id="rider-1", team_name="Team A", points=50),
+        ResultLine(rider_pcs_id="rider-2", team_name="Team B", points=30),
+    ]
+    classification = Classification(ClassificationType.STAGE, results, 3)
+
+    reordered = Classification(ClassificationType.STAGE, results[::-1], 3)
+    corrected = Classification(
+        ClassificationType.STAGE,
+        [results[0], ResultLine(rider_pcs_id="rider-2", team_name="Team B", points=25)],
+        3,
+    )
+
+    assert classification.content_hash() == reordered.content_hash()
+    assert classification.content_hash() != corrected.content_hash()
+    assert len(classification.content_hash()) == 64
@@ -0,0 +1,196 @@
+"""
+Query-plan regression tests for the partitioned ``pcs_points_results``.
+
+They build the schema in a throwaway PostgreSQL schema, fill it with several
+seasons of synthetic results and check the plans of the rider- and
+race-centric lookups, so that a change to the table or its indexes that
+would make them scan whole seasons fails here rather than in production.
+Skipped unless ``DATABASE_URL`` points at a PostgreSQL database.
+"""
+
+import os
+from typing import Any, Dict, Iterator, List, Set
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+DATABASE_URL = os.environ.get("DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL, reason="needs DATABASE_URL pointing at PostgreSQL"
+)
+
+SEASONS = range(2018, 2026)
+RACES_PER_SEASON = 60
+RIDERS = 2000
+# Every race gets the riders whose number is a multiple of this apart from
+# the race number, about 150 results per race.
+RIDER_SPREAD = 13
+# Riders looked up at once: about 1% of the results of each season.
+ROSTER = 20
+
+
+@pytest.fixture(scope="module")
+def conn() -> Iterator[Connection]:
+    # Imported here: the schema module needs DATABASE_URL at import time.
+    from procycling_scraper.scraping.infrastructure.database.partitions import (
+        ResultsPartitions,
+    )
+    from procycling_scraper.scraping.infrastructure.database.schema import metadata
+
+    schema = f"plan_test_{uuid4().hex[:12]}"
+    admin = create_engine(DATABASE_URL).execution_options(isolation_level="AUTOCOMMIT")
+    with admin.connect() as admin_conn:
+        admin_conn.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(
+        DATABASE_URL, connect_args={"options": f"-csearch_path={schema},public"}
+    ).execution_options(isolation_level="AUTOCOMMIT")
+    try:
+        # checkfirst would see the tables of public through the search_path.
+        metadata.create_all(engine, checkfirst=False)
+        partitions = ResultsPartitions(engine)
+        for season in SEASONS:
+            partitions.ensure(season)
+        with engine.connect() as connection:
+            _load_synthetic_seasons(connection)
+            yield connection
+    finally:
+        engine.dispose()
+        with admin.connect() as admin_conn:
+            admin_conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        admin.dispose()
+
+
+def _load_synthetic_seasons(conn: Connection) -> None:
+    conn.execute(
+        text(
+            "INSERT INTO riders (pcs_id, name, name_normalized) "
+            "SELECT 'rider/' || n, 'Rider ' || n, 'rider ' || n "
+            "FROM generate_series(1, :riders) n"
+        ),
+        {"riders": RIDERS},
+    )
+    conn.execute(
+        text(
+            "INSERT INTO races (pcs_id, name, year, type) "
+            "SELECT 'race/' || n || '/' || y, 'Race ' || n, y, 'ONE_DAY' "
+            "FROM generate_series(:first, :last) y, generate_series(1, :races) n"
+        ),
+        {"first": SEASONS[0], "last": SEASONS[-1], "races": RACES_PER_SEASON},
+    )
+    conn.execute(
+        text(
+            "INSERT INTO classifications (race_id, type) SELECT id, 'GENERAL' FROM races"
+        )
+    )
+    conn.execute(
+        text("""
+            INSERT INTO pcs_points_results
+                (classification_id, rider_id, team_name, points, year)
+            SELECT c.id, r.id, 'Team', 1 + rider_n % 100, ra.year
+            FROM classifications c
+            JOIN races ra ON ra.id = c.race_id
+            CROSS JOIN LATERAL (
+                SELECT split_part(ra.pcs_id, '/', 2)::int AS race_n
+            ) race
+            JOIN LATERAL (
+                SELECT id, split_part(pcs_id, '/', 2)::int AS rider_n FROM riders
+            ) r ON (r.rider_n + race.race_n) % :spread = 0
+            """),
+        {"spread": RIDER_SPREAD},
+    )
+    conn.execute(text("VACUUM ANALYZE pcs_points_results"))
+
+
+def _plan_nodes(conn: Connection, sql: str, params: Dict[str, Any]) -> List[Dict]:
+    plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params).scalar_one()
+    nodes: List[Dict] = []
+    pending = [plan[0]["Plan"]]
+    while pending:
+        node = pending.pop()
+        pending.extend(node.get("Plans", []))
+        nodes.append(node)
+    return nodes
+
+
+def _scans(conn: Connection, sql: str, params: Dict[str, Any]) -> List[Dict]:
+    """Returns the scan nodes of the plan of ``sql`` on result partitions."""
+    return [
+        node
+        for node in _plan_nodes(conn, sql, params)
+        if node.get("Relation Name", "").startswith("pcs_points_results_y")
+    ]
+
+
+def _partition_indexes(conn: Connection, parent_index: str) -> Set[str]:
+    rows = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": parent_index},
+    )
+    return {row[0] for row in rows}
+
+
+def _rider_ids(conn: Connection, count: int) -> List[str]:
+    rows = conn.execute(
+        text("SELECT id::text FROM riders ORDER BY pcs_id LIMIT :count"),
+        {"count": count},
+    )
+    return [row[0] for row in rows]
+
+
+def test_rider_lookup_uses_the_rider_index_in_every_season(conn):
+    sql = (
+        "SELECT rider_id, year, points FROM pcs_points_results "
+        "WHERE rider_id = ANY(CAST(:ids AS uuid[]))"
+    )
+    params = {"ids": _rider_ids(conn, ROSTER)}
+
+    scans = _scans(conn, sql, params)
+    used_indexes = {
+        node["Index Name"]
+        for node in _plan_nodes(conn, sql, params)
+        if "Index Name" in node
+    }
+
+    assert len(scans) == len(SEASONS)
+    assert all(scan["Node Type"] != "Seq Scan" for scan in scans)
+    rider_indexes = _partition_indexes(conn, "ix_pcs_points_results_rider_year")
+    assert len(rider_indexes) == len(SEASONS)
+    assert used_indexes and used_indexes <= rider_indexes
+
+
+def test_rider_lookup_in_one_season_scans_only_its_partition(conn):
+    scans = _scans(
+        conn,
+        "SELECT rider_id, points FROM pcs_points_results "
+        "WHERE rider_id = ANY(CAST(:ids AS uuid[])) AND year = :year",
+        {"ids": _rider_ids(conn, ROSTER), "year": 2024},
+    )
+
+    assert [scan["Relation Name"] for scan in scans] == ["pcs_points_results_y2024"]
+    assert scans[0]["Node Type"] != "Seq Scan"
+
+
+def test_classification_lookup_scans_only_the_race_partition(conn):
+    classification_id = conn.execute(
+        text(
+            "SELECT c.id::text FROM classifications c "
+            "JOIN races ra ON ra.id = c.race_id WHERE ra.year = 2021 LIMIT 1"
+        )
+    ).scalar_one()
+
+    scans = _scans(
+        conn,
+        "SELECT rider_id, points FROM pcs_points_results "
+        "WHERE classification_id = CAST(:id AS uuid) AND year = :year",
+        {"id": classification_id, "year": 2021},
+    )
+
+    assert [scan["Relation Name"] for scan in scans] == ["pcs_points_results_y2021"]
+    assert scans[0]["Node Type"] != "Seq Scan"
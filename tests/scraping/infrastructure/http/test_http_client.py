@@ -0,0 +1,86 @@
+import pytest
+import requests
+
+from procycling_scraper.scraping.infrastructure.http.http_client import HttpClient
+
+
+class DummyResp:
+    def __init__(self, status_code: int = 200, text: str = "ok", headers=None):
+        self.content = text.encode("utf-8")
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+
+
+class ScriptedSession:
+    """Returns (or raises) the scripted outcomes in order."""
+
+    def __init__(self, outcomes):
+        self._outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, timeout=10, headers=None):
+        self.calls += 1
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _client(session, sleeps, **kwargs):
+    return HttpClient(session=session, sleep=sleeps.append, **kwargs)
+
+
+def test_retries_transient_status_then_succeeds():
+    sleeps = []
+    session = ScriptedSession([DummyResp(503), DummyResp(502), DummyResp(200)])
+
+    response = _client(session, sleeps, backoff_base=0.1).get("https://x/page")
+
+    assert response.status_code == 200
+    assert response.text == "ok"
+    assert response.attempts == 3
+    assert len(sleeps) == 2
+    assert all(0 <= s <= 0.2 for s in sleeps)
+
+
+def test_honours_retry_after_header():
+    sleeps = []
+    session = ScriptedSession(
+        [DummyResp(429, headers={"Retry-After": "7"}), DummyResp(200)]
+    )
+
+    _client(session, sleeps).get("https://x/page")
+
+    assert sleeps == [7.0]
+
+
+def test_returns_last_response_when_retries_are_exhausted():
+    sleeps = []
+    session = ScriptedSession([DummyResp(500)] * 3)
+
+    response = _client(session, sleeps, max_retries=2).get("https://x/page")
+
+    assert response.status_code == 500
+    assert session.calls == 3
+    with pytest.raises(requests.exceptions.HTTPError):
+        response.raise_for_status()
+
+
+def test_does_not_retry_client_errors():
+    sleeps = []
+    session = ScriptedSession([DummyResp(404)])
+
+    response = _client(session, sleeps).get("https://x/missing")
+
+    assert response.status_code == 404
+    assert sleeps == []
+
+
+def test_raises_after_repeated_timeouts():
+    sleeps = []
+    session = ScriptedSession([requests.exceptions.Timeout("slow")] * 2)
+
+    with pytest.raises(requests.exceptions.Timeout):
+        _client(session, sleeps, max_retries=1).get("https://x/page")
+    assert len(sleeps) == 1
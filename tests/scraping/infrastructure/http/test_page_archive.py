@@ -0,0 +1,135 @@
+import glob
+import gzip
+import os
+
+from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.infrastructure.http.http_client import HttpClient
+from procycling_scraper.scraping.infrastructure.http.page_archive import (
+    ArchiveReplaySession,
+    PageArchive,
+    PageArchiveWriter,
+)
+from procycling_scraper.scraping.infrastructure.scrapers.procyclingstats_race_data_scraper import (
+    ProCyclingStatsRaceDataScraper,
+)
+
+ONE_DAY_HTML = """
+<html><body>
+  <h1>2024 Some Classic</h1>
+  <div class="resTab">
+    <table class="results">
+      <thead><tr><th>Rider</th><th>Team</th><th>Pnt</th></tr></thead>
+      <tbody>
+        <tr><td><a href="rider/jose-nino">José Niño</a></td><td>Team A</td><td>50</td></tr>
+        <tr><td><a href="rider/jane-roe">Jane Roe</a></td><td>Team B</td><td>30</td></tr>
+      </tbody>
+    </table>
+  </div>
+</body></html>
+"""
+
+
+class DummyResp:
+    def __init__(self, text: str, status_code: int = 200, headers=None):
+        self.content = text.encode("utf-8")
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+
+
+class RecordingSession:
+    def __init__(self, pages):
+        self._pages = pages
+        self.calls = 0
+
+    def get(self, url, timeout=10, headers=None):
+        self.calls += 1
+        return self._pages.get(url) or DummyResp("not found", 404)
+
+
+def test_recorded_responses_read_back_as_fetched(tmp_path):
+    session = RecordingSession(
+        {
+            "https://x/a": DummyResp(
+                "<p>á</p>",
+                headers={"Content-Type": "text/html", "Content-Encoding": "gzip"},
+            )
+        }
+    )
+    writer = PageArchiveWriter(str(tmp_path))
+    client = HttpClient(session=session, archive=writer)
+
+    client.get("https://x/a")
+    client.get("https://x/missing")
+    writer.close()
+
+    archive = PageArchive(str(tmp_path))
+    page = archive.get("https://x/a")
+    assert len(archive) == 2 and "https://x/missing" in archive
+    assert page.status_code == 200
+    assert page.content == "<p>á</p>".encode("utf-8")
+    assert page.encoding == "utf-8"
+    assert page.headers["content-type"] == "text/html"
+    assert "Content-Encoding" not in page.headers
+    assert archive.get("https://x/missing").status_code == 404
+    assert archive.get("https://x/never-fetched") is None
+
+    (warc_path,) = glob.glob(os.path.join(str(tmp_path), "*.warc.gz"))
+    with gzip.open(warc_path, "rb") as f:
+        assert f.read().startswith(b"WARC/1.1\r\nWARC-Type: response\r\n")
+
+
+def test_files_rotate_and_the_latest_record_of_a_url_wins(tmp_path):
+    writer = PageArchiveWriter(str(tmp_path), max_file_bytes=1)
+    for n in range(3):
+        writer.record("https://x/page", 200, {}, f"version {n}".encode())
+    writer.record("https://x/other", 200, {}, b"other")
+    writer.close()
+
+    archive = PageArchive(str(tmp_path))
+
+    assert len(glob.glob(os.path.join(str(tmp_path), "*.warc.gz"))) == 4
+    assert archive.get("https://x/page").content == b"version 2"
+    assert archive.get("https://x/other").content == b"other"
+
+
+def test_a_truncated_index_line_does_not_hide_earlier_pages(tmp_path):
+    writer = PageArchiveWriter(str(tmp_path))
+    writer.record("https://x/page", 200, {}, b"body")
+    writer.close()
+    (index_path,) = glob.glob(os.path.join(str(tmp_path), "*.idx"))
+    with open(index_path, "a", encoding="utf-8") as f:
+        f.write('{"url": "https://x/cut')
+
+    assert PageArchive(str(tmp_path)).get("https://x/page").content == b"body"
+
+
+def test_replaying_an_archive_scrapes_the_same_race_without_network(tmp_path):
+    race_info = ("race/some-classic/2024", RaceType.ONE_DAY)
+    live_session = RecordingSession(
+        {"https://example.com/race/some-classic/2024/result": DummyResp(ONE_DAY_HTML)}
+    )
+    writer = PageArchiveWriter(str(tmp_path))
+    live = ProCyclingStatsRaceDataScraper(
+        base_url="https://example.com",
+        http_client=HttpClient(session=live_session, archive=writer),
+    ).scrape(race_info)
+    writer.close()
+
+    replayed = ProCyclingStatsRaceDataScraper(
+        base_url="https://example.com",
+        http_client=HttpClient(
+            session=ArchiveReplaySession(PageArchive(str(tmp_path))), max_retries=0
+        ),
+    ).scrape(race_info)
+
+    assert replayed == live
+    assert replayed.riders[0].name == "José Niño"
+
+
+def test_replay_answers_unknown_urls_with_not_found(tmp_path):
+    client = HttpClient(
+        session=ArchiveReplaySession(PageArchive(str(tmp_path))), max_retries=0
+    )
+
+    assert client.get("https://x/unknown").status_code == 404
@@ -0,0 +1,108 @@
+import os
+
+from procycling_scraper.scraping.infrastructure.http.http_client import HttpClient
+from procycling_scraper.scraping.infrastructure.http.page_cache import (
+    PageCache,
+    RaceAgeTtlPolicy,
+)
+
+BASE = "https://www.procyclingstats.com"
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class DummyResp:
+    def __init__(self, status_code: int = 200, text: str = "", headers=None):
+        self.content = text.encode("utf-8")
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+
+
+class RecordingSession:
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.requests = []
+
+    def get(self, url, timeout=10, headers=None):
+        self.requests.append((url, headers or {}))
+        return self._responses.pop(0)
+
+
+def test_ttl_policy_treats_past_seasons_as_immutable():
+    policy = RaceAgeTtlPolicy(current_season_ttl=60, current_year=2025)
+
+    assert policy.ttl_for(f"{BASE}/race/tour-de-france/2023/stage-4") is None
+    assert policy.ttl_for(f"{BASE}/races.php?year=2024&circuit=1") is None
+    assert policy.ttl_for(f"{BASE}/race/tour-de-france/2025/gc") == 60
+    assert policy.ttl_for(f"{BASE}/rider/tadej-pogacar") == 60
+
+
+def test_round_trip_and_freshness(tmp_path):
+    clock = Clock()
+    cache = PageCache(
+        str(tmp_path),
+        ttl_policy=RaceAgeTtlPolicy(current_season_ttl=60, current_year=2025),
+        clock=clock,
+    )
+    url = f"{BASE}/race/some-race/2025/result"
+    cache.put(url, b"<html/>", etag='"v1"')
+    clock.now += 120
+
+    page = cache.get(url)
+    assert page is not None
+    assert (page.content, page.etag) == (b"<html/>", '"v1"')
+    assert not cache.is_fresh(page)
+    assert cache.is_fresh(cache.mark_validated(page))
+    assert cache.get(f"{BASE}/race/other/2025/result") is None
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    clock = Clock()
+    cache = PageCache(str(tmp_path), max_bytes=3800, clock=clock)
+    urls = [f"{BASE}/race/r{i}/2020/result" for i in range(3)]
+    for url in urls:
+        clock.now += 1
+        cache.put(url, os.urandom(900))
+    clock.now += 1
+    assert cache.get(urls[0]) is not None
+
+    clock.now += 1
+    cache.put(f"{BASE}/race/r3/2020/result", os.urandom(900))
+
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[1]) is None
+
+
+def test_client_serves_fresh_pages_and_revalidates_stale_ones(tmp_path):
+    clock = Clock()
+    cache = PageCache(
+        str(tmp_path),
+        ttl_policy=RaceAgeTtlPolicy(current_season_ttl=60, current_year=2025),
+        clock=clock,
+    )
+    session = RecordingSession(
+        [
+            DummyResp(200, "results", headers={"ETag": '"abc"'}),
+            DummyResp(304),
+        ]
+    )
+    client = HttpClient(session=session, cache=cache)
+    url = f"{BASE}/race/some-race/2025/result"
+
+    first = client.get(url)
+    cached = client.get(url)
+    clock.now += 120
+    revalidated = client.get(url)
+
+    assert not first.from_cache
+    assert cached.from_cache and cached.text == "results"
+    assert revalidated.from_cache and revalidated.text == "results"
+    assert len(session.requests) == 2
+    assert session.requests[1][1]["If-None-Match"] == '"abc"'
@@ -0,0 +1,109 @@
+import pytest
+
+from procycling_scraper.scraping.infrastructure.http.http_client import HttpClient
+from procycling_scraper.scraping.infrastructure.http.rate_limiter import (
+    AdaptiveRateLimiter,
+)
+
+HOST = "www.procyclingstats.com"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _limiter(clock: FakeClock, **kwargs) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_requests_are_spaced_at_the_current_rate_after_the_burst():
+    clock = FakeClock()
+    limiter = _limiter(clock, initial_rate=2.0, burst=1.0)
+
+    waits = [limiter.acquire(HOST) for _ in range(4)]
+
+    assert waits == [0.0, 0.5, 0.5, 0.5]
+    assert limiter.metrics()[HOST].requests == 4
+    assert limiter.metrics()[HOST].total_wait_s == 1.5
+
+
+def test_rate_halves_on_throttling_and_recovers_additively():
+    clock = FakeClock()
+    limiter = _limiter(clock, initial_rate=4.0, max_rate=4.0, additive_increase=0.5)
+
+    limiter.on_response(HOST, 429, latency=0.1)
+    # A burst of concurrent errors within the cooldown counts once.
+    limiter.on_response(HOST, 503, latency=0.1)
+    assert limiter.metrics()[HOST].rate == 2.0
+    assert limiter.metrics()[HOST].backoffs == 1
+
+    for _ in range(3):
+        limiter.on_response(HOST, 200, latency=0.1)
+    assert 2.0 < limiter.metrics()[HOST].rate < 3.0
+
+    for _ in range(100):
+        limiter.on_response(HOST, 200, latency=0.1)
+    assert limiter.metrics()[HOST].rate == 4.0
+
+
+@pytest.mark.parametrize("status, latency", [(None, 0.1), (200, 10.0)])
+def test_timeouts_and_slow_responses_also_back_off(status, latency):
+    clock = FakeClock()
+    limiter = _limiter(clock, initial_rate=2.0, min_rate=1.5)
+
+    limiter.on_response(HOST, status, latency=latency)
+
+    assert limiter.metrics()[HOST].rate == 1.5
+
+
+def test_processes_sharing_a_state_dir_share_the_budget(tmp_path):
+    clock = FakeClock()
+    first = _limiter(clock, initial_rate=1.0, burst=1.0, state_dir=str(tmp_path))
+    second = _limiter(clock, initial_rate=1.0, burst=1.0, state_dir=str(tmp_path))
+
+    assert first.acquire(HOST) == 0.0
+    assert second.acquire(HOST) == 1.0
+
+    clock.now += 10
+    second.on_response(HOST, 429, latency=0.1)
+    assert first.metrics()[HOST].rate == 0.5
+
+
+class DummyResp:
+    def __init__(self, status_code: int):
+        self.content = b"ok"
+        self.status_code = status_code
+        self.headers = {}
+        self.encoding = "utf-8"
+
+
+class ScriptedSession:
+    def __init__(self, outcomes):
+        self._outcomes = list(outcomes)
+
+    def get(self, url, timeout=10, headers=None):
+        return self._outcomes.pop(0)
+
+
+def test_http_client_feeds_every_attempt_through_the_limiter():
+    clock = FakeClock()
+    limiter = _limiter(clock, initial_rate=2.0)
+    client = HttpClient(
+        session=ScriptedSession([DummyResp(429), DummyResp(200)]),
+        sleep=lambda s: None,
+        rate_limiter=limiter,
+    )
+
+    response = client.get(f"https://{HOST}/race/tour-de-france/2024")
+
+    assert response.status_code == 200
+    metrics = limiter.metrics()[HOST]
+    assert (metrics.requests, metrics.backoffs) == (2, 1)
+    assert metrics.rate > 1.0
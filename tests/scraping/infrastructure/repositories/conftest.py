@@ -0,0 +1,38 @@
+import os
+from typing import Iterator
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+DATABASE_URL = os.environ.get("DATABASE_URL")
+
+
+@pytest.fixture
+def db_engine() -> Iterator[Engine]:
+    """
+    An engine on a throwaway PostgreSQL schema holding the whole schema,
+    dropped after the test. Modules using it skip themselves without
+    ``DATABASE_URL``.
+    """
+    # Imported here: the schema module needs DATABASE_URL at import time.
+    from procycling_scraper.scraping.infrastructure.database.schema import metadata
+
+    assert DATABASE_URL
+    schema = f"repo_test_{uuid4().hex[:12]}"
+    admin = create_engine(DATABASE_URL).execution_options(isolation_level="AUTOCOMMIT")
+    with admin.connect() as admin_conn:
+        admin_conn.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(
+        DATABASE_URL, connect_args={"options": f"-csearch_path={schema},public"}
+    ).execution_options(isolation_level="AUTOCOMMIT")
+    try:
+        # checkfirst would see the tables of public through the search_path.
+        metadata.create_all(engine, checkfirst=False)
+        yield engine
+    finally:
+        engine.dispose()
+        with admin.connect() as admin_conn:
+            admin_conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        admin.dispose()
@@ -0,0 +1,107 @@
+"""
+Checks that the COPY loader stores exactly what the INSERT loader does.
+Skipped unless ``DATABASE_URL`` points at a PostgreSQL database.
+"""
+
+import os
+from typing import List, Tuple
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from procycling_scraper.scraping.domain.entities.classification import (
+    Classification,
+    ClassificationType,
+)
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+from procycling_scraper.scraping.domain.value_objects.result_line import ResultLine
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DATABASE_URL"),
+    reason="needs DATABASE_URL pointing at PostgreSQL",
+)
+
+RIDERS = [Rider(pcs_id=f"rider/r{i}", name=f"Rider {i}") for i in range(6)]
+
+
+def _race(pcs_id: str, stage_points: Tuple[int, ...]) -> Race:
+    race = Race(
+        pcs_id=pcs_id, name="Test Race", year=2024, race_type=RaceType.STAGE_RACE
+    )
+    for stage, points in enumerate(stage_points, start=1):
+        race.add_classification(
+            Classification(
+                ClassificationType.STAGE,
+                [
+                    ResultLine(rider.pcs_id, f"Team {i % 2}", points - i)
+                    for i, rider in enumerate(RIDERS)
+                ]
+                # Not in the riders table: stored by neither loader.
+                + [ResultLine("rider/unknown", "Team 0", 3)],
+                stage,
+            )
+        )
+    race.add_classification(
+        Classification(
+            ClassificationType.GENERAL,
+            [ResultLine(RIDERS[0].pcs_id, "", 50)],
+        )
+    )
+    # A classification without results is still recorded.
+    race.add_classification(Classification(ClassificationType.KOM, []))
+    return race
+
+
+def _stored(engine: Engine, race_pcs_id: str) -> Tuple[List, List]:
+    with engine.connect() as conn:
+        classifications = conn.execute(
+            text(
+                "SELECT c.type, c.stage_number, c.content_hash "
+                "FROM classifications c JOIN races ra ON ra.id = c.race_id "
+                "WHERE ra.pcs_id = :race ORDER BY 1, 2"
+            ),
+            {"race": race_pcs_id},
+        ).fetchall()
+        results = conn.execute(
+            text(
+                "SELECT c.type, c.stage_number, ri.pcs_id, r.team_name, r.points, "
+                "r.year FROM pcs_points_results r "
+                "JOIN classifications c ON c.id = r.classification_id "
+                "JOIN races ra ON ra.id = c.race_id "
+                "JOIN riders ri ON ri.id = r.rider_id "
+                "WHERE ra.pcs_id = :race ORDER BY 1, 2, 3"
+            ),
+            {"race": race_pcs_id},
+        ).fetchall()
+    return [tuple(row) for row in classifications], [tuple(row) for row in results]
+
+
+def test_both_loaders_store_the_same_rows(db_engine: Engine):
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_copy_race_repository import (
+        PostgresCopyRaceRepository,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_race_repository import (
+        PostgresRaceRepository,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
+        PostgresRiderRepository,
+    )
+
+    rider_id_map = PostgresRiderRepository(db_engine).save_many(RIDERS)
+    insert_loader = PostgresRaceRepository(db_engine)
+    copy_loader = PostgresCopyRaceRepository(db_engine)
+
+    insert_loader.save(_race("race/by-insert/2024", (20, 30)), rider_id_map)
+    copy_loader.save(_race("race/by-copy/2024", (20, 30)))
+    first = _stored(db_engine, "race/by-insert/2024")
+    assert first == _stored(db_engine, "race/by-copy/2024")
+    assert len(first[0]) == 4 and len(first[1]) == 2 * len(RIDERS) + 1
+
+    # A changed stage replaces its results in both.
+    insert_loader.save(_race("race/by-insert/2024", (20, 40)), rider_id_map)
+    copy_loader.save(_race("race/by-copy/2024", (20, 40)), rider_id_map)
+    second = _stored(db_engine, "race/by-insert/2024")
+    assert second == _stored(db_engine, "race/by-copy/2024")
+    assert second != first
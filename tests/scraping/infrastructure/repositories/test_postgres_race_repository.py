@@ -0,0 +1,76 @@
+"""
+Checks the classification write statistics of both loaders.
+Skipped unless ``DATABASE_URL`` points at a PostgreSQL database.
+"""
+
+import os
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+
+from procycling_scraper.scraping.domain.entities.classification import (
+    Classification,
+    ClassificationType,
+)
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+from procycling_scraper.scraping.domain.value_objects.result_line import ResultLine
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DATABASE_URL"),
+    reason="needs DATABASE_URL pointing at PostgreSQL",
+)
+
+RIDER = Rider(pcs_id="rider/r0", name="Rider 0")
+
+
+def _race(points: int) -> Race:
+    race = Race(
+        pcs_id="race/test-race/2024",
+        name="Test Race",
+        year=2024,
+        race_type=RaceType.STAGE_RACE,
+    )
+    for stage in (1, 2):
+        race.add_classification(
+            Classification(
+                ClassificationType.STAGE,
+                [ResultLine(RIDER.pcs_id, "Team", points + stage)],
+                stage,
+            )
+        )
+    return race
+
+
+@pytest.mark.parametrize("loader", ["insert", "copy"])
+def test_only_committed_saves_are_counted(db_engine: Engine, loader: str):
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_copy_race_repository import (
+        PostgresCopyRaceRepository,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_race_repository import (
+        ClassificationWriteStats,
+        PostgresRaceRepository,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
+        PostgresRiderRepository,
+    )
+
+    repository_class = (
+        PostgresCopyRaceRepository if loader == "copy" else PostgresRaceRepository
+    )
+    repository = repository_class(db_engine)
+    rider_id_map = PostgresRiderRepository(db_engine).save_many([RIDER])
+
+    repository.save(_race(10), rider_id_map)
+    repository.save(_race(10), rider_id_map)
+    assert repository.write_stats() == ClassificationWriteStats(written=2, skipped=2)
+
+    # A rider missing from the riders table makes the save roll back.
+    with pytest.raises(IntegrityError):
+        repository.save(_race(20), {RIDER.pcs_id: uuid4()})
+    assert repository.write_stats() == ClassificationWriteStats(written=2, skipped=2)
+
+    repository.save(_race(20), rider_id_map)
+    assert repository.write_stats() == ClassificationWriteStats(written=4, skipped=2)
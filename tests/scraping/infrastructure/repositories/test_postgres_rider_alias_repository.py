@@ -0,0 +1,69 @@
+"""
+Checks how manual aliases replace and remove learned ones.
+Skipped unless ``DATABASE_URL`` points at a PostgreSQL database.
+"""
+
+import os
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from procycling_scraper.analysis.domain.rider_alias import AliasSource, RiderAlias
+from procycling_scraper.scraping.domain.entities.rider import Rider
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DATABASE_URL"),
+    reason="needs DATABASE_URL pointing at PostgreSQL",
+)
+
+ADAM = Rider(pcs_id="rider/adam-yates", name="YATES Adam")
+SIMON = Rider(pcs_id="rider/simon-yates", name="YATES Simon")
+
+
+def test_a_manual_alias_for_any_team_replaces_learned_ones(db_engine: Engine):
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_alias_repository import (
+        PostgresRiderAliasRepository,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
+        PostgresRiderRepository,
+    )
+
+    ids = PostgresRiderRepository(db_engine).save_many([ADAM, SIMON])
+    adam, simon = ids[ADAM.pcs_id], ids[SIMON.pcs_id]
+    repository = PostgresRiderAliasRepository(db_engine)
+    repository.save_learned(
+        [
+            RiderAlias("adam yates", "jayco alula", adam, AliasSource.AUTO),
+            RiderAlias("adam yates", "team bikeexchange", adam, AliasSource.AUTO),
+        ]
+    )
+    repository.save(RiderAlias("adam yates", "uae", adam, AliasSource.MANUAL))
+
+    repository.save(RiderAlias("adam yates", "", simon, AliasSource.MANUAL))
+
+    # Manual aliases for a team are kept, learned ones are gone.
+    found = repository.find_riders(["adam yates"])
+    assert {key: rider.id for key, rider in found.items()} == {
+        ("adam yates", ""): simon,
+        ("adam yates", "uae"): adam,
+    }
+
+
+def test_removing_the_alias_for_any_team_removes_learned_ones(db_engine: Engine):
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_alias_repository import (
+        PostgresRiderAliasRepository,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
+        PostgresRiderRepository,
+    )
+
+    adam = PostgresRiderRepository(db_engine).save_many([ADAM])[ADAM.pcs_id]
+    repository = PostgresRiderAliasRepository(db_engine)
+    repository.save_learned(
+        [RiderAlias("adam yates", "jayco alula", adam, AliasSource.AUTO)]
+    )
+    repository.save(RiderAlias("adam yates", "uae", adam, AliasSource.MANUAL))
+
+    assert repository.delete(("adam yates", ""))
+    assert list(repository.find_riders(["adam yates"])) == [("adam yates", "uae")]
+    assert not repository.delete(("adam yates", ""))
@@ -0,0 +1,152 @@
+"""
+Checks the pg_trgm matching backend against the in-process ``thefuzz``
+matcher on a fixture roster. Skipped unless ``DATABASE_URL`` points at a
+PostgreSQL database.
+"""
+
+import os
+from typing import Iterator
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from procycling_scraper.analysis.domain.rider_matching_service import (
+    RiderMatchingService,
+)
+from procycling_scraper.scraping.domain.entities.rider import Rider
+
+DATABASE_URL = os.environ.get("DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL, reason="needs DATABASE_URL pointing at PostgreSQL"
+)
+
+# Names as ProCyclingStats spells them.
+RIDERS = [
+    Rider(pcs_id=f"rider/{slug}", name=name)
+    for slug, name in [
+        ("tadej-pogacar", "POGAČAR Tadej"),
+        ("jonas-vingegaard", "VINGEGAARD Jonas"),
+        ("remco-evenepoel", "EVENEPOEL Remco"),
+        ("primoz-roglic", "ROGLIČ Primož"),
+        ("wout-van-aert", "VAN AERT Wout"),
+        ("mathieu-van-der-poel", "VAN DER POEL Mathieu"),
+        ("adam-yates", "YATES Adam"),
+        ("simon-yates", "YATES Simon"),
+        ("juan-ayuso", "AYUSO Juan"),
+        ("joao-almeida", "ALMEIDA João"),
+        ("enric-mas", "MAS Enric"),
+        ("carlos-rodriguez", "RODRÍGUEZ Carlos"),
+        ("mattias-skjelmose", "SKJELMOSE Mattias"),
+        ("tom-pidcock", "PIDCOCK Thomas"),
+        ("mads-pedersen", "PEDERSEN Mads"),
+        ("jasper-philipsen", "PHILIPSEN Jasper"),
+        ("biniam-girmay", "GIRMAY Biniam"),
+        ("arnaud-de-lie", "DE LIE Arnaud"),
+        ("michal-kwiatkowski", "KWIATKOWSKI Michał"),
+        ("julian-alaphilippe", "ALAPHILIPPE Julian"),
+        ("richard-carapaz", "CARAPAZ Richard"),
+        ("egan-bernal", "BERNAL Egan"),
+        ("marc-hirschi", "HIRSCHI Marc"),
+        ("tim-wellens", "WELLENS Tim"),
+        ("tiesj-benoot", "BENOOT Tiesj"),
+        ("magnus-cort", "CORT Magnus"),
+        ("soren-kragh-andersen", "KRAGH ANDERSEN Søren"),
+        ("alexey-lutsenko", "LUTSENKO Alexey"),
+        ("ben-o-connor", "O'CONNOR Ben"),
+        ("felix-gall", "GALL Felix"),
+    ]
+]
+
+# Spellings found in fantasy price lists, plus names matching nobody.
+NAMES = [
+    "Tadej Pogacar",
+    "Pogačar Tadej",
+    "Jonas Vingegaard Hansen",
+    "Remco Evenepoel",
+    "Primoz Roglic",
+    "Wout van Aert",
+    "Mathieu vd Poel",
+    "Adam Yates",
+    "Simon Yates",
+    "Juan Ayuso Pesquera",
+    "Joao Almeida",
+    "Enric Mas Nicolau",
+    "Carlos Rodriguez Cano",
+    "Mattias Skjelmose Jensen",
+    "Tom Pidcock",
+    "Mads Pedersen",
+    "Jasper Philipsen",
+    "Biniam Girmay Hailu",
+    "Arnaud De Lie",
+    "Michal Kwiatkowski",
+    "Julian Alaphilippe",
+    "Richard Carapaz",
+    "Egan Bernal",
+    "Marc Hirschi",
+    "Tim Wellens",
+    "Tiesj Benoot",
+    "Magnus Cort Nielsen",
+    "Søren Kragh Andersen",
+    "Alexey Lutsenko",
+    "Ben O'Connor",
+    "Felix Gall",
+    "Pogacar",
+    "Evenepoel",
+    "Unknown Rider",
+    "Maximilian Schachmann",
+]
+
+
+@pytest.fixture(scope="module")
+def engine() -> Iterator[Engine]:
+    # Imported here: the schema module needs DATABASE_URL at import time.
+    from procycling_scraper.scraping.infrastructure.database.schema import (
+        metadata,
+        riders_table,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
+        PostgresRiderRepository,
+    )
+
+    schema = f"matcher_test_{uuid4().hex[:12]}"
+    admin = create_engine(DATABASE_URL).execution_options(isolation_level="AUTOCOMMIT")
+    with admin.connect() as admin_conn:
+        admin_conn.execute(text(f"CREATE SCHEMA {schema}"))
+    test_engine = create_engine(
+        DATABASE_URL, connect_args={"options": f"-csearch_path={schema},public"}
+    ).execution_options(isolation_level="AUTOCOMMIT")
+    try:
+        # checkfirst would see the tables of public through the search_path.
+        metadata.create_all(test_engine, tables=[riders_table], checkfirst=False)
+        # Through the repository, which writes riders.name_normalized.
+        PostgresRiderRepository(test_engine).save_many(RIDERS)
+        yield test_engine
+    finally:
+        test_engine.dispose()
+        with admin.connect() as admin_conn:
+            admin_conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        admin.dispose()
+
+
+def test_matches_the_roster_as_the_in_process_matcher_does(engine: Engine):
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_name_matcher import (
+        PostgresRiderNameMatcher,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
+        PostgresRiderRepository,
+    )
+
+    in_process = RiderMatchingService(PostgresRiderRepository(engine).find_all())
+    expected = [
+        (m[0].pcs_id, m[1]) if m else None
+        for m in in_process.find_scored_matches(NAMES)
+    ]
+
+    matches = PostgresRiderNameMatcher(engine).find_scored_matches(NAMES)
+
+    assert [(m[0].pcs_id, m[1]) if m else None for m in matches] == expected
+    assert expected[1] == ("rider/tadej-pogacar", 100)
+    assert expected[-2:] == [None, None]
@@ -0,0 +1,89 @@
+"""
+Checks the scores computed in SQL against ValueScoreCalculator.
+Skipped unless ``DATABASE_URL`` points at a PostgreSQL database.
+"""
+
+import os
+import random
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from procycling_scraper.analysis.domain.value_score_calculator import (
+    ScoreWeights,
+    ValueScoreCalculator,
+)
+from procycling_scraper.scraping.domain.entities.classification import (
+    Classification,
+    ClassificationType,
+)
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+from procycling_scraper.scraping.domain.value_objects.result_line import ResultLine
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DATABASE_URL"),
+    reason="needs DATABASE_URL pointing at PostgreSQL",
+)
+
+CURRENT_YEAR = 2025
+RIDERS = [Rider(pcs_id=f"rider/r{i}", name=f"Rider {i}") for i in range(12)]
+
+
+def test_scores_equal_those_of_the_calculator_up_to_rounding(db_engine: Engine):
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_race_repository import (
+        PostgresRaceRepository,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
+        PostgresRiderRepository,
+    )
+
+    rider_repository = PostgresRiderRepository(db_engine)
+    race_repository = PostgresRaceRepository(db_engine)
+    rider_id_map = rider_repository.save_many(RIDERS)
+    rng = random.Random(5)
+    for n in range(30):
+        race = Race(
+            pcs_id=f"race/race-{n}/{CURRENT_YEAR}",
+            name=f"Race {n}",
+            year=CURRENT_YEAR - n % 6,
+            race_type=rng.choice(list(RaceType)),
+        )
+        # The last rider never scores.
+        race.add_classification(
+            Classification(
+                ClassificationType.GENERAL,
+                [
+                    ResultLine(rider.pcs_id, "Team", rng.randrange(1, 500))
+                    for rider in rng.sample(RIDERS[:-1], 8)
+                ],
+            )
+        )
+        race_repository.save(race, rider_id_map)
+    # Weights without exact binary fractions: weighting season totals
+    # instead of each result shows in the last bits.
+    weights = ScoreWeights(
+        season_weights=(1.0, 0.6, 0.3),
+        older_season_weight=0.07,
+        other_race_type_weight=0.45,
+    )
+    rider_ids = list(rider_id_map.values())
+
+    scores = rider_repository.find_scores_by_rider_ids(
+        rider_ids, RaceType.STAGE_RACE, CURRENT_YEAR, weights
+    )
+
+    calculator = ValueScoreCalculator(weights)
+    results = race_repository.find_all_results_by_rider_ids(rider_ids)
+    assert set(scores) == set(rider_ids)
+    for rider_id, own in results.items():
+        total, _ = calculator.calculate(own, 1, RaceType.STAGE_RACE, CURRENT_YEAR)
+        score = scores[rider_id]
+        assert score.total_weighted_points == pytest.approx(total, rel=1e-12)
+        assert score.one_day_points == sum(
+            r.points for r in own if r.race_type == RaceType.ONE_DAY
+        )
+        assert score.stage_race_points == sum(
+            r.points for r in own if r.race_type == RaceType.STAGE_RACE
+        )
+    assert scores[rider_id_map[RIDERS[-1].pcs_id]].total_weighted_points == 0.0
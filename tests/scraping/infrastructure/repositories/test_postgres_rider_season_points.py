@@ -0,0 +1,160 @@
+"""
+Checks that the rider_season_points rollup kept up to date by both loaders
+matches one rebuilt from the stored results after every kind of save.
+Skipped unless ``DATABASE_URL`` points at a PostgreSQL database.
+"""
+
+import os
+from typing import Dict, List, Sequence, Tuple
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from procycling_scraper.scraping.domain.entities.classification import (
+    Classification,
+    ClassificationType,
+)
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.entities.rider import Rider
+from procycling_scraper.scraping.domain.value_objects.result_line import ResultLine
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DATABASE_URL"),
+    reason="needs DATABASE_URL pointing at PostgreSQL",
+)
+
+RIDERS = [Rider(pcs_id=f"rider/r{i}", name=f"Rider {i}") for i in range(6)]
+
+# Points of every rider, by position in RIDERS, per classification.
+Stages = Dict[Tuple[ClassificationType, int], Sequence[int]]
+
+
+def _race(pcs_id: str, race_type: RaceType, classifications: Stages) -> Race:
+    race = Race(pcs_id=pcs_id, name="Test Race", year=2024, race_type=race_type)
+    for (classification_type, stage), points in classifications.items():
+        race.add_classification(
+            Classification(
+                classification_type,
+                [
+                    ResultLine(rider.pcs_id, "Team", p)
+                    for rider, p in zip(RIDERS, points)
+                ],
+                stage or None,
+            )
+        )
+    return race
+
+
+def _rollup(engine: Engine) -> List[Tuple]:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT rider_id, year, race_type, total_points, result_count "
+                "FROM rider_season_points ORDER BY 1, 2, 3"
+            )
+        ).fetchall()
+    return [tuple(row) for row in rows]
+
+
+def _forget_content_hashes(engine: Engine, race_pcs_id: str) -> None:
+    """Turns the classifications of a race into ones stored before hashes."""
+    with engine.connect() as conn:
+        conn.execute(
+            text(
+                "UPDATE classifications SET content_hash = NULL WHERE race_id = "
+                "(SELECT id FROM races WHERE pcs_id = :race)"
+            ),
+            {"race": race_pcs_id},
+        )
+
+
+def _assert_rollup_matches_rebuild(engine: Engine) -> None:
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_season_points import (
+        PostgresRiderSeasonPoints,
+    )
+
+    maintained = _rollup(engine)
+    PostgresRiderSeasonPoints(engine).rebuild()
+    assert maintained == _rollup(engine)
+
+
+@pytest.mark.parametrize("loader", ["insert", "copy"])
+def test_rollup_matches_a_rebuild_after_every_save(db_engine: Engine, loader: str):
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_copy_race_repository import (
+        PostgresCopyRaceRepository,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_race_repository import (
+        PostgresRaceRepository,
+    )
+    from procycling_scraper.scraping.infrastructure.repositories.postgres_rider_repository import (
+        PostgresRiderRepository,
+    )
+
+    repository_class = (
+        PostgresCopyRaceRepository if loader == "copy" else PostgresRaceRepository
+    )
+    rider_id_map = PostgresRiderRepository(db_engine).save_many(RIDERS)
+    repository = repository_class(db_engine)
+    stage_1, stage_2 = (ClassificationType.STAGE, 1), (ClassificationType.STAGE, 2)
+    gc = (ClassificationType.GENERAL, 0)
+
+    # New races of both types, some riders scoring in both.
+    repository.save(
+        _race(
+            "race/stage-race/2024",
+            RaceType.STAGE_RACE,
+            {stage_1: (20, 15, 10, 5, 2, 1), stage_2: (12, 8, 4)},
+        ),
+        rider_id_map,
+    )
+    repository.save(
+        _race("race/one-day/2024", RaceType.ONE_DAY, {gc: (100, 60, 40)}),
+        rider_id_map,
+    )
+    _assert_rollup_matches_rebuild(db_engine)
+    assert len(_rollup(db_engine)) == len(RIDERS) + 3
+
+    # A changed stage replaces its results.
+    repository.save(
+        _race(
+            "race/stage-race/2024",
+            RaceType.STAGE_RACE,
+            {stage_1: (20, 15, 10, 5, 2, 1), stage_2: (30, 8, 4, 1)},
+        )
+    )
+    _assert_rollup_matches_rebuild(db_engine)
+
+    # A classification stored before content hashes is merged into: the
+    # results already stored hit ON CONFLICT DO NOTHING and are not counted
+    # again, only the new one is.
+    _forget_content_hashes(db_engine, "race/one-day/2024")
+    repository.save(
+        _race(
+            "race/one-day/2024",
+            RaceType.ONE_DAY,
+            {gc: (100, 60, 40, 20)},
+        ),
+        rider_id_map,
+    )
+    _assert_rollup_matches_rebuild(db_engine)
+
+    # A re-parse replaces the results of such a classification instead.
+    _forget_content_hashes(db_engine, "race/one-day/2024")
+    repository_class(db_engine, replace_results=True).save(
+        _race("race/one-day/2024", RaceType.ONE_DAY, {gc: (90, 50)}),
+        rider_id_map,
+    )
+    _assert_rollup_matches_rebuild(db_engine)
+
+    # Riders whose last result of a season is removed lose their row.
+    repository.save(
+        _race(
+            "race/stage-race/2024",
+            RaceType.STAGE_RACE,
+            {stage_1: (20, 15), stage_2: (30, 8)},
+        ),
+        rider_id_map,
+    )
+    _assert_rollup_matches_rebuild(db_engine)
+    assert len(_rollup(db_engine)) == 4
@@ -1,12 +1,28 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from in_memory_rider_repository import InMemoryRiderRepository
+
+from procycling_scraper.scraping.application.race_pipeline import RacePipeline
+from procycling_scraper.scraping.application.scrape_race_use_case import (
+    ScrapeRaceUseCase,
+)
 from procycling_scraper.scraping.domain.entities.classification import (
+    Classification,
     ClassificationType,
 )
-from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.domain.entities.race import Race, RaceType
+from procycling_scraper.scraping.domain.repositories.race_repository import (
+    RaceRepository,
+)
+from procycling_scraper.scraping.infrastructure.http.http_client import HttpClient
 from procycling_scraper.scraping.infrastructure.scrapers.procyclingstats_race_data_scraper import (
     ProCyclingStatsRaceDataScraper,
 )
 
-# We unit-test parsing by monkeypatching network and returning minimal HTML snippets per page
+# We unit-test parsing by injecting a fake HTTP session and returning minimal HTML snippets per page
 
 ONE_DAY_HTML = """
 <html>
@@ -68,21 +84,28 @@ GC_HTML = STAGE_HTML.replace("10", "12")
 
 class DummyResp:
     def __init__(self, text: str, status_code: int = 200):
-        self.text = text
+        self.content = text.encode("utf-8")
         self.status_code = status_code
+        self.headers = {}
+        self.encoding = "utf-8"
 
-    def raise_for_status(self):
-        if self.status_code >= 400:
-            raise Exception("bad status")
 
+class FakeSession:
+    def __init__(self, fake_get):
+        self._fake_get = fake_get
 
-def test_one_day_parsing(monkeypatch):
+    def get(self, url, timeout=10, headers=None):
+        return self._fake_get(url, timeout=timeout)
+
+
+def test_one_day_parsing():
     def fake_get(url, timeout=10):
         return DummyResp(ONE_DAY_HTML)
 
-    monkeypatch.setattr("requests.get", fake_get)
-
-    scraper = ProCyclingStatsRaceDataScraper(base_url="https://example.com")
+    scraper = ProCyclingStatsRaceDataScraper(
+        base_url="https://example.com",
+        http_client=HttpClient(session=FakeSession(fake_get)),
+    )
     data = scraper.scrape(("race/some-classic/2024", RaceType.ONE_DAY))
 
     assert data.race.name.startswith("2024 Some Classic")
@@ -93,7 +116,7 @@ def test_one_day_parsing(monkeypatch):
     assert sum(r.points for r in data.race.classifications[0].results) == 80
 
 
-def test_stage_race_parsing(monkeypatch):
+def test_stage_race_parsing():
     def fake_get(url, timeout=10):
         if url.endswith("/gc"):
             return DummyResp(STAGE_RACE_GC_HTML)
@@ -107,9 +130,10 @@ def test_stage_race_parsing(monkeypatch):
             return DummyResp(GC_HTML)
         return DummyResp(STAGE_HTML)
 
-    monkeypatch.setattr("requests.get", fake_get)
-
-    scraper = ProCyclingStatsRaceDataScraper(base_url="https://example.com")
+    scraper = ProCyclingStatsRaceDataScraper(
+        base_url="https://example.com",
+        http_client=HttpClient(session=FakeSession(fake_get)),
+    )
     data = scraper.scrape(("race/some-stage-race/2024", RaceType.STAGE_RACE))
 
     # Should collect classifications for Stage, Points, KOM, GC
@@ -119,3 +143,138 @@ def test_stage_race_parsing(monkeypatch):
         ClassificationType.KOM,
         ClassificationType.GENERAL,
     }
+
+
+def test_parallel_stage_race_parsing_keeps_deterministic_order():
+    gc_html = STAGE_RACE_GC_HTML.replace(
+        '<option value="race/some-stage-race/2024/stage-1">Stage 1</option>',
+        "".join(
+            f'<option value="race/some-stage-race/2024/stage-{n}">Stage {n}</option>'
+            for n in (3, 1, 2)
+        ),
+    )
+    delays = {"/stage-1": 0.03, "/stage-2": 0.02, "/stage-3": 0.01}
+
+    def fake_get(url, timeout=10):
+        if url.endswith("/gc"):
+            return DummyResp(gc_html)
+        for suffix, delay in delays.items():
+            if url.endswith(suffix):
+                time.sleep(delay)
+        return DummyResp(STAGE_HTML)
+
+    scraper = ProCyclingStatsRaceDataScraper(
+        base_url="https://example.com",
+        max_parallel_pages=4,
+        http_client=HttpClient(session=FakeSession(fake_get)),
+    )
+    data = scraper.scrape(("race/some-stage-race/2024", RaceType.STAGE_RACE))
+
+    assert [
+        (c.classification_type, c.stage_number) for c in data.race.classifications
+    ] == [
+        (ClassificationType.STAGE, 1),
+        (ClassificationType.STAGE, 2),
+        (ClassificationType.STAGE, 3),
+        (ClassificationType.GENERAL, None),
+        (ClassificationType.POINTS, None),
+        (ClassificationType.KOM, None),
+    ]
+
+
+def test_stage_race_skips_known_stages():
+    requested = []
+
+    def fake_get(url, timeout=10):
+        requested.append(url)
+        if url.endswith("/gc"):
+            return DummyResp(STAGE_RACE_GC_HTML)
+        return DummyResp(STAGE_HTML)
+
+    scraper = ProCyclingStatsRaceDataScraper(
+        base_url="https://example.com",
+        http_client=HttpClient(session=FakeSession(fake_get)),
+    )
+    data = scraper.scrape(
+        ("race/some-stage-race/2024", RaceType.STAGE_RACE), known_stages={1}
+    )
+
+    assert not any(url.endswith("/stage-1") for url in requested)
+    assert ClassificationType.STAGE not in {
+        c.classification_type for c in data.race.classifications
+    }
+
+
+def test_parse_process_pool_gives_the_same_race_as_inline_parsing():
+    def fake_get(url, timeout=10):
+        if url.endswith("/gc"):
+            return DummyResp(STAGE_RACE_GC_HTML)
+        return DummyResp(STAGE_HTML)
+
+    def scrape(parse_executor=None):
+        scraper = ProCyclingStatsRaceDataScraper(
+            base_url="https://example.com",
+            max_parallel_pages=2,
+            http_client=HttpClient(session=FakeSession(fake_get)),
+            parse_executor=parse_executor,
+        )
+        return scraper.scrape(("race/some-stage-race/2024", RaceType.STAGE_RACE))
+
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("forkserver")
+    ) as pool:
+        pooled = scrape(pool)
+    inline = scrape()
+
+    assert pooled.race == inline.race
+    assert len(pooled.race.classifications) == 4
+    assert set(pooled.riders) == set(inline.riders)
+
+
+class RecordingRaceRepository(RaceRepository):
+    def __init__(self):
+        self.classifications: Dict[str, List[Classification]] = {}
+
+    def save(self, race: Race, rider_id_map=None) -> None:
+        self.classifications.setdefault(race.pcs_id, []).extend(race.classifications)
+
+    def find_by_pcs_id(self, pcs_id: str):
+        return None
+
+
+def test_stage_race_without_nav_is_stored_alike_by_both_modes():
+    # The entry page lists a results table but no classification nav.
+    no_nav_html = ONE_DAY_HTML.replace("Some Classic", "Some Stage Race")
+
+    def fake_get(url, timeout=10):
+        return DummyResp(no_nav_html)
+
+    def scraper():
+        return ProCyclingStatsRaceDataScraper(
+            base_url="https://example.com",
+            http_client=HttpClient(session=FakeSession(fake_get)),
+        )
+
+    race_info = ("race/some-stage-race/2024", RaceType.STAGE_RACE)
+    serial_races, serial_riders = RecordingRaceRepository(), InMemoryRiderRepository()
+    ScrapeRaceUseCase(scraper(), serial_races, serial_riders).execute(race_info)
+    pipeline_races = RecordingRaceRepository()
+    pipeline_riders = InMemoryRiderRepository()
+    outcomes = {}
+    RacePipeline(scraper(), pipeline_races, pipeline_riders).run(
+        [race_info], lambda info, error: outcomes.__setitem__(info[0], error)
+    )
+
+    assert outcomes == {race_info[0]: None}
+    # The entry page table is not a final GC: storing it would make
+    # --incremental treat the race as complete.
+    assert serial_races.classifications == {race_info[0]: []}
+    assert pipeline_races.classifications == serial_races.classifications
+    assert (
+        set(pipeline_riders.riders)
+        == set(serial_riders.riders)
+        == {
+            "rider/john-doe",
+            "rider/jane-roe",
+        }
+    )
@@ -1,10 +1,14 @@
+import threading
+import time
+
 from procycling_scraper.scraping.domain.entities.race import RaceType
+from procycling_scraper.scraping.infrastructure.http.http_client import HttpClient
 from procycling_scraper.scraping.infrastructure.scrapers.procyclingstats_race_list_scraper import (
     ProCyclingStatsRaceListScraper,
 )
 
 # Note: We test the parsing logic by loading a small, local HTML sample and
-# monkeypatching requests.get
+# injecting a fake HTTP session
 
 SAMPLE_HTML = """
 <html>
@@ -34,22 +38,62 @@ SAMPLE_HTML = """
 
 class DummyResp:
     def __init__(self, text: str, status_code: int = 200):
-        self.text = text
+        self.content = text.encode("utf-8")
         self.status_code = status_code
+        self.headers = {}
+        self.encoding = "utf-8"
+
+
+class FakeSession:
+    def __init__(self, fake_get):
+        self._fake_get = fake_get
 
-    def raise_for_status(self):
-        if self.status_code >= 400:
-            raise Exception("bad status")
+    def get(self, url, timeout=10, headers=None):
+        return self._fake_get(url, timeout=timeout)
 
 
-def test_parse_race_list_from_html(monkeypatch):
+def test_parse_race_list_from_html():
     def fake_get(url, timeout=10):
         return DummyResp(SAMPLE_HTML)
 
-    monkeypatch.setattr("requests.get", fake_get)
-
-    scraper = ProCyclingStatsRaceListScraper(base_url="https://example.com")
+    scraper = ProCyclingStatsRaceListScraper(
+        base_url="https://example.com",
+        http_client=HttpClient(session=FakeSession(fake_get)),
+    )
     items = scraper.scrape(2024)
 
     assert ("race/some-classic/2024", RaceType.ONE_DAY) in items
     assert ("race/some-stage-race/2024", RaceType.STAGE_RACE) in items
+
+
+def test_scrape_many_fetches_every_season_and_circuit_concurrently():
+    lock = threading.Lock()
+    in_flight = [0, 0]
+    urls = []
+
+    def fake_get(url, timeout=10):
+        with lock:
+            urls.append(url)
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        year = url.split("year=")[1].split("&")[0]
+        return DummyResp(SAMPLE_HTML.replace("2024", year))
+
+    scraper = ProCyclingStatsRaceListScraper(
+        base_url="https://example.com",
+        http_client=HttpClient(session=FakeSession(fake_get)),
+        max_parallel_pages=4,
+    )
+    races = scraper.scrape_many([2023, 2024])
+
+    assert len(urls) == 2 * len(ProCyclingStatsRaceListScraper.CIRCUIT_IDS)
+    assert 1 < in_flight[1] <= 4
+    # Every circuit lists the same two races; each is returned once.
+    assert sorted(races[2023]) == [
+        ("race/some-classic/2023", RaceType.ONE_DAY),
+        ("race/some-stage-race/2023", RaceType.STAGE_RACE),
+    ]
+    assert len(races[2024]) == 2
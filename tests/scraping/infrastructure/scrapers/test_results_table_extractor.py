@@ -0,0 +1,143 @@
+from typing import List, Optional
+
+import pytest
+from bs4 import BeautifulSoup, Tag
+
+from procycling_scraper.scraping.infrastructure.scrapers.results_table_extractor import (
+    ResultRow,
+    ResultsTableHeadersError,
+    ResultsTableNotFoundError,
+    extract_result_rows,
+)
+
+
+def _soup_rows(html: str) -> Optional[List[ResultRow]]:
+    """The BeautifulSoup parsing the extractor replaces, as a reference."""
+    table = BeautifulSoup(html, "lxml").select_one(
+        "div.resTab:not(.hide) table.results"
+    )
+    if not isinstance(table, Tag):
+        return None
+    headers = [th.text.strip() for th in table.find("thead").find_all("th")]
+    team = "Team" if "Team" in headers else "Tm"
+    rider_i, team_i = headers.index("Rider"), headers.index(team)
+    points_i = headers.index("Pnt")
+    rows = []
+    for tr in table.find("tbody").find_all("tr"):
+        cells = tr.find_all("td")
+        if len(cells) <= max(rider_i, team_i, points_i):
+            continue
+        points_text = cells[points_i].text.strip()
+        try:
+            points = int(points_text.split()[0] if points_text else "0")
+        except ValueError:
+            continue
+        link = cells[rider_i].find("a")
+        if points <= 0 or link is None or link.get("href") is None:
+            continue
+        rows.append(
+            ResultRow(
+                link["href"], link.text.strip(), cells[team_i].text.strip(), points
+            )
+        )
+    return rows
+
+
+def _page(tabs: str) -> str:
+    return f"""
+<html>
+  <head><script>var rows = "<table class='results'></table>";</script></head>
+  <body>
+    <h1>2024 Tour de France</h1>
+    <ul class="nav"><li><a href="race/tour-de-france/2024/gc">GC</a></li></ul>
+    {tabs}
+    <footer><table class="results"><tr><td>not results</td></tr></table></footer>
+  </body>
+</html>
+"""
+
+
+HIDDEN_TAB = """
+<div class="resTab hide">
+  <table class="results">
+    <thead><tr><th>Rider</th><th>Team</th><th>Pnt</th></tr></thead>
+    <tbody><tr><td><a href="rider/hidden">Hidden</a></td><td>X</td><td>99</td></tr></tbody>
+  </table>
+</div>
+"""
+
+VISIBLE_TAB = """
+<div class="resTab">
+  <div class="wrap">
+    <table class="basic results">
+      <thead>
+        <tr><th>Rnk</th><th>BIB</th><th>Rider</th><th>Age</th><th>Tm</th><th>UCI</th><th>Pnt</th><th>Time</th></tr>
+      </thead>
+      <tbody>
+        <tr><td>1</td><td>11</td><td><span class="flag fr"></span> <a href="rider/tadej-pogacar">POGAČAR Tadej</a></td><td>25</td><td><a href="team/uae">UAE Team Emirates</a></td><td>120</td><td>500 <!-- bonus --></td><td>1:02:03</td></tr>
+        <tr><td>2</td><td>21</td><td><a href="rider/jonas-vingegaard"> VINGEGAARD Jonas <script>track()</script></a></td><td>27</td><td> Visma &amp; Lease<style>.x{}</style> a Bike </td><td>90</td><td>380</td><td>+0:12</td></tr>
+        <tr><td>3</td><td>31</td><td><a href="rider/no-points">Nobody</a></td><td>30</td><td>Team</td><td>0</td><td>0</td><td>+1:00</td></tr>
+        <tr><td>4</td><td>41</td><td>No link</td><td>30</td><td>Team</td><td>0</td><td>15</td><td>+1:00</td></tr>
+        <tr><td>5</td><td>51</td><td><a>No href</a></td><td>30</td><td>Team</td><td>0</td><td>15</td><td>+1:00</td></tr>
+        <tr><td>DNF</td><td>61</td><td><a href="rider/short">Short row</a></td></tr>
+        <tr><td>6</td><td>71</td><td><a href="rider/bad-points">Bad</a></td><td>30</td><td>Team</td><td>0</td><td>n/a</td><td>+1:00</td></tr>
+        <tr><td>7</td><td>81</td><td><a href="rider/empty-points">Empty</a></td><td>30</td><td>Team</td><td>0</td><td> </td><td>+1:00</td></tr>
+      </tbody>
+    </table>
+  </div>
+</div>
+"""
+
+
+def test_extracts_the_visible_table_like_the_soup_parser():
+    html = _page(HIDDEN_TAB + VISIBLE_TAB)
+
+    rows = extract_result_rows(html)
+
+    assert rows == _soup_rows(html)
+    assert rows == [
+        ResultRow("rider/tadej-pogacar", "POGAČAR Tadej", "UAE Team Emirates", 500),
+        ResultRow(
+            "rider/jonas-vingegaard", "VINGEGAARD Jonas", "Visma & Lease a Bike", 380
+        ),
+    ]
+
+
+def test_missing_tbody_yields_no_rows():
+    html = _page(
+        '<div class="resTab"><table class="results"><thead>'
+        "<tr><th>Rider</th><th>Team</th><th>Pnt</th></tr></thead></table></div>"
+    )
+
+    assert extract_result_rows(html) == []
+
+
+@pytest.mark.parametrize(
+    "tabs",
+    [
+        "",
+        HIDDEN_TAB,
+        '<div class="resTab"><table class="basic"><tr><td>x</td></tr></table></div>',
+    ],
+)
+def test_page_without_a_visible_results_table(tabs):
+    html = _page(tabs)
+
+    assert _soup_rows(html) is None
+    with pytest.raises(ResultsTableNotFoundError):
+        extract_result_rows(html)
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        "",
+        "<thead><tr><th>Rider</th><th>Pnt</th></tr></thead>",
+        "<thead><tr><th>Rider</th><th>Team</th></tr></thead>",
+    ],
+)
+def test_missing_result_columns(head):
+    html = _page(f'<div class="resTab"><table class="results">{head}</table></div>')
+
+    with pytest.raises(ResultsTableHeadersError):
+        extract_result_rows(html)